@@ -4,10 +4,23 @@ LocalWhisper - Real-Time Speech-to-Text Desktop Application
 A privacy-focused, local speech recognition application using OpenAI's Whisper model.
 """
 
+import os
+
+# Keep NumPy's BLAS/OpenMP pools single-threaded so small array ops on the audio
+# and UI threads don't spawn workers that compete with the transcription threads.
+# Must run before numpy is first imported.
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+# Let the torch backend's CUDA caching allocator grow segments in place, so
+# reloading a model reuses cached memory instead of fragmenting it.
+# Must run before torch initializes CUDA.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
 __version__ = "1.0.0"
 __author__ = "LocalWhisper Team"
 
-from localwhisper.core.config import Config
-from localwhisper.app import LocalWhisperApp
+from localwhisper.core.config import Config  # noqa: E402 - after the env setup above
+from localwhisper.app import LocalWhisperApp  # noqa: E402
 
 __all__ = ["LocalWhisperApp", "Config", "__version__"]
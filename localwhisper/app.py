@@ -4,8 +4,9 @@ LocalWhisper Application
 Main application class that coordinates all components.
 """
 
+import os
 import sys
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from pathlib import Path
 
@@ -14,7 +15,11 @@ from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
 from localwhisper.core.config import Config
 from localwhisper.core.audio_engine import AudioEngine, AudioEngineError
-from localwhisper.core.transcription_engine import TranscriptionEngine, TranscriptionEngineError
+from localwhisper.core.transcription_engine import (
+    TranscriptionEngine,
+    TranscriptionEngineError,
+    TranscriptionSession,
+)
 from localwhisper.core.hotkey_manager import HotkeyManager
 from localwhisper.core.text_injector import TextInjector
 from localwhisper.core.history_manager import HistoryManager
@@ -25,6 +30,44 @@ from localwhisper.ui.settings_window import SettingsWindow
 from localwhisper.ui.history_window import HistoryWindow
 
 
+class _NullComponent:
+    """
+    No-op stand-in for a component that is not (yet) initialized.
+
+    Any method call is accepted and does nothing, so handlers can call
+    components unconditionally instead of checking for None on every event.
+    """
+
+    def __getattr__(self, name: str):
+        return _null_method
+
+    def __bool__(self) -> bool:
+        return False
+
+
+def _null_method(*args, **kwargs) -> None:
+    """Accept any call and do nothing."""
+    return None
+
+
+def _init_transcription_worker() -> None:
+    """
+    Keep the transcription worker off CPU 0, which is left for audio capture.
+
+    Threads the inference runtime spawns from this worker inherit the
+    affinity. Only supported where the OS exposes per-thread affinity (Linux).
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    cpus = os.sched_getaffinity(0) - {0}
+    if not cpus:
+        return  # Only CPU 0 is available
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError:
+        pass  # Keep the inherited affinity
+
+
 class LocalWhisperApp(QObject):
     """
     Main application controller.
@@ -32,8 +75,10 @@ class LocalWhisperApp(QObject):
     Coordinates all components: audio capture, transcription, UI, and text injection.
     """
 
+    # Interval for polling the audio engine amplitude (~30Hz, the waveform animates in between)
+    AMPLITUDE_POLL_MS = 33
+
     # Internal signals for thread-safe UI updates
-    _amplitude_signal = pyqtSignal(float)
     _transcription_complete = pyqtSignal(str)
     _transcription_error = pyqtSignal(str)
     _recording_started = pyqtSignal()
@@ -49,22 +94,38 @@ class LocalWhisperApp(QObject):
         self._audio_engine: Optional[AudioEngine] = None
         self._transcription_engine: Optional[TranscriptionEngine] = None
         self._hotkey_manager: Optional[HotkeyManager] = None
-        self._text_injector: Optional[TextInjector] = None
         self._history_manager: Optional[HistoryManager] = None
-        self._audio_feedback: Optional[AudioFeedback] = None
+
+        # Components called from the hot UI handlers start as null objects
+        # and are replaced in initialize()
+        self._text_injector: TextInjector = _NullComponent()
+        self._audio_feedback: AudioFeedback = _NullComponent()
 
         # UI components
-        self._waveform_overlay: Optional[WaveformOverlay] = None
-        self._tray_icon: Optional[TrayIcon] = None
+        self._waveform_overlay: WaveformOverlay = _NullComponent()
+        self._tray_icon: TrayIcon = _NullComponent()
         self._settings_window: Optional[SettingsWindow] = None
         self._history_window: Optional[HistoryWindow] = None
 
+        # Single worker for model loading and transcription: reuses one thread and
+        # serializes access to the model, which is not safe for concurrent use
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="whisper",
+            initializer=_init_transcription_worker,
+        )
+
         # State
         self._is_recording = False
         self._is_processing = False
+        self._session: Optional[TranscriptionSession] = None
+
+        # Amplitude is pulled from the audio engine at display rate
+        self._amplitude_timer = QTimer(self)
+        self._amplitude_timer.setInterval(self.AMPLITUDE_POLL_MS)
+        self._amplitude_timer.timeout.connect(self._on_amplitude_update)
 
         # Connect internal signals
-        self._amplitude_signal.connect(self._on_amplitude_update)
         self._transcription_complete.connect(self._on_transcription_complete)
         self._transcription_error.connect(self._on_transcription_error)
         self._recording_started.connect(self._on_recording_started)
@@ -81,9 +142,9 @@ class LocalWhisperApp(QObject):
             # Initialize core components
             self._audio_engine = AudioEngine(self._config.audio)
             self._audio_engine.initialize()
-            self._audio_engine.set_amplitude_callback(self._on_amplitude)
 
             self._transcription_engine = TranscriptionEngine(self._config.transcription)
+            self._transcription_engine.set_speech_detector(self._audio_engine.voiced_ratio)
 
             self._hotkey_manager = HotkeyManager(
                 hotkey=self._config.hotkey.activation_key,
@@ -145,43 +206,52 @@ class LocalWhisperApp(QObject):
 
     def _preload_model(self) -> None:
         """Pre-load the transcription model in background."""
+
         def load_thread():
             try:
                 self._transcription_engine.load_model()
+                self._transcription_engine.warm_up()
             except TranscriptionEngineError as e:
                 # Will be loaded on first use
                 print(f"Model pre-load skipped: {e}")
 
-        threading.Thread(target=load_thread, daemon=True).start()
+        self._executor.submit(load_thread)
 
-    def _on_amplitude(self, amplitude: float) -> None:
-        """Handle amplitude update from audio engine (called from audio thread)."""
-        self._amplitude_signal.emit(amplitude)
-
-    def _on_amplitude_update(self, amplitude: float) -> None:
-        """Handle amplitude update in main thread."""
-        if self._waveform_overlay and self._waveform_overlay.isVisible():
-            self._waveform_overlay.add_amplitude(amplitude)
+    def _on_amplitude_update(self) -> None:
+        """Poll the audio engine amplitude in main thread."""
+        # The timer only runs while the audio engine is recording
+        if self._waveform_overlay.isVisible():
+            self._waveform_overlay.add_amplitude(self._audio_engine.take_peak_amplitude())
 
     def _on_recording_started(self) -> None:
         """Handle recording start in main thread."""
         self._is_recording = True
 
         # Play start sound
-        if self._audio_feedback:
-            self._audio_feedback.play_start()
+        self._audio_feedback.play_start()
 
         # Show waveform overlay
-        if self._waveform_overlay:
-            self._waveform_overlay.show_overlay()
+        self._waveform_overlay.show_overlay()
 
         # Update tray icon
-        if self._tray_icon:
-            self._tray_icon.set_state(TrayState.RECORDING)
+        self._tray_icon.set_state(TrayState.RECORDING)
 
-        # Start audio capture
+        # Start audio capture, transcribing windows while the user is still speaking
         if self._audio_engine:
+            self._session = TranscriptionSession(self._transcription_engine)
+            self._audio_engine.set_audio_callback(self._on_audio_chunk)
             self._audio_engine.start_recording()
+            self._amplitude_timer.start()
+
+    def _on_audio_chunk(self, audio_chunk) -> None:
+        """Feed captured audio to the session (called from audio thread)."""
+        session = self._session
+        if session is None:
+            return
+
+        window = session.feed(audio_chunk)
+        if window is not None:
+            self._executor.submit(session.transcribe_window, window)
 
     def _on_recording_stopped(self) -> None:
         """Handle recording stop in main thread."""
@@ -192,62 +262,64 @@ class LocalWhisperApp(QObject):
         self._is_processing = True
 
         # Play stop sound
-        if self._audio_feedback:
-            self._audio_feedback.play_stop()
+        self._audio_feedback.play_stop()
 
         # Update UI to processing state
-        if self._waveform_overlay:
-            self._waveform_overlay.set_processing()
+        self._waveform_overlay.set_processing()
 
-        if self._tray_icon:
-            self._tray_icon.set_state(TrayState.PROCESSING)
+        self._tray_icon.set_state(TrayState.PROCESSING)
 
         # Stop audio capture and get audio
+        self._amplitude_timer.stop()
         audio = self._audio_engine.stop_recording() if self._audio_engine else None
-
-        if audio is None or len(audio) < 1600:  # Less than 100ms
+        session, self._session = self._session, None
+
+        # Skip captures that are too short (<100ms) or contain no speech,
+        # which would otherwise cost a full encoder pass and invite hallucinations
+        if (
+            audio is None
+            or len(audio) < 1600
+            or self._audio_engine.voiced_ratio(audio) < self._config.audio.min_voiced_ratio
+        ):
+            # Drop windows still queued on the worker for the rejected capture
+            if session is not None:
+                session.cancel()
             self._is_processing = False
-            if self._waveform_overlay:
-                self._waveform_overlay.hide_overlay()
-            if self._tray_icon:
-                self._tray_icon.set_state(TrayState.IDLE)
+            self._waveform_overlay.hide_overlay()
+            self._tray_icon.set_state(TrayState.IDLE)
             return
 
-        # Transcribe in background
+        # Transcribe the remaining tail in background, after any queued windows
         def transcribe_thread():
             try:
-                result = self._transcription_engine.transcribe(audio)
-                self._transcription_complete.emit(result.text)
+                self._transcription_complete.emit(session.finish())
             except Exception as e:
                 self._transcription_error.emit(str(e))
 
-        threading.Thread(target=transcribe_thread, daemon=True).start()
+        self._executor.submit(transcribe_thread)
 
     def _on_transcription_complete(self, text: str) -> None:
         """Handle successful transcription in main thread."""
         self._is_processing = False
 
         # Show success in overlay
-        if self._waveform_overlay:
-            self._waveform_overlay.show_success()
+        self._waveform_overlay.show_success()
 
         # Update tray icon
-        if self._tray_icon:
-            self._tray_icon.set_state(TrayState.IDLE)
+        self._tray_icon.set_state(TrayState.IDLE)
 
         if not text.strip():
             return
 
         # Inject the transcribed text (uses clipboard paste for smooth output)
-        if self._text_injector:
-            # Small delay to let the overlay hide and focus return to original app
-            QTimer.singleShot(150, lambda: self._text_injector.inject_text(text))
+        # Small delay to let the overlay hide and focus return to original app
+        QTimer.singleShot(150, lambda: self._text_injector.inject_text_async(text))
 
         # Save to history
         if self._history_manager and self._transcription_engine:
             self._history_manager.add_entry(
                 text=text,
-                duration=len(self._audio_engine.get_current_audio()) / 16000 if self._audio_engine else 0,
+                duration=self._audio_engine.samples_captured / 16000 if self._audio_engine else 0,
                 confidence=0.9,  # Approximate
                 language=self._config.transcription.language,
                 model=self._config.transcription.model_name,
@@ -258,27 +330,24 @@ class LocalWhisperApp(QObject):
         self._is_processing = False
 
         # Play error sound
-        if self._audio_feedback:
-            self._audio_feedback.play_error()
+        self._audio_feedback.play_error()
 
         # Show error in overlay
-        if self._waveform_overlay:
-            self._waveform_overlay.show_error(f"Transcription failed: {error}")
+        self._waveform_overlay.show_error(f"Transcription failed: {error}")
 
         # Update tray icon
-        if self._tray_icon:
-            self._tray_icon.set_state(TrayState.ERROR)
-            self._tray_icon.show_error(f"Transcription failed: {error}")
+        self._tray_icon.set_state(TrayState.ERROR)
+        self._tray_icon.show_error(f"Transcription failed: {error}")
 
-            # Reset to idle after delay
-            QTimer.singleShot(3000, lambda: self._tray_icon.set_state(TrayState.IDLE))
+        # Reset to idle after delay
+        QTimer.singleShot(3000, lambda: self._tray_icon.set_state(TrayState.IDLE))
 
     def _toggle_recording(self) -> None:
         """Toggle recording state - called when hotkey is pressed."""
         if self._is_processing:
             # Don't toggle during processing
             return
-        
+
         if self._is_recording:
             # Stop recording
             self._recording_stopped.emit()
@@ -312,26 +381,18 @@ class LocalWhisperApp(QObject):
         self._history_window.raise_()
         self._history_window.activateWindow()
 
-    def _on_settings_changed(self) -> None:
+    def _on_settings_changed(self, config: Config) -> None:
         """Handle settings change."""
-        # Reload config
-        self._config = Config.load()
+        # Use the in-memory config the settings window just saved
+        self._config = config
 
         # Update components
         if self._audio_engine:
             self._audio_engine.settings = self._config.audio
 
-        if self._audio_feedback:
-            self._audio_feedback.settings = self._config.feedback
+        self._audio_feedback.settings = self._config.feedback
 
-        if self._waveform_overlay:
-            self._waveform_overlay.set_accent_color(self._config.ui.accent_color)
-            self._waveform_overlay.set_background_color(self._config.ui.waveform_background_color)
-            self._waveform_overlay.set_background_alpha(self._config.ui.waveform_background_alpha)
-            self._waveform_overlay.set_line_thickness(self._config.ui.waveform_line_thickness)
-            self._waveform_overlay.set_sensitivity(self._config.ui.waveform_sensitivity)
-            self._waveform_overlay.set_width(self._config.ui.waveform_width)
-            self._waveform_overlay.set_always_on_top(self._config.ui.waveform_always_on_top)
+        self._waveform_overlay.apply_ui_settings(self._config.ui)
 
     def _on_hotkey_changed(self, new_hotkey: str) -> None:
         """Handle hotkey change."""
@@ -350,6 +411,7 @@ class LocalWhisperApp(QObject):
             self._hotkey_manager.stop()
 
         # Stop any ongoing recording
+        self._amplitude_timer.stop()
         if self._is_recording and self._audio_engine:
             self._audio_engine.stop_recording()
 
@@ -357,21 +419,26 @@ class LocalWhisperApp(QObject):
         if self._audio_engine:
             self._audio_engine.shutdown()
 
+        # Drop queued work and wait for a transcription already running, so the
+        # model and history aren't torn down underneath it
+        session, self._session = self._session, None
+        if session is not None:
+            session.cancel()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
         if self._transcription_engine:
             self._transcription_engine.unload_model()
 
         if self._history_manager:
             self._history_manager.shutdown()
 
-        if self._audio_feedback:
-            self._audio_feedback.shutdown()
+        self._audio_feedback.shutdown()
+        self._text_injector.shutdown()
 
         # Hide UI
-        if self._waveform_overlay:
-            self._waveform_overlay.hide()
+        self._waveform_overlay.hide()
 
-        if self._tray_icon:
-            self._tray_icon.hide()
+        self._tray_icon.hide()
 
     def run(self) -> int:
         """
@@ -7,30 +7,43 @@ Handles real-time audio capture from the microphone with minimal latency.
 import threading
 import queue
 import time
-from typing import Optional, Callable, List, Tuple
+from typing import Optional, Callable, Dict, List, Tuple
 from dataclasses import dataclass
-from collections import deque
 
 import numpy as np
 
 try:
     import sounddevice as sd
+
     HAS_SOUNDDEVICE = True
 except ImportError:
     HAS_SOUNDDEVICE = False
 
 try:
     import pyaudio
+
     HAS_PYAUDIO = True
 except ImportError:
     HAS_PYAUDIO = False
 
+try:
+    import webrtcvad
+
+    HAS_WEBRTCVAD = True
+except ImportError:
+    HAS_WEBRTCVAD = False
+
 from localwhisper.core.config import AudioSettings
+from localwhisper.core.resampler import PolyphaseResampler
+
+# Whisper models expect 16kHz audio; captured audio is converted to this rate
+WHISPER_SAMPLE_RATE = 16000
 
 
 @dataclass
 class AudioDevice:
     """Represents an audio input device."""
+
     index: int
     name: str
     channels: int
@@ -40,16 +53,19 @@ class AudioDevice:
 
 class AudioEngineError(Exception):
     """Base exception for audio engine errors."""
+
     pass
 
 
 class MicrophoneNotFoundError(AudioEngineError):
     """Raised when no microphone is available."""
+
     pass
 
 
 class AudioCaptureError(AudioEngineError):
     """Raised when audio capture fails."""
+
     pass
 
 
@@ -58,11 +74,16 @@ class AudioEngine:
     Real-time audio capture engine.
 
     Captures audio from the system microphone and provides:
-    - Real-time amplitude data for visualization
+    - Real-time amplitude data for visualization (polled via take_peak_amplitude)
     - Audio buffer for transcription
+    - Speech gating to skip transcribing silent captures
     - Device enumeration and selection
     """
 
+    # Voice activity detection frame length and energy fallback threshold
+    VAD_FRAME_SECONDS = 0.03
+    VAD_RMS_THRESHOLD = 0.02  # ~-34 dBFS
+
     def __init__(self, settings: Optional[AudioSettings] = None):
         """
         Initialize the audio engine.
@@ -70,15 +91,21 @@ class AudioEngine:
         Args:
             settings: Audio configuration settings
         """
+        # Resolved device indices keyed by (backend, device name)
+        self._device_idx_cache: Dict[Tuple[str, str], Optional[int]] = {}
         self.settings = settings or AudioSettings()
 
         # State
         self._is_recording = False
         self._is_initialized = False
 
-        # Audio data
-        self._audio_buffer: deque = deque(maxlen=int(30 * self.settings.sample_rate))  # 30 sec max
-        self._amplitude_callback: Optional[Callable[[float], None]] = None
+        # Audio data (preallocated ring buffer, 30 sec max at Whisper's sample rate)
+        self._ring = np.empty(30 * WHISPER_SAMPLE_RATE, dtype=np.float32)
+        self._write = 0  # Next write position in the ring
+        self._filled = 0  # Number of valid samples in the ring
+        self._samples_captured = 0  # Total samples captured by the current recording
+        self._scratch = np.empty(self.settings.chunk_size, dtype=np.float32)  # Amplitude workspace
+        self._peak_amplitude = 0.0  # Running max since the UI last polled
         self._audio_callback: Optional[Callable[[np.ndarray], None]] = None
 
         # Threading
@@ -88,10 +115,27 @@ class AudioEngine:
         # Backend selection
         self._backend = self._select_backend()
 
+        # Converts device-rate audio to 16kHz (None when the device already runs at 16kHz)
+        self._resampler: Optional[PolyphaseResampler] = None
+
         # PyAudio specific
         self._pyaudio: Optional["pyaudio.PyAudio"] = None
         self._stream = None
 
+        # Voice activity detector (energy gate is used when webrtcvad is unavailable)
+        self._vad = webrtcvad.Vad(2) if HAS_WEBRTCVAD else None
+
+    @property
+    def settings(self) -> AudioSettings:
+        """Get the audio settings."""
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: AudioSettings) -> None:
+        """Replace the audio settings and drop any cached device lookups."""
+        self._settings = settings
+        self._device_idx_cache.clear()
+
     def _select_backend(self) -> str:
         """Select the best available audio backend."""
         if HAS_SOUNDDEVICE:
@@ -142,13 +186,15 @@ class AudioEngine:
 
             for i, dev in enumerate(device_list):
                 if dev["max_input_channels"] > 0:
-                    devices.append(AudioDevice(
-                        index=i,
-                        name=dev["name"],
-                        channels=dev["max_input_channels"],
-                        sample_rate=int(dev["default_samplerate"]),
-                        is_default=(i == default_input),
-                    ))
+                    devices.append(
+                        AudioDevice(
+                            index=i,
+                            name=dev["name"],
+                            channels=dev["max_input_channels"],
+                            sample_rate=int(dev["default_samplerate"]),
+                            is_default=(i == default_input),
+                        )
+                    )
 
         elif self._backend == "pyaudio":
             if not self._pyaudio:
@@ -159,13 +205,15 @@ class AudioEngine:
             for i in range(self._pyaudio.get_device_count()):
                 dev = self._pyaudio.get_device_info_by_index(i)
                 if dev["maxInputChannels"] > 0:
-                    devices.append(AudioDevice(
-                        index=i,
-                        name=dev["name"],
-                        channels=dev["maxInputChannels"],
-                        sample_rate=int(dev["defaultSampleRate"]),
-                        is_default=(i == default_input),
-                    ))
+                    devices.append(
+                        AudioDevice(
+                            index=i,
+                            name=dev["name"],
+                            channels=dev["maxInputChannels"],
+                            sample_rate=int(dev["defaultSampleRate"]),
+                            is_default=(i == default_input),
+                        )
+                    )
 
         return devices
 
@@ -177,21 +225,46 @@ class AudioEngine:
                 return device
         return devices[0] if devices else None
 
-    def set_amplitude_callback(self, callback: Callable[[float], None]) -> None:
+    def voiced_ratio(self, audio: np.ndarray) -> float:
         """
-        Set callback for real-time amplitude updates.
+        Estimate the fraction of 30 ms frames that contain speech.
+
+        Uses WebRTC VAD when installed, otherwise a per-frame RMS energy gate.
 
         Args:
-            callback: Function called with amplitude value (0.0 to 1.0)
+            audio: Captured audio (float32, mono, 16kHz)
+
+        Returns:
+            Ratio of voiced frames (0.0 to 1.0)
         """
-        self._amplitude_callback = callback
+        sample_rate = WHISPER_SAMPLE_RATE
+        frame = int(sample_rate * self.VAD_FRAME_SECONDS)
+        n_frames = len(audio) // frame
+        if n_frames == 0:
+            return 0.0
+
+        frames = audio[: n_frames * frame].reshape(n_frames, frame)
+
+        if self._vad is not None:
+            pcm = (np.clip(frames, -1.0, 1.0) * 32767).astype(np.int16)
+            # Slice frames out of one byte view instead of serializing each frame
+            data = memoryview(pcm).cast("B")
+            frame_bytes = frame * pcm.itemsize
+            voiced = sum(
+                self._vad.is_speech(data[i : i + frame_bytes], sample_rate)
+                for i in range(0, len(data), frame_bytes)
+            )
+            return voiced / n_frames
+
+        rms = np.sqrt(np.mean(np.square(frames), axis=1))
+        return float(np.count_nonzero(rms > self.VAD_RMS_THRESHOLD)) / n_frames
 
-    def set_audio_callback(self, callback: Callable[[np.ndarray], None]) -> None:
+    def set_audio_callback(self, callback: Optional[Callable[[np.ndarray], None]]) -> None:
         """
         Set callback for audio chunk updates.
 
         Args:
-            callback: Function called with audio data as numpy array
+            callback: Function called with audio data as numpy array, or None to clear
         """
         self._audio_callback = callback
 
@@ -203,8 +276,17 @@ class AudioEngine:
         if not self._is_initialized:
             self.initialize()
 
-        self._audio_buffer.clear()
+        self._write = 0
+        self._filled = 0
+        self._samples_captured = 0
+        self._peak_amplitude = 0.0
         self._stop_event.clear()
+
+        # Resample in the capture path only when the device rate differs from Whisper's
+        if self.settings.sample_rate != WHISPER_SAMPLE_RATE:
+            self._resampler = PolyphaseResampler(self.settings.sample_rate, WHISPER_SAMPLE_RATE)
+        else:
+            self._resampler = None
         self._is_recording = True
 
         if self._backend == "sounddevice":
@@ -212,40 +294,56 @@ class AudioEngine:
         else:
             self._start_pyaudio_recording()
 
-    def _start_sounddevice_recording(self) -> None:
-        """Start recording using sounddevice backend."""
-        device_idx = None
-        if self.settings.input_device:
-            devices = self.list_devices()
-            for dev in devices:
-                if dev.name == self.settings.input_device:
+    def _resolve_device_index(self) -> Optional[int]:
+        """
+        Resolve the configured input device name to a backend device index.
+
+        Device enumeration is slow, so the result is cached until the
+        settings are replaced.
+
+        Returns:
+            Device index, or None to use the system default
+        """
+        name = self.settings.input_device
+        if not name:
+            return None
+
+        key = (self._backend, name)
+        if key not in self._device_idx_cache:
+            device_idx = None
+            for dev in self.list_devices():
+                if dev.name == name:
                     device_idx = dev.index
                     break
+            self._device_idx_cache[key] = device_idx
+
+        return self._device_idx_cache[key]
+
+    def _start_sounddevice_recording(self) -> None:
+        """Start recording using sounddevice backend."""
+        device_idx = self._resolve_device_index()
 
         def audio_callback(indata, frames, time_info, status):
             if status:
                 print(f"Audio status: {status}")
 
-            # Convert to float32 and mono if needed
-            audio_data = indata[:, 0] if indata.ndim > 1 else indata.flatten()
-            audio_data = audio_data.astype(np.float32)
+            # Take a mono view; the stream is opened as float32 so no conversion is needed
+            audio_data = indata[:, 0] if indata.ndim > 1 else indata
 
-            # Apply gain
-            audio_data = audio_data * self.settings.gain
+            # Convert to 16kHz if the device runs at another rate
+            if self._resampler is not None:
+                audio_data = self._resampler.process(audio_data)
 
-            # Add to buffer
-            self._audio_buffer.extend(audio_data)
+            # Apply gain, add to buffer and measure amplitude in one pass
+            amplitude = self._ingest(audio_data)
 
-            # Calculate amplitude for visualization
-            if self._amplitude_callback:
-                amplitude = np.abs(audio_data).mean()
-                # Normalize to 0-1 range (assuming audio is already normalized)
-                amplitude = min(1.0, amplitude * 3)  # Scale up for better visualization
-                self._amplitude_callback(amplitude)
+            # Hold the peak until the UI polls it
+            if amplitude > self._peak_amplitude:
+                self._peak_amplitude = amplitude
 
             # Call audio callback
             if self._audio_callback:
-                self._audio_callback(audio_data)
+                self._audio_callback(self._read_ring(len(audio_data)))
 
         self._stream = sd.InputStream(
             device=device_idx,
@@ -259,46 +357,43 @@ class AudioEngine:
 
     def _start_pyaudio_recording(self) -> None:
         """Start recording using PyAudio backend."""
-        device_idx = None
-        if self.settings.input_device:
-            devices = self.list_devices()
-            for dev in devices:
-                if dev.name == self.settings.input_device:
-                    device_idx = dev.index
-                    break
+        device_idx = self._resolve_device_index()
+        chunk_size = self.settings.chunk_size
+        channels = self.settings.channels
 
         def record_thread():
             stream = self._pyaudio.open(
                 format=pyaudio.paFloat32,
-                channels=self.settings.channels,
+                channels=channels,
                 rate=self.settings.sample_rate,
                 input=True,
                 input_device_index=device_idx,
-                frames_per_buffer=self.settings.chunk_size,
+                frames_per_buffer=chunk_size,
             )
             self._stream = stream
 
             try:
                 while not self._stop_event.is_set():
                     try:
-                        data = stream.read(self.settings.chunk_size, exception_on_overflow=False)
-                        audio_data = np.frombuffer(data, dtype=np.float32)
+                        data = stream.read(chunk_size, exception_on_overflow=False)
+                        # Zero-copy view of the first channel of the interleaved frames;
+                        # _ingest applies gain while copying it into the ring buffer
+                        audio_data = np.frombuffer(data, dtype=np.float32)[::channels]
 
-                        # Apply gain
-                        audio_data = audio_data * self.settings.gain
+                        # Convert to 16kHz if the device runs at another rate
+                        if self._resampler is not None:
+                            audio_data = self._resampler.process(audio_data)
 
-                        # Add to buffer
-                        self._audio_buffer.extend(audio_data)
+                        # Apply gain, add to buffer and measure amplitude in one pass
+                        amplitude = self._ingest(audio_data)
 
-                        # Calculate amplitude
-                        if self._amplitude_callback:
-                            amplitude = np.abs(audio_data).mean()
-                            amplitude = min(1.0, amplitude * 3)
-                            self._amplitude_callback(amplitude)
+                        # Hold the peak until the UI polls it
+                        if amplitude > self._peak_amplitude:
+                            self._peak_amplitude = amplitude
 
                         # Call audio callback
                         if self._audio_callback:
-                            self._audio_callback(audio_data)
+                            self._audio_callback(self._read_ring(len(audio_data)))
 
                     except Exception as e:
                         if not self._stop_event.is_set():
@@ -316,7 +411,7 @@ class AudioEngine:
         Stop recording and return the captured audio.
 
         Returns:
-            Numpy array of captured audio samples (float32, 16kHz, mono)
+            C-contiguous numpy array of captured audio samples (float32, 16kHz, mono)
         """
         if not self._is_recording:
             return np.array([], dtype=np.float32)
@@ -334,12 +429,86 @@ class AudioEngine:
                 self._record_thread.join(timeout=1.0)
                 self._record_thread = None
 
+        # Emit the samples the resampler held back for its filter delay
+        if self._resampler is not None:
+            self._ingest(self._resampler.flush())
+
         # Get audio from buffer
-        audio = np.array(list(self._audio_buffer), dtype=np.float32)
-        self._audio_buffer.clear()
+        audio = self._read_ring(self._filled)
+        self._write = 0
+        self._filled = 0
 
         return audio
 
+    def _ingest(self, audio_data: np.ndarray) -> float:
+        """
+        Apply gain and copy a chunk into the ring buffer in a single pass.
+
+        The gained samples are written straight into the ring and the amplitude
+        is accumulated from the freshly written slices, so no intermediate
+        arrays are allocated per chunk.
+
+        Args:
+            audio_data: Mono audio chunk from the capture backend
+
+        Returns:
+            Amplitude of the chunk normalized to the 0-1 range
+        """
+        ring = self._ring
+        capacity = len(ring)
+        n = len(audio_data)
+        if n == 0:
+            return 0.0
+
+        self._samples_captured += n
+
+        if n >= capacity:
+            # Chunk larger than the ring: keep only its tail
+            audio_data = audio_data[-capacity:]
+            n = capacity
+            self._write = 0
+
+        if n > len(self._scratch):
+            self._scratch = np.empty(n, dtype=np.float32)
+
+        end = self._write + n
+        if end <= capacity:
+            segments = ((ring[self._write : end], audio_data),)
+        else:
+            split = capacity - self._write
+            segments = (
+                (ring[self._write :], audio_data[:split]),
+                (ring[: end - capacity], audio_data[split:]),
+            )
+
+        gain = self.settings.gain
+        sum_abs = 0.0
+        for dst, src in segments:
+            np.multiply(src, gain, out=dst)
+            sum_abs += float(np.abs(dst, out=self._scratch[: len(dst)]).sum())
+
+        self._write = end % capacity
+        self._filled = min(capacity, self._filled + n)
+
+        # Scale up for better visualization
+        return min(1.0, sum_abs / n * 3)
+
+    def _read_ring(self, samples: int) -> np.ndarray:
+        """
+        Return a copy of the most recent samples from the ring buffer.
+
+        The result is always a C-contiguous float32 array, the layout the
+        transcription backends consume without further copying.
+        """
+        ring = self._ring
+        write = self._write
+        samples = min(samples, self._filled)
+        start = write - samples
+
+        if start >= 0:
+            return ring[start:write].copy()
+        return np.concatenate((ring[start:], ring[:write]))
+
     def get_current_audio(self) -> np.ndarray:
         """
         Get the current audio buffer without stopping recording.
@@ -347,7 +516,7 @@ class AudioEngine:
         Returns:
             Copy of the current audio buffer
         """
-        return np.array(list(self._audio_buffer), dtype=np.float32)
+        return self._read_ring(self._filled)
 
     def get_recent_audio(self, seconds: float = 0.5) -> np.ndarray:
         """
@@ -359,21 +528,37 @@ class AudioEngine:
         Returns:
             Numpy array of recent audio samples
         """
-        samples = int(seconds * self.settings.sample_rate)
-        buffer_list = list(self._audio_buffer)
-        if len(buffer_list) < samples:
-            return np.array(buffer_list, dtype=np.float32)
-        return np.array(buffer_list[-samples:], dtype=np.float32)
+        samples = int(seconds * WHISPER_SAMPLE_RATE)
+        return self._read_ring(samples)
 
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
         return self._is_recording
 
+    def take_peak_amplitude(self) -> float:
+        """
+        Get the peak amplitude since the last call and reset it.
+
+        Meant to be polled at the UI refresh rate: chunks arriving between
+        polls are decimated into their running max, so short peaks still show.
+
+        Returns:
+            Peak amplitude (0.0 to 1.0)
+        """
+        peak = self._peak_amplitude
+        self._peak_amplitude = 0.0
+        return peak
+
+    @property
+    def samples_captured(self) -> int:
+        """Get the number of samples captured by the current or last recording."""
+        return self._samples_captured
+
     @property
     def buffer_duration(self) -> float:
         """Get the duration of audio in the buffer in seconds."""
-        return len(self._audio_buffer) / self.settings.sample_rate
+        return self._filled / WHISPER_SAMPLE_RATE
 
     def __enter__(self):
         """Context manager entry."""
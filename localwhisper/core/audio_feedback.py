@@ -5,15 +5,87 @@ Handles playing audio cues for recording start/stop events.
 """
 
 import threading
-import platform
+import queue
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-import math
-import struct
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    import sounddevice as sd
+
+    HAS_SOUNDDEVICE = True
+except ImportError:
+    HAS_SOUNDDEVICE = False
+
+try:
+    import pyaudio
+
+    HAS_PYAUDIO = True
+except ImportError:
+    HAS_PYAUDIO = False
+
+try:
+    import winsound  # Windows only
+
+    HAS_WINSOUND = True
+except ImportError:
+    HAS_WINSOUND = False
 
 from localwhisper.core.config import FeedbackSettings, get_data_dir
 
 
+@lru_cache(maxsize=32)
+def _synthesize_tone(
+    frequency: float,
+    duration: float,
+    sample_rate: int,
+    fade_seconds: float,
+    volume: float,
+) -> np.ndarray:
+    """
+    Synthesize a faded sine tone as 16-bit samples.
+
+    A pure function of its arguments, so results are memoized; the returned
+    array is shared between callers and therefore read-only.
+
+    The sine and the fade envelope are each computed in one whole-buffer pass,
+    reusing the sample index buffer for the envelope, so the only allocations
+    are two float32 buffers and the int16 result.
+
+    Args:
+        frequency: Tone frequency in Hz
+        duration: Duration in seconds
+        sample_rate: Sample rate
+        fade_seconds: Length of the linear fade in/out (0 for none)
+        volume: Peak amplitude as a fraction of full scale
+
+    Returns:
+        Audio samples as int16
+    """
+    num_samples = int(sample_rate * duration)
+    index = np.arange(num_samples, dtype=np.float32)
+
+    # Sine wave
+    samples = index * np.float32(2 * np.pi * frequency / sample_rate)
+    np.sin(samples, out=samples)
+
+    # Trapezoid envelope min(i, n - i, fade) / fade: ramps over the first and
+    # last fade samples and is flat in between, with no branching or slicing.
+    # A fade of 1 is indistinguishable from none since sin(0) is already 0.
+    fade_samples = max(1, min(int(sample_rate * fade_seconds), num_samples // 2))
+    envelope = np.minimum(index, num_samples - index, out=index)
+    np.minimum(envelope, fade_samples, out=envelope)
+    samples *= envelope
+
+    # Volume (with the envelope normalization folded in), then convert to 16-bit
+    samples *= np.float32(volume * 32767 / fade_samples)
+    result = samples.astype(np.int16)
+    result.flags.writeable = False
+    return result
+
+
 class AudioFeedback:
     """
     Audio feedback player for UI events.
@@ -22,6 +94,13 @@ class AudioFeedback:
     Uses a simple synthesized sound if no custom sounds are available.
     """
 
+    # Pending sounds beyond this are dropped rather than played late
+    MAX_QUEUED_SOUNDS = 4
+
+    # Playback rate for synthesized sounds; the tones are all well below its
+    # Nyquist frequency, and it is a rate every output device supports
+    SAMPLE_RATE = 22050
+
     def __init__(self, settings: Optional[FeedbackSettings] = None):
         """
         Initialize audio feedback.
@@ -29,250 +108,281 @@ class AudioFeedback:
         Args:
             settings: Feedback configuration settings
         """
+        self._enabled = True
         self.settings = settings or FeedbackSettings()
         self._player = None
 
+        # Synthesized sounds keyed by (name, volume); they never change otherwise.
+        # PyAudio only accepts bytes, so its sounds are stored already serialized.
+        self._tone_cache: Dict[Tuple[str, float], Union[np.ndarray, bytes]] = {}
+
         # Try to set up audio playback
         self._setup_player()
 
+        # Synthesize sounds up front so playback never waits on it
+        self._prepare_sounds()
+
+        # A single worker plays queued sounds so callers never block on playback
+        self._queue: queue.Queue = queue.Queue(maxsize=self.MAX_QUEUED_SOUNDS)
+        self._worker: Optional[threading.Thread] = None
+        if self._backend is not None:
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    @property
+    def settings(self) -> FeedbackSettings:
+        """Get the feedback settings."""
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: FeedbackSettings) -> None:
+        """Replace the feedback settings."""
+        self._settings = settings
+        # Plain attribute mirror of sound_enabled, checked on every play
+        self._enabled = settings.sound_enabled
+
     def _setup_player(self) -> None:
         """Set up the audio player backend."""
         # Try different audio backends
-        try:
-            import sounddevice as sd
+        if HAS_SOUNDDEVICE:
             self._backend = "sounddevice"
-            return
-        except ImportError:
-            pass
-
-        try:
-            import pyaudio
+        elif HAS_PYAUDIO:
             self._backend = "pyaudio"
             self._pyaudio = pyaudio.PyAudio()
-            return
-        except ImportError:
-            pass
-
-        # Windows fallback using built-in winsound
-        if platform.system() == "Windows":
             try:
-                import winsound
-                self._backend = "winsound"
-                return
-            except ImportError:
-                pass
-
-        self._backend = None
+                # Keep one output stream open; opening a PortAudio stream per
+                # sound costs more than the sound itself
+                self._pa_stream = self._pyaudio.open(
+                    format=pyaudio.paInt16,
+                    channels=1,
+                    rate=self.SAMPLE_RATE,
+                    output=True,
+                )
+            except Exception as e:
+                print(f"Audio feedback unavailable: {e}")
+                self._pyaudio.terminate()
+                self._backend = None
+        elif HAS_WINSOUND:
+            # Windows fallback using built-in winsound
+            self._backend = "winsound"
+        else:
+            self._backend = None
 
     def _generate_tone(
         self,
         frequency: float,
         duration: float,
-        sample_rate: int = 44100,
+        sample_rate: Optional[int] = None,
         fade: bool = True,
-    ) -> bytes:
+    ) -> np.ndarray:
         """
         Generate a simple sine wave tone.
 
         Args:
             frequency: Tone frequency in Hz
             duration: Duration in seconds
-            sample_rate: Sample rate
+            sample_rate: Sample rate (default SAMPLE_RATE)
             fade: Whether to apply fade in/out
 
         Returns:
-            Audio data as bytes
+            Audio samples as int16
         """
-        num_samples = int(sample_rate * duration)
-        samples = []
-
-        for i in range(num_samples):
-            t = i / sample_rate
-
-            # Sine wave
-            sample = math.sin(2 * math.pi * frequency * t)
-
-            # Apply envelope (fade in/out)
-            if fade:
-                fade_samples = int(sample_rate * 0.01)  # 10ms fade
-                if i < fade_samples:
-                    sample *= i / fade_samples
-                elif i > num_samples - fade_samples:
-                    sample *= (num_samples - i) / fade_samples
-
-            # Volume
-            sample *= self.settings.sound_volume * 0.3  # Keep it subtle
-
-            # Convert to 16-bit
-            samples.append(int(sample * 32767))
+        return _synthesize_tone(
+            frequency,
+            duration,
+            sample_rate or self.SAMPLE_RATE,
+            fade_seconds=0.01 if fade else 0.0,  # 10ms fade
+            volume=self.settings.sound_volume * 0.3,  # Keep it subtle
+        )
+
+    def _generate_two_tone(
+        self, first_frequency: float, second_frequency: float, duration: float = 0.05
+    ) -> np.ndarray:
+        """
+        Generate two back-to-back tones, each with its own fade in/out.
 
-        return struct.pack(f"{len(samples)}h", *samples)
+        Args:
+            first_frequency: Frequency of the first tone in Hz
+            second_frequency: Frequency of the second tone in Hz
+            duration: Duration of each tone in seconds
 
-    def _generate_start_sound(self) -> bytes:
+        Returns:
+            Audio samples as int16
+        """
+        return np.concatenate(
+            (
+                self._generate_tone(first_frequency, duration),
+                self._generate_tone(second_frequency, duration),
+            )
+        )
+
+    def _generate_start_sound(self) -> np.ndarray:
         """Generate the recording start sound (ascending tone)."""
-        sample_rate = 44100
-        samples = []
-
-        # Two-tone ascending
-        for freq, duration in [(440, 0.05), (550, 0.05)]:
-            num_samples = int(sample_rate * duration)
-            for i in range(num_samples):
-                t = i / sample_rate
-                sample = math.sin(2 * math.pi * freq * t)
+        return self._generate_two_tone(440, 550)
 
-                # Fade
-                fade_samples = int(sample_rate * 0.01)
-                if i < fade_samples:
-                    sample *= i / fade_samples
-                elif i > num_samples - fade_samples:
-                    sample *= (num_samples - i) / fade_samples
-
-                sample *= self.settings.sound_volume * 0.3
-                samples.append(int(sample * 32767))
+    def _generate_stop_sound(self) -> np.ndarray:
+        """Generate the recording stop sound (descending tone)."""
+        return self._generate_two_tone(550, 440)
 
-        return struct.pack(f"{len(samples)}h", *samples)
+    def _generate_error_sound(self) -> np.ndarray:
+        """Generate the error sound (low tone)."""
+        return self._generate_tone(220, 0.15)
 
-    def _generate_stop_sound(self) -> bytes:
-        """Generate the recording stop sound (descending tone)."""
-        sample_rate = 44100
-        samples = []
+    def _generate_success_sound(self) -> np.ndarray:
+        """Generate the success sound (higher, pleasant tone)."""
+        return self._generate_tone(660, 0.1)
 
-        # Two-tone descending
-        for freq, duration in [(550, 0.05), (440, 0.05)]:
-            num_samples = int(sample_rate * duration)
-            for i in range(num_samples):
-                t = i / sample_rate
-                sample = math.sin(2 * math.pi * freq * t)
+    def _prepare_sounds(self) -> None:
+        """Synthesize all feedback sounds at the current volume."""
+        if self._backend not in ("sounddevice", "pyaudio"):
+            return  # winsound only beeps; nothing to synthesize
 
-                # Fade
-                fade_samples = int(sample_rate * 0.01)
-                if i < fade_samples:
-                    sample *= i / fade_samples
-                elif i > num_samples - fade_samples:
-                    sample *= (num_samples - i) / fade_samples
+        self._get_sound("start", self._generate_start_sound)
+        self._get_sound("stop", self._generate_stop_sound)
+        self._get_sound("error", self._generate_error_sound)
+        self._get_sound("success", self._generate_success_sound)
 
-                sample *= self.settings.sound_volume * 0.3
-                samples.append(int(sample * 32767))
+    def _get_sound(self, name: str, generate: Callable[[], np.ndarray]) -> Union[np.ndarray, bytes]:
+        """
+        Get a synthesized sound, generating it on first use at the current volume.
 
-        return struct.pack(f"{len(samples)}h", *samples)
+        Args:
+            name: Cache name of the sound
+            generate: Function that synthesizes the sound
 
-    def _play_audio(self, audio_data: bytes, frequency: int = 440, duration_ms: int = 100) -> None:
+        Returns:
+            Audio samples as int16, as raw bytes for the PyAudio backend
+        """
+        key = (name, self.settings.sound_volume)
+        audio = self._tone_cache.get(key)
+        if audio is None:
+            audio = generate()
+            if self._backend == "pyaudio":
+                audio = audio.tobytes()
+            self._tone_cache[key] = audio
+        return audio
+
+    def _play_audio(
+        self,
+        name: str,
+        generate: Callable[[], np.ndarray],
+        frequency: int = 440,
+        duration_ms: int = 100,
+    ) -> None:
         """
-        Play audio data.
+        Play a feedback sound.
 
         Args:
-            audio_data: Raw audio bytes (16-bit, 44100Hz, mono)
+            name: Cache name of the sound
+            generate: Function that synthesizes the sound (int16, SAMPLE_RATE, mono)
             frequency: Frequency for winsound fallback
             duration_ms: Duration in ms for winsound fallback
         """
-        if not self.settings.sound_enabled:
-            return
-
-        if self._backend == "sounddevice":
-            self._play_sounddevice(audio_data)
+        if self._backend == "winsound":
+            # winsound plays a beep, so the sound is never synthesized
+            self._enqueue(self._play_winsound, frequency, duration_ms)
+        elif self._backend == "sounddevice":
+            self._enqueue(self._play_sounddevice, self._get_sound(name, generate))
         elif self._backend == "pyaudio":
-            self._play_pyaudio(audio_data)
-        elif self._backend == "winsound":
-            self._play_winsound(frequency, duration_ms)
+            self._enqueue(self._play_pyaudio, self._get_sound(name, generate))
 
-    def _play_sounddevice(self, audio_data: bytes) -> None:
-        """Play using sounddevice."""
-        import sounddevice as sd
-        import numpy as np
+    def _enqueue(self, play: Callable[..., None], *args: Any) -> None:
+        """Queue a sound for the playback worker, dropping it if the queue is full."""
+        try:
+            self._queue.put_nowait((play, args))
+        except queue.Full:
+            pass
 
-        # Convert bytes to numpy array
-        samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32767.0
+    def _run(self) -> None:
+        """Playback worker loop."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
 
-        # Play non-blocking
-        def play_thread():
+            if not self._enabled:
+                continue  # Disabled while queued
+
+            play, args = item
             try:
-                sd.play(samples, samplerate=44100)
-                sd.wait()
+                play(*args)
             except Exception as e:
                 print(f"Audio playback error: {e}")
 
-        threading.Thread(target=play_thread, daemon=True).start()
+    def _play_sounddevice(self, audio_data: np.ndarray) -> None:
+        """Play using sounddevice (blocks until done)."""
+        # sounddevice plays int16 samples as-is
+        sd.play(audio_data, samplerate=self.SAMPLE_RATE)
+        sd.wait()
 
     def _play_pyaudio(self, audio_data: bytes) -> None:
-        """Play using PyAudio."""
-        import pyaudio
-
-        def play_thread():
-            try:
-                stream = self._pyaudio.open(
-                    format=pyaudio.paInt16,
-                    channels=1,
-                    rate=44100,
-                    output=True,
-                )
-                stream.write(audio_data)
-                stream.stop_stream()
-                stream.close()
-            except Exception as e:
-                print(f"Audio playback error: {e}")
-
-        threading.Thread(target=play_thread, daemon=True).start()
+        """Play using PyAudio (blocks until done)."""
+        self._pa_stream.write(audio_data)
 
     def _play_winsound(self, frequency: int, duration_ms: int) -> None:
-        """Play using Windows winsound (built-in, no dependencies)."""
-        import winsound
-
-        def play_thread():
-            try:
-                # Apply volume by adjusting duration (winsound doesn't support volume)
-                adjusted_duration = int(duration_ms * self.settings.sound_volume)
-                if adjusted_duration > 0:
-                    winsound.Beep(frequency, adjusted_duration)
-            except Exception as e:
-                print(f"Audio playback error: {e}")
-
-        threading.Thread(target=play_thread, daemon=True).start()
+        """Play using Windows winsound (built-in, no dependencies; blocks until done)."""
+        # Apply volume by adjusting duration (winsound doesn't support volume)
+        adjusted_duration = int(duration_ms * self.settings.sound_volume)
+        if adjusted_duration > 0:
+            winsound.Beep(frequency, adjusted_duration)
 
     def play_start(self) -> None:
         """Play the recording start sound."""
-        if not self.settings.sound_enabled:
+        if not self._enabled:
             return
 
-        audio = self._generate_start_sound()
         # Ascending tone: 550Hz for winsound fallback
-        self._play_audio(audio, frequency=550, duration_ms=100)
+        self._play_audio("start", self._generate_start_sound, frequency=550, duration_ms=100)
 
     def play_stop(self) -> None:
         """Play the recording stop sound."""
-        if not self.settings.sound_enabled:
+        if not self._enabled:
             return
 
-        audio = self._generate_stop_sound()
         # Descending tone: 440Hz for winsound fallback
-        self._play_audio(audio, frequency=440, duration_ms=100)
+        self._play_audio("stop", self._generate_stop_sound, frequency=440, duration_ms=100)
 
     def play_error(self) -> None:
         """Play an error sound."""
-        if not self.settings.sound_enabled:
+        if not self._enabled:
             return
 
         # Lower tone for error
-        audio = self._generate_tone(220, 0.15)
-        self._play_audio(audio, frequency=220, duration_ms=150)
+        self._play_audio("error", self._generate_error_sound, frequency=220, duration_ms=150)
 
     def play_success(self) -> None:
         """Play a success sound."""
-        if not self.settings.sound_enabled:
+        if not self._enabled:
             return
 
         # Higher, pleasant tone for success
-        audio = self._generate_tone(660, 0.1)
-        self._play_audio(audio, frequency=660, duration_ms=100)
+        self._play_audio("success", self._generate_success_sound, frequency=660, duration_ms=100)
 
     def set_enabled(self, enabled: bool) -> None:
         """Enable or disable sound feedback."""
         self.settings.sound_enabled = enabled
+        self._enabled = enabled
 
     def set_volume(self, volume: float) -> None:
         """Set the sound volume (0.0 to 1.0)."""
         self.settings.sound_volume = max(0.0, min(1.0, volume))
+        self._tone_cache.clear()
+        self._prepare_sounds()
 
     def shutdown(self) -> None:
         """Clean up resources."""
+        if self._worker is not None:
+            # Unblock the worker with a sentinel, discarding sounds still queued
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._queue.put(None)
+            self._worker.join(timeout=1.0)
+            self._worker = None
+
         if self._backend == "pyaudio" and hasattr(self, "_pyaudio"):
+            self._pa_stream.stop_stream()
+            self._pa_stream.close()
             self._pyaudio.terminate()
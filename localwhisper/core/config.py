@@ -4,14 +4,25 @@ Configuration Manager for LocalWhisper
 Handles all application settings with persistence to JSON files.
 """
 
+import hashlib
 import json
 import os
 import platform
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
 
+try:
+    import orjson
 
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+@lru_cache(maxsize=None)
 def get_config_dir() -> Path:
     """Get platform-appropriate configuration directory."""
     system = platform.system()
@@ -25,6 +36,7 @@ def get_config_dir() -> Path:
         return Path(xdg_config) / "localwhisper"
 
 
+@lru_cache(maxsize=None)
 def get_data_dir() -> Path:
     """Get platform-appropriate data directory."""
     system = platform.system()
@@ -38,6 +50,7 @@ def get_data_dir() -> Path:
         return Path(xdg_data) / "localwhisper"
 
 
+@lru_cache(maxsize=None)
 def get_cache_dir() -> Path:
     """Get platform-appropriate cache directory for models."""
     system = platform.system()
@@ -51,38 +64,85 @@ def get_cache_dir() -> Path:
         return Path(xdg_cache) / "localwhisper" / "models"
 
 
-@dataclass
+def _dumps(data: dict) -> bytes:
+    """Serialize config data to indented JSON, using orjson when installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _parse_config_file(path: Path, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a config file.
+
+    Cached on the file's modification time and size, so repeated loads of an
+    unchanged file skip the read and JSON parse. The returned dict is shared
+    and must not be mutated.
+    """
+    if HAS_ORJSON:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Get the field names of a settings dataclass (introspected once per class)."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _settings_to_dict(settings) -> dict:
+    """
+    Convert a flat settings dataclass to a dict.
+
+    Unlike ``dataclasses.asdict`` this doesn't recurse or deep-copy, which
+    the settings classes don't need since all their fields are primitives.
+    """
+    return {name: getattr(settings, name) for name in _field_names(type(settings))}
+
+
+@dataclass(slots=True)
 class AudioSettings:
     """Audio capture settings."""
+
     sample_rate: int = 16000  # Whisper native sample rate
     channels: int = 1  # Mono
     chunk_size: int = 1600  # 100ms at 16kHz
     input_device: Optional[str] = None  # None = system default
     gain: float = 1.0  # Gain multiplier
     noise_reduction: bool = True
+    min_voiced_ratio: float = 0.15  # Skip transcription below this voiced-frame ratio (0 = off)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionSettings:
     """Transcription engine settings."""
+
     model_name: str = "turbo"  # tiny, base, small, medium, large-v3, turbo
     language: str = "en"
-    compute_type: str = "auto"  # auto, float16, int8, float32
+    backend: str = "faster-whisper"  # faster-whisper (CTranslate2), openai (PyTorch fallback)
+    compute_type: str = "auto"  # auto, int8, int8_float16, float16, bfloat16, float32
     device: str = "auto"  # auto, cuda, cpu
     beam_size: int = 5
+    batch_size: int = 1  # >1 decodes VAD-split chunks in batches (faster-whisper >= 1.1)
+    cpu_threads: int = 0  # CPU inference threads, 0 = all cores but one
     vad_enabled: bool = True
     vad_threshold: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class HotkeySettings:
     """Hotkey configuration."""
+
     activation_key: str = "ctrl+alt+r"  # Default hotkey (toggle mode)
 
 
-@dataclass
+@dataclass(slots=True)
 class UISettings:
     """User interface settings."""
+
     theme: str = "dark"  # dark, light, auto
     accent_color: str = "#3B82F6"  # Blue
     waveform_height: int = 60
@@ -92,14 +152,17 @@ class UISettings:
     animation_fps: int = 60
     waveform_always_on_top: bool = True  # Keep waveform overlay always on top
     waveform_background_color: str = "#131313"  # Dark background for waveform
-    waveform_background_alpha: int = 255  # Background transparency (0=fully transparent, 255=opaque)
+    waveform_background_alpha: int = (
+        255  # Background transparency (0=fully transparent, 255=opaque)
+    )
     waveform_line_thickness: int = 2  # Thickness of the waveform line (1-10)
     waveform_sensitivity: float = 2.5  # Sensitivity of oscillation (0.5-5.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class FeedbackSettings:
     """Audio and visual feedback settings."""
+
     sound_enabled: bool = True
     sound_volume: float = 0.5  # 0.0 to 1.0
     start_sound: str = "start.wav"
@@ -107,18 +170,21 @@ class FeedbackSettings:
     visual_feedback: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class HistorySettings:
     """Transcription history settings."""
+
     enabled: bool = True
     retention_days: int = 30
     encrypt_storage: bool = False
     max_entries: int = 10000
+    durable_writes: bool = False  # fsync every commit (synchronous=FULL) instead of at checkpoints
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneralSettings:
     """General application settings."""
+
     launch_at_startup: bool = False
     start_minimized: bool = True
     check_updates: bool = True
@@ -128,6 +194,7 @@ class GeneralSettings:
 @dataclass
 class Config:
     """Main configuration class containing all settings."""
+
     general: GeneralSettings = field(default_factory=GeneralSettings)
     audio: AudioSettings = field(default_factory=AudioSettings)
     transcription: TranscriptionSettings = field(default_factory=TranscriptionSettings)
@@ -137,6 +204,10 @@ class Config:
     history: HistorySettings = field(default_factory=HistorySettings)
 
     _config_path: Path = field(default_factory=lambda: get_config_dir() / "config.json", repr=False)
+    # (path, digest) of the contents last read from or written to disk
+    _saved_state: Optional[Tuple[Path, bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Ensure config directory exists."""
@@ -149,8 +220,8 @@ class Config:
 
         if path.exists():
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                stat = path.stat()
+                data = _parse_config_file(path, stat.st_mtime_ns, stat.st_size)
 
                 config = cls(
                     general=GeneralSettings(**data.get("general", {})),
@@ -162,10 +233,11 @@ class Config:
                     history=HistorySettings(**data.get("history", {})),
                 )
                 config._config_path = path
-                
+                config._saved_state = (path, hashlib.sha1(config._serialize()).digest())
+
                 # Validate hotkey - reset to default if invalid
                 config._validate_hotkey()
-                
+
                 return config
             except (json.JSONDecodeError, TypeError, KeyError) as e:
                 # Config file corrupted, return default
@@ -175,34 +247,55 @@ class Config:
         config = cls()
         config._config_path = path
         return config
-    
+
     def _validate_hotkey(self) -> None:
         """Validate hotkey and reset to default if invalid."""
         from localwhisper.core.hotkey_manager import validate_hotkey
-        
+
         error = validate_hotkey(self.hotkey.activation_key)
         if error:
-            print(f"Warning: Invalid hotkey '{self.hotkey.activation_key}' in config, resetting to default")
+            print(
+                f"Warning: Invalid hotkey '{self.hotkey.activation_key}' in config, "
+                "resetting to default"
+            )
             default_hotkey = HotkeySettings()
             self.hotkey.activation_key = default_hotkey.activation_key
             self.save()  # Save the corrected config
 
-    def save(self) -> None:
-        """Save configuration to file."""
-        self._config_path.parent.mkdir(parents=True, exist_ok=True)
-
+    def _serialize(self) -> bytes:
+        """Serialize all settings to the JSON file format."""
         data = {
-            "general": asdict(self.general),
-            "audio": asdict(self.audio),
-            "transcription": asdict(self.transcription),
-            "hotkey": asdict(self.hotkey),
-            "ui": asdict(self.ui),
-            "feedback": asdict(self.feedback),
-            "history": asdict(self.history),
+            "general": _settings_to_dict(self.general),
+            "audio": _settings_to_dict(self.audio),
+            "transcription": _settings_to_dict(self.transcription),
+            "hotkey": _settings_to_dict(self.hotkey),
+            "ui": _settings_to_dict(self.ui),
+            "feedback": _settings_to_dict(self.feedback),
+            "history": _settings_to_dict(self.history),
         }
+        return _dumps(data)
 
-        with open(self._config_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+    def save(self) -> None:
+        """
+        Save configuration to file.
+
+        Skips the write when nothing changed since the last load or save. The
+        file is replaced atomically, so a crash mid-write cannot corrupt it.
+        """
+        path = self._config_path
+        blob = self._serialize()
+        state = (path, hashlib.sha1(blob).digest())
+        if state == self._saved_state and path.exists():
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, path)
+        self._saved_state = state
+
+        # The file may be rewritten within the filesystem's mtime granularity
+        _parse_config_file.cache_clear()
 
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults."""
@@ -226,6 +319,7 @@ class Config:
         return get_data_dir() / "history.db"
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_sounds_dir() -> Path:
         """Get the directory containing sound files."""
         # First check package resources, then user data dir
@@ -235,42 +329,23 @@ class Config:
         return get_data_dir() / "sounds"
 
 
-# Available Whisper models with their properties
-AVAILABLE_MODELS = {
-    "tiny.en": {
-        "size_mb": 75,
-        "vram_gb": 1,
-        "relative_speed": 32,
-        "english_only": True,
-    },
-    "base.en": {
-        "size_mb": 145,
-        "vram_gb": 1,
-        "relative_speed": 16,
-        "english_only": True,
-    },
-    "small.en": {
-        "size_mb": 488,
-        "vram_gb": 2,
-        "relative_speed": 6,
-        "english_only": True,
-    },
-    "medium.en": {
-        "size_mb": 1530,
-        "vram_gb": 5,
-        "relative_speed": 2,
-        "english_only": True,
-    },
-    "turbo": {
-        "size_mb": 1600,
-        "vram_gb": 6,
-        "relative_speed": 8,
-        "english_only": False,
-    },
-    "large-v3": {
-        "size_mb": 3100,
-        "vram_gb": 10,
-        "relative_speed": 1,
-        "english_only": False,
-    },
-}
+class ModelInfo(NamedTuple):
+    """Properties of a Whisper model."""
+
+    size_mb: int  # Download size
+    vram_gb: int  # Approximate VRAM needed on GPU
+    relative_speed: int  # Speed relative to large-v3
+    english_only: bool
+
+
+# Available Whisper models with their properties (read-only)
+AVAILABLE_MODELS: Mapping[str, ModelInfo] = MappingProxyType(
+    {
+        "tiny.en": ModelInfo(size_mb=75, vram_gb=1, relative_speed=32, english_only=True),
+        "base.en": ModelInfo(size_mb=145, vram_gb=1, relative_speed=16, english_only=True),
+        "small.en": ModelInfo(size_mb=488, vram_gb=2, relative_speed=6, english_only=True),
+        "medium.en": ModelInfo(size_mb=1530, vram_gb=5, relative_speed=2, english_only=True),
+        "turbo": ModelInfo(size_mb=1600, vram_gb=6, relative_speed=8, english_only=False),
+        "large-v3": ModelInfo(size_mb=3100, vram_gb=10, relative_speed=1, english_only=False),
+    }
+)
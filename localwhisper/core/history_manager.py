@@ -7,18 +7,127 @@ Supports full-text search and automatic cleanup of old entries.
 
 import sqlite3
 import json
+import queue
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Tuple
-from dataclasses import dataclass, asdict
+from typing import Iterable, Iterator, Optional, List, Tuple
+from dataclasses import dataclass, asdict, replace
 from contextlib import contextmanager
 
 from localwhisper.core.config import HistorySettings, get_data_dir
 
+try:
+    import orjson
 
-@dataclass
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Bumped whenever the on-disk layout changes; stored in PRAGMA user_version
+SCHEMA_VERSION = 3
+
+# Read-only connections kept open for queries; WAL lets them run alongside the writer
+READ_POOL_SIZE = 4
+
+# Statement text is the key of the connection's prepared-statement cache,
+# so every query is issued from one constant string.
+_INSERT_SQL = """
+    INSERT INTO history (text, timestamp, duration, confidence, language, model)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_BY_ID_SQL = "SELECT * FROM history WHERE id = ?"
+
+# Page through the timestamp index alone (it covers the rowid), then fetch
+# only the rows on this page instead of every skipped one.
+_SELECT_RECENT_SQL = """
+    SELECT history.* FROM (
+        SELECT id FROM history
+        ORDER BY timestamp DESC, id DESC
+        LIMIT ? OFFSET ?
+    ) AS page
+    JOIN history ON history.id = page.id
+    ORDER BY history.timestamp DESC, history.id DESC
+"""
+
+# Rank and limit the FTS hits on their own first; mixing MATCH with the join
+# in one WHERE can make the planner abandon the FTS5 index.
+_SEARCH_SQL = """
+    WITH fts AS (
+        SELECT rowid, rank FROM history_fts
+        WHERE history_fts MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    )
+    SELECT history.*
+    FROM fts
+    JOIN history ON history.id = fts.rowid
+    ORDER BY fts.rank
+"""
+
+_SELECT_RANGE_SQL = """
+    SELECT * FROM history
+    WHERE timestamp >= ? AND timestamp <= ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_DELETE_BY_ID_SQL = "DELETE FROM history WHERE id = ?"
+
+_FTS_INSERT_TRIGGER_SQL = """
+    CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN
+        INSERT INTO history_fts(rowid, text) VALUES (new.id, new.text);
+    END
+"""
+
+# Batches at least this large index FTS in one statement instead of per row
+BULK_FTS_THRESHOLD = 64
+
+# How often a long-running manager refreshes planner statistics
+OPTIMIZE_INTERVAL_NS = 4 * 3600 * 1_000_000_000
+
+# Column order of history rows, as written by the exporters
+_EXPORT_COLUMNS = ("id", "text", "timestamp", "duration", "confidence", "language", "model")
+
+_SELECT_EXPORT_SQL = """
+    SELECT id, text, timestamp, duration, confidence, language, model FROM history
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+
+_SELECT_STATS_SQL = "SELECT count, total_duration, total_confidence FROM history_stats"
+
+_COUNT_SINCE_SQL = "SELECT COUNT(*) FROM history WHERE timestamp >= ?"
+
+# Scans one row per distinct language, so history itself needs no language index
+_TOP_LANGUAGE_SQL = "SELECT language FROM history_lang_counts ORDER BY cnt DESC LIMIT 1"
+
+
+def _to_epoch_us(ts: datetime) -> int:
+    """Convert a datetime to integer unix-epoch microseconds."""
+    return round(ts.timestamp() * 1_000_000)
+
+
+def _dump_export_item(item: dict) -> bytes:
+    """Serialize one exported entry as indented UTF-8 JSON, using orjson when installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(item, option=orjson.OPT_INDENT_2)
+    return json.dumps(item, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _from_epoch_us(us: int) -> datetime:
+    """Convert integer unix-epoch microseconds to a local datetime."""
+    seconds, micros = divmod(us, 1_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=micros)
+
+
+@dataclass(slots=True, frozen=True)
 class HistoryEntry:
-    """A single transcription history entry."""
+    """A single transcription history entry (immutable, one per row read)."""
+
     id: Optional[int]
     text: str
     timestamp: datetime
@@ -45,7 +154,7 @@ class HistoryEntry:
         return cls(
             id=row[0],
             text=row[1],
-            timestamp=datetime.fromisoformat(row[2]),
+            timestamp=_from_epoch_us(row[2]),
             duration=row[3],
             confidence=row[4],
             language=row[5],
@@ -73,10 +182,15 @@ class HistoryManager:
             db_path: Custom database path (default: standard app data location)
         """
         self.settings = settings or HistorySettings()
-        self._db_path = db_path or (get_data_dir() / "history.db")
+        # Absolute, so read-only connections can open it by file: URI
+        self._db_path = (db_path or (get_data_dir() / "history.db")).resolve()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self._connection: Optional[sqlite3.Connection] = None
+        self._connection: Optional[sqlite3.Connection] = None  # Single writer
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._last_optimize_ns = 0
         self._initialized = False
 
     def initialize(self) -> None:
@@ -88,17 +202,19 @@ class HistoryManager:
             str(self._db_path),
             check_same_thread=False,
             detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=128,
         )
 
-        # Enable WAL mode for better concurrent access
-        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._configure_connection(self._connection)
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        self._migrate_schema(version)
 
-        # Create main table
+        # Create main table (timestamp is unix-epoch microseconds)
         self._connection.execute("""
             CREATE TABLE IF NOT EXISTS history (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 text TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
                 duration REAL NOT NULL,
                 confidence REAL NOT NULL,
                 language TEXT NOT NULL,
@@ -106,21 +222,19 @@ class HistoryManager:
             )
         """)
 
-        # Create FTS virtual table for full-text search
+        # Create FTS virtual table for full-text search. Accents are folded so
+        # "cafe" finds "café"; full detail is kept so phrase queries work.
         self._connection.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
                 text,
                 content='history',
-                content_rowid='id'
+                content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
             )
         """)
 
         # Create triggers to keep FTS in sync
-        self._connection.execute("""
-            CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN
-                INSERT INTO history_fts(rowid, text) VALUES (new.id, new.text);
-            END
-        """)
+        self._connection.execute(_FTS_INSERT_TRIGGER_SQL)
 
         self._connection.execute("""
             CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN
@@ -142,28 +256,210 @@ class HistoryManager:
             CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history(timestamp)
         """)
 
+        # Running totals so get_statistics doesn't scan the table
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS history_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                count INTEGER NOT NULL,
+                total_duration REAL NOT NULL,
+                total_confidence REAL NOT NULL
+            )
+        """)
+
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS history_lang_counts (
+                language TEXT PRIMARY KEY,
+                cnt INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+
+        self._connection.execute("""
+            CREATE TRIGGER IF NOT EXISTS history_stats_ai AFTER INSERT ON history BEGIN
+                UPDATE history_stats SET
+                    count = count + 1,
+                    total_duration = total_duration + new.duration,
+                    total_confidence = total_confidence + new.confidence;
+                INSERT INTO history_lang_counts(language, cnt) VALUES (new.language, 1)
+                    ON CONFLICT(language) DO UPDATE SET cnt = cnt + 1;
+            END
+        """)
+
+        self._connection.execute("""
+            CREATE TRIGGER IF NOT EXISTS history_stats_ad AFTER DELETE ON history BEGIN
+                UPDATE history_stats SET
+                    count = count - 1,
+                    total_duration = total_duration - old.duration,
+                    total_confidence = total_confidence - old.confidence;
+                UPDATE history_lang_counts SET cnt = cnt - 1 WHERE language = old.language;
+                DELETE FROM history_lang_counts WHERE language = old.language AND cnt <= 0;
+            END
+        """)
+
+        self._connection.execute("""
+            CREATE TRIGGER IF NOT EXISTS history_stats_au
+            AFTER UPDATE OF duration, confidence, language ON history BEGIN
+                UPDATE history_stats SET
+                    total_duration = total_duration - old.duration + new.duration,
+                    total_confidence = total_confidence - old.confidence + new.confidence;
+                UPDATE history_lang_counts SET cnt = cnt - 1 WHERE language = old.language;
+                DELETE FROM history_lang_counts WHERE language = old.language AND cnt <= 0;
+                INSERT INTO history_lang_counts(language, cnt) VALUES (new.language, 1)
+                    ON CONFLICT(language) DO UPDATE SET cnt = cnt + 1;
+            END
+        """)
+
+        if version < 2:
+            self._rebuild_statistics()
+        if version < 3:
+            self._connection.execute("INSERT INTO history_fts(history_fts) VALUES('rebuild')")
+
+        self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
         self._connection.commit()
+
+        # Recommended on open for long-lived connections: analyze only the
+        # tables that need it, with a bounded amount of work
+        self._connection.execute("PRAGMA optimize=0x10002")
+        self._last_optimize_ns = time.monotonic_ns()
         self._initialized = True
 
         # Run cleanup on initialization
         if self.settings.enabled:
-            self.cleanup_old_entries()
+            self.prune()
+
+    def _configure_connection(
+        self, connection: sqlite3.Connection, read_only: bool = False
+    ) -> None:
+        """
+        Apply performance PRAGMAs to a freshly opened connection.
+
+        WAL with ``synchronous=NORMAL`` only fsyncs at checkpoints, so a commit
+        can be lost on power failure but the database never corrupts. Set
+        ``durable_writes`` to fsync every commit instead.
+
+        Args:
+            connection: Connection to configure
+            read_only: Skip the journal and checkpoint settings only a writer can apply
+        """
+        pragmas = [
+            "temp_store=MEMORY",
+            "cache_size=-20000",  # 20MB page cache
+            "mmap_size=268435456",  # 256MB
+            "busy_timeout=5000",
+        ]
+        if not read_only:
+            synchronous = "FULL" if self.settings.durable_writes else "NORMAL"
+            pragmas = [
+                "journal_mode=WAL",
+                f"synchronous={synchronous}",
+                *pragmas,
+                "wal_autocheckpoint=1000",
+                "journal_size_limit=6144000",
+            ]
+        for pragma in pragmas:
+            connection.execute(f"PRAGMA {pragma}")
+
+    def _migrate_schema(self, version: int) -> None:
+        """
+        Upgrade a database written by an older version in place.
+
+        Args:
+            version: The database's PRAGMA user_version before opening
+        """
+        conn = self._connection
+        has_history = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'history'"
+        ).fetchone()
+        if version >= SCHEMA_VERSION or not has_history:
+            return
+
+        if version < 1:
+            # Version 0 stored ISO-8601 text timestamps. Rebuild the table with
+            # an INTEGER column; dropping the old one also drops its triggers
+            # and index, which initialize() recreates. Row IDs are kept.
+            conn.create_function(
+                "iso_to_epoch_us", 1, lambda s: _to_epoch_us(datetime.fromisoformat(s))
+            )
+            conn.execute("""
+                CREATE TABLE history_new (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    text TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL,
+                    duration REAL NOT NULL,
+                    confidence REAL NOT NULL,
+                    language TEXT NOT NULL,
+                    model TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                INSERT INTO history_new (id, text, timestamp, duration, confidence, language, model)
+                SELECT id, text, iso_to_epoch_us(timestamp), duration, confidence, language, model
+                FROM history
+            """)
+            conn.execute("DROP TABLE history")
+            conn.execute("ALTER TABLE history_new RENAME TO history")
+
+        if version < 3:
+            # Before version 3 the FTS index used the default tokenizer. Drop
+            # it; initialize() recreates and rebuilds it.
+            conn.execute("DROP TABLE IF EXISTS history_fts")
+
+        conn.commit()
+
+    def _rebuild_statistics(self) -> None:
+        """Recompute the running totals from the history table."""
+        self._connection.execute("DELETE FROM history_stats")
+        self._connection.execute("""
+            INSERT INTO history_stats (id, count, total_duration, total_confidence)
+            SELECT 1, COUNT(*), COALESCE(SUM(duration), 0), COALESCE(SUM(confidence), 0)
+            FROM history
+        """)
+        self._connection.execute("DELETE FROM history_lang_counts")
+        self._connection.execute("""
+            INSERT INTO history_lang_counts (language, cnt)
+            SELECT language, COUNT(*) FROM history GROUP BY language
+        """)
 
     def shutdown(self) -> None:
-        """Close the database connection."""
+        """Close the database connections."""
+        with self._reader_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._reader_count = 0
+
         if self._connection:
+            try:
+                self._connection.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                print(f"History optimize failed: {e}")
             self._connection.close()
             self._connection = None
         self._initialized = False
 
+    def optimize(self) -> None:
+        """Refresh the query planner's statistics where SQLite deems them stale."""
+        if not self._initialized:
+            self.initialize()
+        self._connection.execute("PRAGMA optimize")
+        self._last_optimize_ns = time.monotonic_ns()
+
     @contextmanager
     def _get_cursor(self):
-        """Get a database cursor with automatic commit/rollback."""
+        """
+        Get a write cursor with automatic commit/rollback.
+
+        The transaction starts with ``BEGIN IMMEDIATE`` so the write lock is
+        taken up front (waiting up to ``busy_timeout``), rather than failing
+        with SQLITE_BUSY when a deferred transaction later tries to upgrade.
+        """
         if not self._initialized:
             self.initialize()
 
         cursor = self._connection.cursor()
         try:
+            cursor.execute("BEGIN IMMEDIATE")
             yield cursor
             self._connection.commit()
         except Exception:
@@ -172,6 +468,76 @@ class HistoryManager:
         finally:
             cursor.close()
 
+        # Piggyback periodic maintenance on writes instead of running a timer
+        if time.monotonic_ns() - self._last_optimize_ns > OPTIMIZE_INTERVAL_NS:
+            self.optimize()
+
+    @contextmanager
+    def _reader(self):
+        """
+        Borrow a read-only connection from the pool.
+
+        Up to ``READ_POOL_SIZE`` connections are opened on demand; beyond
+        that, callers wait for one to be returned. Under WAL these reads
+        don't block, or get blocked by, the writer connection.
+        """
+        if not self._initialized:
+            self.initialize()
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._reader_lock:
+                can_open = self._reader_count < READ_POOL_SIZE
+                if can_open:
+                    self._reader_count += 1
+            if can_open:
+                conn = sqlite3.connect(
+                    f"{self._db_path.as_uri()}?mode=ro",
+                    uri=True,
+                    check_same_thread=False,
+                    cached_statements=128,
+                )
+                self._configure_connection(conn, read_only=True)
+            else:
+                conn = self._readers.get()
+
+        try:
+            yield conn
+        finally:
+            if self._initialized:
+                self._readers.put(conn)
+            else:
+                conn.close()  # Shut down while borrowed
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """
+        Run a read-only statement on a pooled reader connection.
+
+        Args:
+            sql: Statement to run
+            params: Bound parameters
+
+        Returns:
+            All result rows
+        """
+        with self._reader() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def _query_one(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        """
+        Run a read-only statement and return its first row.
+
+        Args:
+            sql: Statement to run
+            params: Bound parameters
+
+        Returns:
+            The first row, or None if there are no results
+        """
+        with self._reader() as conn:
+            return conn.execute(sql, params).fetchone()
+
     def add_entry(
         self,
         text: str,
@@ -180,7 +546,7 @@ class HistoryManager:
         language: str,
         model: str,
         timestamp: Optional[datetime] = None,
-    ) -> HistoryEntry:
+    ) -> Optional[HistoryEntry]:
         """
         Add a new transcription to history.
 
@@ -193,28 +559,17 @@ class HistoryManager:
             timestamp: Optional custom timestamp (default: now)
 
         Returns:
-            The created HistoryEntry
+            The created HistoryEntry, or None if history is disabled
         """
         if not self.settings.enabled:
-            return HistoryEntry(
-                id=None,
-                text=text,
-                timestamp=timestamp or datetime.now(),
-                duration=duration,
-                confidence=confidence,
-                language=language,
-                model=model,
-            )
+            return None
 
         ts = timestamp or datetime.now()
 
         with self._get_cursor() as cursor:
             cursor.execute(
-                """
-                INSERT INTO history (text, timestamp, duration, confidence, language, model)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (text, ts.isoformat(), duration, confidence, language, model),
+                _INSERT_SQL,
+                (text, _to_epoch_us(ts), duration, confidence, language, model),
             )
             entry_id = cursor.lastrowid
 
@@ -228,6 +583,62 @@ class HistoryManager:
             model=model,
         )
 
+    def add_entries(self, entries: Iterable[HistoryEntry]) -> List[HistoryEntry]:
+        """
+        Add several transcriptions to history in a single transaction.
+
+        The rows are inserted with one ``executemany`` call, so the batch
+        costs a single commit instead of one per entry. Large batches also
+        bypass the per-row FTS trigger and index all new text with one
+        ``INSERT ... SELECT``; the trigger is dropped and recreated inside
+        the same transaction, so other connections never see it missing.
+        Entry IDs are ignored on input and assigned by the database.
+
+        Args:
+            entries: Entries to store
+
+        Returns:
+            The stored entries with their assigned IDs (empty if history is disabled)
+        """
+        if not self.settings.enabled:
+            return []
+
+        entries = list(entries)
+        if not entries:
+            return entries
+
+        bulk = len(entries) >= BULK_FTS_THRESHOLD
+
+        with self._get_cursor() as cursor:
+            if bulk:
+                cursor.execute("DROP TRIGGER IF EXISTS history_ai")
+            cursor.executemany(
+                _INSERT_SQL,
+                [
+                    (
+                        e.text,
+                        _to_epoch_us(e.timestamp),
+                        e.duration,
+                        e.confidence,
+                        e.language,
+                        e.model,
+                    )
+                    for e in entries
+                ],
+            )
+            # Rows inserted within one transaction get consecutive IDs
+            cursor.execute("SELECT last_insert_rowid()")
+            first_id = cursor.fetchone()[0] - len(entries) + 1
+            if bulk:
+                cursor.execute(
+                    "INSERT INTO history_fts(rowid, text) "
+                    "SELECT id, text FROM history WHERE id >= ?",
+                    (first_id,),
+                )
+                cursor.execute(_FTS_INSERT_TRIGGER_SQL)
+
+        return [replace(e, id=first_id + i) for i, e in enumerate(entries)]
+
     def get_entry(self, entry_id: int) -> Optional[HistoryEntry]:
         """
         Get a specific history entry by ID.
@@ -238,13 +649,7 @@ class HistoryManager:
         Returns:
             HistoryEntry or None if not found
         """
-        with self._get_cursor() as cursor:
-            cursor.execute(
-                "SELECT * FROM history WHERE id = ?",
-                (entry_id,),
-            )
-            row = cursor.fetchone()
-
+        row = self._query_one(_SELECT_BY_ID_SQL, (entry_id,))
         if row:
             return HistoryEntry.from_row(row)
         return None
@@ -260,17 +665,7 @@ class HistoryManager:
         Returns:
             List of HistoryEntry objects
         """
-        with self._get_cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT * FROM history
-                ORDER BY timestamp DESC
-                LIMIT ? OFFSET ?
-                """,
-                (limit, offset),
-            )
-            rows = cursor.fetchall()
-
+        rows = self._query(_SELECT_RECENT_SQL, (limit, offset))
         return [HistoryEntry.from_row(row) for row in rows]
 
     def search(self, query: str, limit: int = 50) -> List[HistoryEntry]:
@@ -284,20 +679,7 @@ class HistoryManager:
         Returns:
             List of matching HistoryEntry objects
         """
-        with self._get_cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT history.*
-                FROM history
-                JOIN history_fts ON history.id = history_fts.rowid
-                WHERE history_fts MATCH ?
-                ORDER BY rank
-                LIMIT ?
-                """,
-                (query, limit),
-            )
-            rows = cursor.fetchall()
-
+        rows = self._query(_SEARCH_SQL, (query, limit))
         return [HistoryEntry.from_row(row) for row in rows]
 
     def get_by_date_range(
@@ -317,17 +699,10 @@ class HistoryManager:
         Returns:
             List of HistoryEntry objects
         """
-        with self._get_cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT * FROM history
-                WHERE timestamp >= ? AND timestamp <= ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-                """,
-                (start_date.isoformat(), end_date.isoformat(), limit),
-            )
-            rows = cursor.fetchall()
+        rows = self._query(
+            _SELECT_RANGE_SQL,
+            (_to_epoch_us(start_date), _to_epoch_us(end_date), limit),
+        )
 
         return [HistoryEntry.from_row(row) for row in rows]
 
@@ -342,27 +717,26 @@ class HistoryManager:
             True if deleted, False if not found
         """
         with self._get_cursor() as cursor:
-            cursor.execute("DELETE FROM history WHERE id = ?", (entry_id,))
+            cursor.execute(_DELETE_BY_ID_SQL, (entry_id,))
             return cursor.rowcount > 0
 
-    def cleanup_old_entries(self) -> int:
+    def prune(self) -> int:
         """
-        Delete entries older than retention period.
+        Apply both the retention period and the max_entries limit.
 
         Returns:
             Number of entries deleted
         """
-        if self.settings.retention_days <= 0:
-            return 0
+        return self._prune(self.settings.retention_days, self.settings.max_entries)
 
-        cutoff = datetime.now() - timedelta(days=self.settings.retention_days)
+    def cleanup_old_entries(self) -> int:
+        """
+        Delete entries older than retention period.
 
-        with self._get_cursor() as cursor:
-            cursor.execute(
-                "DELETE FROM history WHERE timestamp < ?",
-                (cutoff.isoformat(),),
-            )
-            return cursor.rowcount
+        Returns:
+            Number of entries deleted
+        """
+        return self._prune(self.settings.retention_days, 0)
 
     def enforce_max_entries(self) -> int:
         """
@@ -371,30 +745,36 @@ class HistoryManager:
         Returns:
             Number of entries deleted
         """
-        if self.settings.max_entries <= 0:
-            return 0
+        return self._prune(0, self.settings.max_entries)
 
-        with self._get_cursor() as cursor:
-            # Get current count
-            cursor.execute("SELECT COUNT(*) FROM history")
-            count = cursor.fetchone()[0]
+    def _prune(self, retention_days: int, max_entries: int) -> int:
+        """
+        Delete expired and excess entries with a single DELETE.
 
-            if count <= self.settings.max_entries:
-                return 0
+        Args:
+            retention_days: Delete entries older than this many days (0 = keep)
+            max_entries: Keep only this many newest entries (0 = no limit)
 
-            # Delete oldest entries
-            to_delete = count - self.settings.max_entries
-            cursor.execute(
-                """
-                DELETE FROM history
-                WHERE id IN (
-                    SELECT id FROM history
-                    ORDER BY timestamp ASC
-                    LIMIT ?
-                )
-                """,
-                (to_delete,),
+        Returns:
+            Number of entries deleted
+        """
+        conditions = []
+        params = []
+        if retention_days > 0:
+            cutoff = datetime.now() - timedelta(days=retention_days)
+            conditions.append("timestamp < ?")
+            params.append(_to_epoch_us(cutoff))
+        if max_entries > 0:
+            # Everything past the newest max_entries rows; no COUNT(*) needed
+            conditions.append(
+                "id IN (SELECT id FROM history ORDER BY timestamp DESC, id DESC LIMIT -1 OFFSET ?)"
             )
+            params.append(max_entries)
+        if not conditions:
+            return 0
+
+        with self._get_cursor() as cursor:
+            cursor.execute(f"DELETE FROM history WHERE {' OR '.join(conditions)}", params)
             return cursor.rowcount
 
     def get_statistics(self) -> dict:
@@ -404,39 +784,18 @@ class HistoryManager:
         Returns:
             Dictionary with statistics
         """
-        with self._get_cursor() as cursor:
-            # Total entries
-            cursor.execute("SELECT COUNT(*) FROM history")
-            total = cursor.fetchone()[0]
-
-            # Total duration
-            cursor.execute("SELECT SUM(duration) FROM history")
-            total_duration = cursor.fetchone()[0] or 0
+        # Totals come from the trigger-maintained counters; only today's count
+        # touches history, as a range scan on the timestamp index.
+        total, total_duration, total_confidence = self._query_one(_SELECT_STATS_SQL)
+        if total == 0:
+            total_duration = total_confidence = 0.0
+        avg_confidence = total_confidence / total if total else 0
 
-            # Average confidence
-            cursor.execute("SELECT AVG(confidence) FROM history")
-            avg_confidence = cursor.fetchone()[0] or 0
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        today_count = self._query_one(_COUNT_SINCE_SQL, (_to_epoch_us(today),))[0]
 
-            # Entries today
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            cursor.execute(
-                "SELECT COUNT(*) FROM history WHERE timestamp >= ?",
-                (today.isoformat(),),
-            )
-            today_count = cursor.fetchone()[0]
-
-            # Most used language
-            cursor.execute(
-                """
-                SELECT language, COUNT(*) as cnt
-                FROM history
-                GROUP BY language
-                ORDER BY cnt DESC
-                LIMIT 1
-                """
-            )
-            row = cursor.fetchone()
-            most_used_language = row[0] if row else None
+        row = self._query_one(_TOP_LANGUAGE_SQL)
+        most_used_language = row[0] if row else None
 
         return {
             "total_entries": total,
@@ -460,6 +819,21 @@ class HistoryManager:
         else:
             return f"{secs}s"
 
+    def _iter_export_rows(self) -> Iterator[tuple]:
+        """
+        Stream rows for export, newest first, with ISO-8601 timestamps.
+
+        Rows come straight off a cursor in ``_EXPORT_COLUMNS`` order, so an
+        export never holds more than one entry in memory.
+
+        Yields:
+            One tuple per entry
+        """
+        limit = self.settings.max_entries if self.settings.max_entries > 0 else -1
+        with self._reader() as conn:
+            for row in conn.execute(_SELECT_EXPORT_SQL, (limit,)):
+                yield row[:2] + (_from_epoch_us(row[2]).isoformat(),) + row[3:]
+
     def export_to_json(self, filepath: Path) -> int:
         """
         Export history to JSON file.
@@ -470,13 +844,18 @@ class HistoryManager:
         Returns:
             Number of entries exported
         """
-        entries = self.get_recent(limit=self.settings.max_entries)
-        data = [entry.to_dict() for entry in entries]
+        count = 0
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, "wb") as f:
+            # Same layout as json.dump(..., indent=2), written one entry at a time
+            for row in self._iter_export_rows():
+                item = _dump_export_item(dict(zip(_EXPORT_COLUMNS, row)))
+                f.write(b",\n  " if count else b"[\n  ")
+                f.write(item.replace(b"\n", b"\n  "))
+                count += 1
+            f.write(b"\n]" if count else b"[]")
 
-        return len(entries)
+        return count
 
     def export_to_txt(self, filepath: Path) -> int:
         """
@@ -488,15 +867,16 @@ class HistoryManager:
         Returns:
             Number of entries exported
         """
-        entries = self.get_recent(limit=self.settings.max_entries)
+        count = 0
 
         with open(filepath, "w", encoding="utf-8") as f:
-            for entry in entries:
-                f.write(f"[{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')}]\n")
-                f.write(f"{entry.text}\n")
+            for row in self._iter_export_rows():
+                f.write(f"[{row[2][:19].replace('T', ' ')}]\n")
+                f.write(f"{row[1]}\n")
                 f.write(f"---\n\n")
+                count += 1
 
-        return len(entries)
+        return count
 
     def export_to_csv(self, filepath: Path) -> int:
         """
@@ -510,24 +890,16 @@ class HistoryManager:
         """
         import csv
 
-        entries = self.get_recent(limit=self.settings.max_entries)
-
         with open(filepath, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
-            writer.writerow(["id", "text", "timestamp", "duration", "confidence", "language", "model"])
-
-            for entry in entries:
-                writer.writerow([
-                    entry.id,
-                    entry.text,
-                    entry.timestamp.isoformat(),
-                    entry.duration,
-                    entry.confidence,
-                    entry.language,
-                    entry.model,
-                ])
-
-        return len(entries)
+            writer.writerow(_EXPORT_COLUMNS)
+
+            count = 0
+            for row in self._iter_export_rows():
+                writer.writerow(row)
+                count += 1
+
+        return count
 
     def clear_all(self) -> int:
         """
@@ -5,29 +5,162 @@ Handles global keyboard shortcuts for activating/deactivating recording.
 Supports press-and-hold mode where recording starts on key press and stops on release.
 """
 
+import ctypes
+import os
+import re
+import selectors
 import threading
 import platform
 import time
-from typing import Optional, Callable, Set
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Callable, FrozenSet, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from pynput import keyboard
 
+try:
+    import evdev
+    from evdev import ecodes
+
+    HAS_EVDEV = True
+except ImportError:
+    HAS_EVDEV = False
+
+
+IS_WINDOWS = platform.system() == "Windows"
+IS_LINUX = platform.system() == "Linux"
+
+# The OS/command key is called "cmd" on macOS and "win" elsewhere
+_META_KEY = "cmd" if platform.system() == "Darwin" else "win"
+
+# Accepted modifier spellings mapped to their canonical names
+_MOD_CANONICAL = {
+    "alt": "alt",
+    "ctrl": "ctrl",
+    "control": "ctrl",
+    "shift": "shift",
+    "cmd": _META_KEY,
+    "win": _META_KEY,
+    "meta": _META_KEY,
+}
+
+# One bit per modifier so pressed-state comparisons are a single int compare
+_MODIFIER_BITS = {"alt": 1, "ctrl": 2, "shift": 4, "cmd": 8, "win": 8}
+
+_MODIFIER_KEY_BITS = {
+    **dict.fromkeys((keyboard.Key.alt, keyboard.Key.alt_l, keyboard.Key.alt_r), 1),
+    **dict.fromkeys((keyboard.Key.ctrl, keyboard.Key.ctrl_l, keyboard.Key.ctrl_r), 2),
+    **dict.fromkeys((keyboard.Key.shift, keyboard.Key.shift_l, keyboard.Key.shift_r), 4),
+    **dict.fromkeys((keyboard.Key.cmd, keyboard.Key.cmd_l, keyboard.Key.cmd_r), 8),
+}
+
+# Tokens of a hotkey string, split on "+" and whitespace
+_HOTKEY_TOKEN_RE = re.compile(r"[^+\s]+")
+
+# RegisterHotKey modifier flags
+_WIN32_MODIFIERS = {"alt": 0x0001, "ctrl": 0x0002, "shift": 0x0004, "win": 0x0008}
+_MOD_NOREPEAT = 0x4000
+_WM_HOTKEY = 0x0312
+_WM_QUIT = 0x0012
+_THREAD_PRIORITY_ABOVE_NORMAL = 1
+
+# Virtual-key codes for named keys (letters and digits map to their ASCII code)
+_WIN32_VK = {
+    "space": 0x20,
+    "enter": 0x0D,
+    "tab": 0x09,
+    "esc": 0x1B,
+    "backspace": 0x08,
+    "insert": 0x2D,
+    "delete": 0x2E,
+    "home": 0x24,
+    "end": 0x23,
+    "page_up": 0x21,
+    "page_down": 0x22,
+    "left": 0x25,
+    "up": 0x26,
+    "right": 0x27,
+    "down": 0x28,
+    "pause": 0x13,
+    "print_screen": 0x2C,
+    **{f"f{n}": 0x6F + n for n in range(1, 25)},
+}
+
 
 class HotkeyState(Enum):
     """State of the hotkey."""
+
     IDLE = "idle"
     PRESSED = "pressed"
     RELEASED = "released"
 
 
+@lru_cache(maxsize=128)
+def _parse_hotkey(hotkey_str: str) -> Tuple[FrozenSet[str], str]:
+    """
+    Split a hotkey string into canonical modifiers and its key.
+
+    Memoized because settings validation, conflict checks and set_hotkey
+    tend to parse the same few strings repeatedly. The result is immutable,
+    so cached values can be shared.
+
+    Args:
+        hotkey_str: String representation of the hotkey
+
+    Returns:
+        (modifiers, key)
+
+    Raises:
+        ValueError: If the string names no non-modifier key
+    """
+    modifiers = set()
+    key = None
+
+    for part in _HOTKEY_TOKEN_RE.findall(hotkey_str.lower()):
+        modifier = _MOD_CANONICAL.get(part)
+        if modifier:
+            modifiers.add(modifier)
+        else:
+            key = part
+
+    if key is None:
+        raise ValueError(f"Invalid hotkey: {hotkey_str} - no key specified")
+
+    return frozenset(modifiers), key
+
+
 @dataclass
 class HotkeyCombo:
     """Represents a hotkey combination."""
-    modifiers: Set[str]  # e.g., {"alt", "ctrl", "shift"}
+
+    modifiers: FrozenSet[str]  # e.g., {"alt", "ctrl", "shift"}
     key: str  # e.g., "s", "space", "f1"
 
+    # Resolved once so matching a keystroke is a few plain compares
+    modifier_mask: int = field(init=False, repr=False, compare=False)
+    _expected_name: str = field(init=False, repr=False, compare=False)
+    _expected_vk: Optional[int] = field(init=False, repr=False, compare=False)
+    _expected_chars: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _canonical: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the modifier mask and the lookups used by matches_pynput_key."""
+        # Frozen so the precomputed mask can't drift from the modifier set
+        self.modifiers = frozenset(self.modifiers)
+        if self.modifiers <= _MODIFIER_BITS.keys():
+            self.modifier_mask = 0
+            for name in self.modifiers:
+                self.modifier_mask |= _MODIFIER_BITS[name]
+        else:
+            self.modifier_mask = -1  # Unknown modifier, can never be held
+        key = self.key.lower()
+        self._expected_name = key
+        single = len(key) == 1
+        self._expected_vk = ord(key.upper()) if single and key.isascii() and key.isalnum() else None
+        self._expected_chars = frozenset((key, key.upper())) if single else frozenset()
+        self._canonical = "+".join(sorted(self.modifiers) + [self.key])
+
     @classmethod
     def from_string(cls, hotkey_str: str) -> "HotkeyCombo":
         """
@@ -39,56 +172,265 @@ class HotkeyCombo:
         Returns:
             HotkeyCombo instance
         """
-        parts = hotkey_str.lower().replace(" ", "").split("+")
-
-        modifier_names = {"alt", "ctrl", "control", "shift", "cmd", "win", "meta"}
-        modifiers = set()
-        key = None
-
-        for part in parts:
-            if part in modifier_names:
-                # Normalize modifier names
-                if part == "control":
-                    part = "ctrl"
-                elif part in ("cmd", "win", "meta"):
-                    part = "cmd" if platform.system() == "Darwin" else "win"
-                modifiers.add(part)
-            else:
-                key = part
-
-        if key is None:
-            raise ValueError(f"Invalid hotkey: {hotkey_str} - no key specified")
-
+        modifiers, key = _parse_hotkey(hotkey_str)
         return cls(modifiers=modifiers, key=key)
 
     def to_string(self) -> str:
         """Convert back to string representation."""
-        parts = sorted(self.modifiers) + [self.key]
-        return "+".join(parts)
+        return self._canonical
 
     def matches_pynput_key(self, key) -> bool:
         """Check if a pynput key matches this hotkey's key."""
+        # Special keys (F1, space, ...) are identified by their enum name
+        name = getattr(key, "name", None)
+        if name:
+            return name == self._expected_name
+
+        # On Windows, when Ctrl is pressed, the char becomes a control code,
+        # so the virtual key code is checked first for A-Z (65-90) and 0-9 (48-57)
+        vk = getattr(key, "vk", None)
+        if vk and (65 <= vk <= 90 or 48 <= vk <= 57):
+            return vk == self._expected_vk
+
+        # Fallback: check regular character (only for unmodified keys)
+        char = getattr(key, "char", None)
+        return char is not None and char in self._expected_chars
+
+
+def _win32_hotkey_args(combo: HotkeyCombo) -> Optional[Tuple[int, int]]:
+    """
+    Translate a hotkey into ``RegisterHotKey`` arguments.
+
+    Args:
+        combo: Parsed hotkey
+
+    Returns:
+        (modifier flags, virtual-key code), or None if the combo can't be
+        registered natively
+    """
+    if combo.modifiers - _WIN32_MODIFIERS.keys():
+        return None
+
+    key = combo.key
+    if len(key) == 1 and key.isascii() and key.isalnum():
+        vk = ord(key.upper())
+    else:
+        vk = _WIN32_VK.get(key)
+        if vk is None:
+            return None
+
+    modifiers = _MOD_NOREPEAT
+    for name in combo.modifiers:
+        modifiers |= _WIN32_MODIFIERS[name]
+    return modifiers, vk
+
+
+class _Win32HotkeyListener:
+    """
+    System hotkey registered with ``RegisterHotKey``.
+
+    Windows matches the combo itself and posts ``WM_HOTKEY`` only when it is
+    pressed, so ordinary keystrokes never reach Python. The registration is
+    tied to the thread that made it, so a dedicated thread registers the
+    hotkey and pumps its messages.
+    """
+
+    _HOTKEY_ID = 1
+
+    def __init__(self, modifiers: int, vk: int, callback: Callable[[], None]):
+        """
+        Initialize the listener.
+
+        Args:
+            modifiers: RegisterHotKey modifier flags
+            vk: Virtual-key code
+            callback: Called on the pump thread for each activation
+        """
+        self._modifiers = modifiers
+        self._vk = vk
+        self._callback = callback
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = 0
+        self._registered = False
+        self._ready = threading.Event()
+
+    def start(self) -> bool:
+        """
+        Register the hotkey and start the message pump.
+
+        Returns:
+            True if Windows accepted the registration
+        """
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name="hotkey", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if not self._registered:
+            self._thread.join()
+            self._thread = None
+        return self._registered
+
+    def stop(self) -> None:
+        """Unregister the hotkey and end the message pump."""
+        if self._thread is None:
+            return
+        ctypes.windll.user32.PostThreadMessageW(self._thread_id, _WM_QUIT, 0, 0)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        """Register the hotkey, then dispatch WM_HOTKEY until WM_QUIT."""
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        self._thread_id = kernel32.GetCurrentThreadId()
+        # Wake promptly on WM_HOTKEY even while transcription saturates the CPU
+        kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_PRIORITY_ABOVE_NORMAL)
+        self._registered = bool(
+            user32.RegisterHotKey(None, self._HOTKEY_ID, self._modifiers, self._vk)
+        )
+        self._ready.set()
+        if not self._registered:
+            return
+
+        msg = wintypes.MSG()
         try:
-            # First check if it's a special key (like F1, space, etc.)
-            if hasattr(key, "name") and key.name:
-                return key.name.lower() == self.key.lower()
-            
-            # On Windows, when Ctrl is pressed, the char becomes a control code
-            # Check the virtual key code (vk) FIRST - this is the most reliable
-            if hasattr(key, "vk") and key.vk:
-                # vk codes for A-Z are 0x41-0x5A (65-90)
-                if 65 <= key.vk <= 90:
-                    return chr(key.vk).lower() == self.key.lower()
-                # vk codes for 0-9 are 0x30-0x39 (48-57)
-                if 48 <= key.vk <= 57:
-                    return chr(key.vk) == self.key
-            
-            # Fallback: check regular character (only for unmodified keys)
-            if hasattr(key, "char") and key.char and len(key.char) == 1 and key.char.isprintable():
-                return key.char.lower() == self.key.lower()
-        except (AttributeError, TypeError):
-            pass
-        return False
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == _WM_HOTKEY:
+                    self._callback()
+        finally:
+            user32.UnregisterHotKey(None, self._HOTKEY_ID)
+
+
+def _evdev_key_code(key: str) -> Optional[int]:
+    """
+    Look up the Linux input keycode for a hotkey key name.
+
+    Args:
+        key: Key name as parsed from the hotkey string (e.g. "r", "f1", "page_up")
+
+    Returns:
+        The KEY_* code, or None if there is no equivalent
+    """
+    return ecodes.ecodes.get(f"KEY_{key.upper().replace('_', '')}")
+
+
+class _EvdevHotkeyListener:
+    """
+    Hotkey detection straight from ``/dev/input`` keyboard devices.
+
+    Bypasses the X server, so it also works under Wayland compositors where
+    pynput sees nothing. Needs read access to the event nodes (usually
+    membership of the ``input`` group).
+    """
+
+    # Linux keycodes of the modifiers, mapped to _MODIFIER_BITS values
+    _MODIFIER_CODES = {
+        "KEY_LEFTALT": 1,
+        "KEY_RIGHTALT": 1,
+        "KEY_LEFTCTRL": 2,
+        "KEY_RIGHTCTRL": 2,
+        "KEY_LEFTSHIFT": 4,
+        "KEY_RIGHTSHIFT": 4,
+        "KEY_LEFTMETA": 8,
+        "KEY_RIGHTMETA": 8,
+    }
+
+    def __init__(self, key_code: int, modifier_mask: int, callback: Callable[[], None]):
+        """
+        Initialize the listener.
+
+        Args:
+            key_code: Linux keycode of the hotkey's key
+            modifier_mask: Required modifiers as a _MODIFIER_BITS mask
+            callback: Called on the reader thread for each activation
+        """
+        self._key_code = key_code
+        self._modifier_mask = modifier_mask
+        self._callback = callback
+        self._modifier_bits = {
+            ecodes.ecodes[name]: bit for name, bit in self._MODIFIER_CODES.items()
+        }
+        self._pressed_mask = 0
+        self._devices = []
+        self._thread: Optional[threading.Thread] = None
+        self._wake_fds: Optional[Tuple[int, int]] = None
+
+    def start(self) -> bool:
+        """
+        Open every readable keyboard that has the hotkey's key and start reading.
+
+        Returns:
+            True if at least one device could be opened
+        """
+        for path in evdev.list_devices():
+            try:
+                device = evdev.InputDevice(path)
+            except OSError:
+                continue  # No permission
+            if self._key_code in device.capabilities().get(ecodes.EV_KEY, ()):
+                self._devices.append(device)
+            else:
+                device.close()
+
+        if not self._devices:
+            return False
+
+        self._wake_fds = os.pipe()
+        self._thread = threading.Thread(target=self._run, name="hotkey", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop reading and close the devices."""
+        if self._thread is not None:
+            os.write(self._wake_fds[1], b"\0")
+            self._thread.join()
+            self._thread = None
+        if self._wake_fds is not None:
+            for fd in self._wake_fds:
+                os.close(fd)
+            self._wake_fds = None
+        for device in self._devices:
+            device.close()
+        self._devices = []
+
+    def _run(self) -> None:
+        """Block in select() until input arrives or stop() writes the wake pipe."""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._wake_fds[0], selectors.EVENT_READ)
+            for device in self._devices:
+                selector.register(device, selectors.EVENT_READ)
+
+            while True:
+                for selected, _ in selector.select():
+                    if selected.fd == self._wake_fds[0]:
+                        return
+                    device = selected.fileobj
+                    try:
+                        for event in device.read():
+                            if event.type == ecodes.EV_KEY:
+                                self._handle_key(event.code, event.value)
+                    except OSError:
+                        selector.unregister(device)  # Unplugged
+
+    def _handle_key(self, code: int, value: int) -> None:
+        """
+        Track modifiers and fire on the hotkey's key going down.
+
+        Args:
+            code: Linux keycode
+            value: 1 for press, 0 for release, 2 for auto-repeat
+        """
+        bit = self._modifier_bits.get(code, 0)
+        if bit:
+            if value:
+                self._pressed_mask |= bit
+            else:
+                self._pressed_mask &= ~bit
+        elif code == self._key_code and value == 1 and self._pressed_mask == self._modifier_mask:
+            self._callback()
 
 
 class HotkeyManager:
@@ -115,14 +457,18 @@ class HotkeyManager:
         self._on_toggle = on_toggle
 
         self._listener: Optional[keyboard.Listener] = None
+        self._native_listener = None  # _Win32HotkeyListener or _EvdevHotkeyListener
         self._is_running = False
 
-        # Track pressed modifiers
-        self._pressed_modifiers: Set[str] = set()
-        self._last_toggle_time: float = 0.0
-        self._debounce_time: float = 0.3  # Prevent double-triggers
+        # Track pressed modifiers as a bitmask of _MODIFIER_BITS
+        self._pressed_mask = 0
+        # Set while the hotkey is held, so OS auto-repeat presses are ignored
+        self._hotkey_down = False
+        # Monotonic integer clock, so NTP or manual clock changes can't break the debounce
+        self._last_toggle_ns: int = 0
+        self._debounce_ns: int = 300_000_000  # Prevent double-triggers (300ms)
 
-        # Thread safety
+        # Guards callback replacement; the event path itself is single-threaded
         self._lock = threading.Lock()
 
     def set_hotkey(self, hotkey: str) -> None:
@@ -160,8 +506,14 @@ class HotkeyManager:
         if self._is_running:
             return
 
-        self._pressed_modifiers.clear()
-        self._last_toggle_time = 0.0
+        self._pressed_mask = 0
+        self._hotkey_down = False
+        self._last_toggle_ns = 0
+
+        # Prefer a native hotkey so non-matching keystrokes never reach Python
+        if self._start_native():
+            self._is_running = True
+            return
 
         self._listener = keyboard.Listener(
             on_press=self._handle_press,
@@ -175,55 +527,97 @@ class HotkeyManager:
         if not self._is_running:
             return
 
+        if self._native_listener:
+            self._native_listener.stop()
+            self._native_listener = None
+
         if self._listener:
             self._listener.stop()
             self._listener = None
 
         self._is_running = False
-        self._pressed_modifiers.clear()
+        self._pressed_mask = 0
+
+    def _start_native(self) -> bool:
+        """
+        Try to register the hotkey with the OS instead of listening to every key.
+
+        Returns:
+            True if a native hotkey is active
+        """
+        if IS_WINDOWS:
+            args = _win32_hotkey_args(self._hotkey)
+            if args is None:
+                return False
+            listener = _Win32HotkeyListener(*args, callback=self._trigger_toggle)
+        elif IS_LINUX and HAS_EVDEV:
+            key_code = _evdev_key_code(self._hotkey.key)
+            if key_code is None or self._hotkey.modifier_mask < 0:
+                return False
+            listener = _EvdevHotkeyListener(
+                key_code, self._hotkey.modifier_mask, callback=self._trigger_toggle
+            )
+        else:
+            return False
 
-    def _get_modifier_name(self, key) -> Optional[str]:
-        """Get the modifier name for a key, if it's a modifier."""
         try:
-            if key == keyboard.Key.alt or key == keyboard.Key.alt_l or key == keyboard.Key.alt_r:
-                return "alt"
-            elif key == keyboard.Key.ctrl or key == keyboard.Key.ctrl_l or key == keyboard.Key.ctrl_r:
-                return "ctrl"
-            elif key == keyboard.Key.shift or key == keyboard.Key.shift_l or key == keyboard.Key.shift_r:
-                return "shift"
-            elif key == keyboard.Key.cmd or key == keyboard.Key.cmd_l or key == keyboard.Key.cmd_r:
-                return "cmd" if platform.system() == "Darwin" else "win"
-        except AttributeError:
-            pass
-        return None
+            if not listener.start():
+                print(
+                    f"Could not register {self._hotkey.to_string()} natively, using keyboard hook"
+                )
+                return False
+        except (AttributeError, OSError) as e:
+            print(f"Native hotkey unavailable: {e}")
+            return False
+
+        self._native_listener = listener
+        return True
 
     def _handle_press(self, key) -> None:
         """Handle key press event."""
         # Check if it's a modifier
-        modifier = self._get_modifier_name(key)
-        if modifier:
-            self._pressed_modifiers.add(modifier)
+        bit = _MODIFIER_KEY_BITS.get(key, 0)
+        if bit:
+            self._pressed_mask |= bit
             return
 
         # Check if the hotkey combo is complete
-        if self._hotkey.matches_pynput_key(key):
-            if self._pressed_modifiers == self._hotkey.modifiers:
-                # Debounce check to prevent double-triggers
-                now = time.time()
-                with self._lock:
-                    if now - self._last_toggle_time > self._debounce_time:
-                        self._last_toggle_time = now
-                        if self._on_toggle:
-                            try:
-                                self._on_toggle()
-                            except Exception as e:
-                                print(f"Error in hotkey toggle callback: {e}")
+        if self._pressed_mask == self._hotkey.modifier_mask and self._hotkey.matches_pynput_key(
+            key
+        ):
+            if self._hotkey_down:
+                return  # Auto-repeat of a held hotkey
+            self._hotkey_down = True
+            self._trigger_toggle()
+
+    def _trigger_toggle(self) -> None:
+        """
+        Run the toggle callback, debounced against double-triggers.
+
+        Only one listener (pynput or the native hotkey thread) is active at a
+        time and it delivers events serially, so the debounce state needs no
+        lock; the callback is read once in case set_callback swaps it.
+        """
+        now = time.monotonic_ns()
+        if now - self._last_toggle_ns <= self._debounce_ns:
+            return
+        self._last_toggle_ns = now
+
+        on_toggle = self._on_toggle
+        if on_toggle:
+            try:
+                on_toggle()
+            except Exception as e:
+                print(f"Error in hotkey toggle callback: {e}")
 
     def _handle_release(self, key) -> None:
-        """Handle key release event - only track modifier releases."""
-        modifier = self._get_modifier_name(key)
-        if modifier:
-            self._pressed_modifiers.discard(modifier)
+        """Handle key release event."""
+        bit = _MODIFIER_KEY_BITS.get(key, 0)
+        if bit:
+            self._pressed_mask &= ~bit
+            self._hotkey_down = False
+        elif self._hotkey_down and self._hotkey.matches_pynput_key(key):
+            self._hotkey_down = False
 
     @property
     def is_running(self) -> bool:
@@ -246,17 +640,10 @@ class HotkeyManager:
         return False
 
 
-def check_hotkey_conflict(hotkey: str) -> Optional[str]:
-    """
-    Check if a hotkey might conflict with common system shortcuts.
-
-    Args:
-        hotkey: Hotkey string to check
-
-    Returns:
-        Warning message if conflict detected, None otherwise
-    """
-    common_conflicts = {
+# Common system shortcuts, keyed by canonical hotkey string
+_COMMON_CONFLICTS = {
+    HotkeyCombo.from_string(hotkey)._canonical: description
+    for hotkey, description in {
         "alt+f4": "Close window (Windows/Linux)",
         "alt+tab": "Switch window",
         "ctrl+c": "Copy",
@@ -269,11 +656,32 @@ def check_hotkey_conflict(hotkey: str) -> Optional[str]:
         "cmd+v": "Paste (macOS)",
         "cmd+q": "Quit (macOS)",
         "cmd+w": "Close window (macOS)",
-    }
+    }.items()
+}
+
+
+@lru_cache(maxsize=256)
+def check_hotkey_conflict(hotkey: str) -> Optional[str]:
+    """
+    Check if a hotkey might conflict with common system shortcuts.
+
+    Memoized, since the settings page re-checks the hotkey field on every
+    edit.
+
+    Args:
+        hotkey: Hotkey string to check
+
+    Returns:
+        Warning message if conflict detected, None otherwise
+    """
+    try:
+        canonical = HotkeyCombo.from_string(hotkey)._canonical
+    except ValueError:
+        return None
 
-    normalized = hotkey.lower().replace(" ", "")
-    if normalized in common_conflicts:
-        return f"Warning: '{hotkey}' conflicts with '{common_conflicts[normalized]}'"
+    conflict = _COMMON_CONFLICTS.get(canonical)
+    if conflict:
+        return f"Warning: '{hotkey}' conflicts with '{conflict}'"
 
     return None
 
@@ -0,0 +1,173 @@
+"""
+Resampler for LocalWhisper
+
+Polyphase FIR sample rate conversion used to bring captured audio to the
+16kHz rate Whisper expects.
+"""
+
+from math import gcd
+
+import numpy as np
+
+
+def design_lowpass(up: int, down: int, kaiser_beta: float = 5.0) -> np.ndarray:
+    """
+    Design the anti-aliasing FIR filter for rational resampling.
+
+    Windowed-sinc design matching scipy's ``resample_poly`` defaults
+    (Kaiser window, 10 zero crossings per side), scaled by ``up`` so the
+    passband gain is unity after zero-stuffing.
+
+    Args:
+        up: Upsampling factor
+        down: Downsampling factor
+        kaiser_beta: Kaiser window shape parameter
+
+    Returns:
+        Filter taps as float32
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    num_taps = 2 * half_len + 1
+
+    cutoff = 1.0 / max_rate  # Normalized to the Nyquist rate of the upsampled signal
+    n = np.arange(num_taps) - half_len
+    taps = np.sinc(cutoff * n) * np.kaiser(num_taps, kaiser_beta)
+    taps *= up / taps.sum()
+
+    return taps.astype(np.float32)
+
+
+# Outputs computed per vectorized step; bounds the gathered tap windows to a
+# few hundred kilobytes regardless of how long the input is
+_BLOCK_SIZE = 4096
+
+
+class PolyphaseResampler:
+    """
+    Streaming rational resampler.
+
+    Each output sample is computed from only the filter phase that touches
+    real input samples, so no zero-stuffed intermediate signal is built.
+    Filter history is carried across calls, which lets audio be converted
+    chunk by chunk without boundary artifacts. Output is compensated for the
+    filter's group delay, so it lines up with the input; the last few
+    samples are held back until more input arrives or ``flush`` is called.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int):
+        """
+        Initialize the resampler.
+
+        Args:
+            orig_sr: Input sample rate
+            target_sr: Output sample rate
+        """
+        divisor = gcd(orig_sr, target_sr)
+        self._up = target_sr // divisor
+        self._down = orig_sr // divisor
+
+        taps = design_lowpass(self._up, self._down)
+        self._delay = len(taps) // 2  # Group delay in upsampled samples
+        num_phase_taps = -(-len(taps) // self._up)  # ceil division
+        padded = np.zeros(num_phase_taps * self._up, dtype=np.float32)
+        padded[: len(taps)] = taps
+        # _phases[p, q] = taps[p + q * up]
+        self._phases = padded.reshape(num_phase_taps, self._up).T.copy()
+        self._tap_offsets = np.arange(num_phase_taps)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the filter history to start a new stream."""
+        num_phase_taps = self._phases.shape[1]
+        self._history = np.zeros(num_phase_taps - 1, dtype=np.float32)
+        self._in_count = 0  # Input samples consumed so far
+        self._out_count = 0  # Output samples produced so far
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk of a stream.
+
+        Args:
+            audio: Input chunk (mono)
+
+        Returns:
+            Resampled chunk as float32
+        """
+        n = len(audio)
+        if n == 0:
+            return np.array([], dtype=np.float32)
+
+        # Convert to float32 while copying in, so non-float32 input isn't copied twice
+        history_len = len(self._history)
+        buffer = np.empty(history_len + n, dtype=np.float32)
+        buffer[:history_len] = self._history
+        buffer[history_len:] = audio
+        base = self._in_count - history_len  # Absolute index of buffer[0]
+        in_total = self._in_count + n
+
+        # Outputs whose newest input sample is already available; output k is
+        # centred on upsampled position k * down, i.e. filter position + delay
+        last = (in_total * self._up - 1 - self._delay) // self._down
+        out_end = max(self._out_count, last + 1)
+        out = np.empty(out_end - self._out_count, dtype=np.float32)
+
+        for start in range(self._out_count, out_end, _BLOCK_SIZE):
+            k = np.arange(start, min(start + _BLOCK_SIZE, out_end))
+            position = k * self._down + self._delay
+            newest = position // self._up - base
+            phase = position % self._up
+
+            window = buffer[newest[:, None] - self._tap_offsets[None, :]]
+            offset = start - self._out_count
+            out[offset : offset + len(k)] = np.einsum("kq,kq->k", window, self._phases[phase])
+
+        # Copy so the history doesn't keep the whole chunk alive
+        self._history = buffer[len(buffer) - history_len :].copy()
+        self._in_count = in_total
+        self._out_count = out_end
+
+        return out
+
+    def flush(self) -> np.ndarray:
+        """
+        Emit the samples held back by the filter delay, ending the stream.
+
+        Together with the preceding ``process`` calls this yields
+        ``ceil(n * target_sr / orig_sr)`` samples for ``n`` input samples.
+        Call ``reset`` before reusing the resampler.
+
+        Returns:
+            Remaining resampled samples as float32
+        """
+        total = -(-self._in_count * self._up // self._down)  # ceil division
+        missing = total - self._out_count
+        if missing <= 0:
+            return np.array([], dtype=np.float32)
+
+        # Feed just enough zeros to make the newest sample of the last output available
+        newest = ((total - 1) * self._down + self._delay) // self._up
+        padding = np.zeros(newest - self._in_count + 1, dtype=np.float32)
+        return self.process(padding)[:missing]
+
+
+def resample_poly(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """
+    Resample a complete signal with a polyphase FIR filter.
+
+    Args:
+        audio: Input audio (mono)
+        orig_sr: Input sample rate
+        target_sr: Output sample rate
+
+    Returns:
+        Resampled audio as float32, aligned with the input
+    """
+    if orig_sr == target_sr:
+        return audio.astype(np.float32, copy=False)
+
+    resampler = PolyphaseResampler(orig_sr, target_sr)
+    head = resampler.process(audio)
+    tail = resampler.flush()
+    return np.concatenate((head, tail)) if len(tail) else head
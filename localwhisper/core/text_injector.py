@@ -5,17 +5,189 @@ Handles inserting transcribed text into the active application.
 Uses clipboard-based injection for smooth, instant text output.
 """
 
+import ctypes
+import os
+import shutil
 import time
 import platform
 import subprocess
 import threading
-from typing import Optional, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Callable, Sequence, Tuple
 
 from pynput.keyboard import Controller, Key
 
+try:
+    from AppKit import NSPasteboard, NSPasteboardTypeString
+
+    HAS_APPKIT = True
+except ImportError:
+    HAS_APPKIT = False
+
+try:
+    import Xlib.threaded  # noqa: F401 - makes the display connection thread-safe
+    from Xlib import X, Xatom, display as xdisplay
+    from Xlib.protocol import event as xevent
+
+    HAS_XLIB = True
+except ImportError:
+    HAS_XLIB = False
+
+IS_WINDOWS = platform.system() == "Windows"
+
+_CF_UNICODETEXT = 13
+_GMEM_MOVEABLE = 0x0002
+_OPEN_CLIPBOARD_ATTEMPTS = 5  # Another app may hold the clipboard briefly
+
+# Time a target app gets to read the clipboard after Ctrl+V before the next
+# queued injection may replace it
+_PASTE_SETTLE_SECONDS = 0.05
+
+_PBCOPY_ENV = {"LANG": "en_US.UTF-8"}
+
+# Clipboard tools tried on Linux, in order
+_LINUX_CLIPBOARD_COMMANDS = (
+    ("xclip", "-selection", "clipboard"),
+    ("xsel", "--clipboard", "--input"),
+    ("wl-copy",),  # Wayland
+)
+
+
+def _is_wayland_session() -> bool:
+    """Check whether the desktop session runs on Wayland."""
+    return os.environ.get("XDG_SESSION_TYPE") == "wayland" or bool(
+        os.environ.get("WAYLAND_DISPLAY")
+    )
+
+
+def _detect_linux_clipboard_commands() -> Tuple[Tuple[str, ...], ...]:
+    """
+    Find the installed Linux clipboard tools.
+
+    Returns:
+        Usable commands, the best fit for the session type (X11 or Wayland) first
+    """
+    wayland = _is_wayland_session()
+    commands = sorted(_LINUX_CLIPBOARD_COMMANDS, key=lambda cmd: (cmd[0] == "wl-copy") != wayland)
+    return tuple(cmd for cmd in commands if shutil.which(cmd[0]))
+
+
+def _prototype(dll, name: str, restype, *argtypes):
+    """Bind a DLL function with explicit argument and return types."""
+    func = getattr(dll, name)
+    func.argtypes = argtypes
+    func.restype = restype
+    return func
+
+
+if IS_WINDOWS:
+    from ctypes import wintypes
+
+    # Private DLL handles, so these prototypes don't leak into other users of
+    # ctypes.windll. Without restype, handles are truncated to 32 bits on Win64.
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _OpenClipboard = _prototype(_user32, "OpenClipboard", wintypes.BOOL, wintypes.HWND)
+    _CloseClipboard = _prototype(_user32, "CloseClipboard", wintypes.BOOL)
+    _EmptyClipboard = _prototype(_user32, "EmptyClipboard", wintypes.BOOL)
+    _SetClipboardData = _prototype(
+        _user32, "SetClipboardData", wintypes.HANDLE, wintypes.UINT, wintypes.HANDLE
+    )
+    _GlobalAlloc = _prototype(
+        _kernel32, "GlobalAlloc", wintypes.HGLOBAL, wintypes.UINT, ctypes.c_size_t
+    )
+    _GlobalLock = _prototype(_kernel32, "GlobalLock", wintypes.LPVOID, wintypes.HGLOBAL)
+    _GlobalUnlock = _prototype(_kernel32, "GlobalUnlock", wintypes.BOOL, wintypes.HGLOBAL)
+    _GlobalFree = _prototype(_kernel32, "GlobalFree", wintypes.HGLOBAL, wintypes.HGLOBAL)
+
+
+class _X11ClipboardOwner:
+    """
+    Holds the X11 CLIPBOARD selection in-process.
+
+    X11 has no clipboard buffer: the selection owner answers each paste
+    request itself. Owning it from a thread of our own makes setting the
+    clipboard a single round trip instead of an xclip/xsel spawn. The
+    selection is lost when the application exits.
+    """
+
+    def __init__(self):
+        """Connect to the X server and start answering selection requests."""
+        self._display = xdisplay.Display()
+        self._window = self._display.screen().root.create_window(0, 0, 1, 1, 0, X.CopyFromParent)
+        self._clipboard = self._display.intern_atom("CLIPBOARD")
+        self._targets = self._display.intern_atom("TARGETS")
+        self._utf8 = self._display.intern_atom("UTF8_STRING")
+        # Larger texts would need the INCR protocol
+        self._max_bytes = self._display.info.max_request_length * 4 - 64
+        self._text = ""
+
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def set_text(self, text: str) -> bool:
+        """
+        Take ownership of the clipboard with the given text.
+
+        Args:
+            text: Text to offer to pasting applications
+
+        Returns:
+            True if we now own the clipboard
+        """
+        if len(text.encode("utf-8")) > self._max_bytes:
+            return False
+        self._text = text
+        self._window.set_selection_owner(self._clipboard, X.CurrentTime)
+        return self._display.get_selection_owner(self._clipboard) == self._window
+
+    def _serve(self) -> None:
+        """Answer paste requests until the connection closes."""
+        while True:
+            try:
+                ev = self._display.next_event()
+            except Exception:
+                return
+            if ev.type == X.SelectionRequest:
+                self._answer(ev)
+
+    def _answer(self, ev) -> None:
+        """Write the requested form of the text to the requestor and notify it."""
+        prop = ev.property or ev.target  # Obsolete clients leave property unset
+        if ev.target == self._targets:
+            ev.requestor.change_property(
+                prop, Xatom.ATOM, 32, [self._targets, self._utf8, Xatom.STRING]
+            )
+        elif ev.target == self._utf8:
+            ev.requestor.change_property(prop, ev.target, 8, self._text.encode("utf-8"))
+        elif ev.target == Xatom.STRING:
+            ev.requestor.change_property(
+                prop, ev.target, 8, self._text.encode("latin-1", "replace")
+            )
+        else:
+            prop = X.NONE  # Refuse other formats
+
+        notify = xevent.SelectionNotify(
+            time=ev.time,
+            requestor=ev.requestor,
+            selection=ev.selection,
+            target=ev.target,
+            property=prop,
+        )
+        ev.requestor.send_event(notify)
+        self._display.flush()
+
+
+def _report_injection_error(future: Future) -> None:
+    """Log an exception raised by a fire-and-forget injection."""
+    error = future.exception()
+    if error:
+        print(f"Text injection error: {error}")
+
 
 class TextInjectorError(Exception):
     """Base exception for text injector errors."""
+
     pass
 
 
@@ -46,6 +218,27 @@ class TextInjector:
         # Platform detection
         self._system = platform.system()
 
+        # In-process X11 clipboard, created on first paste
+        self._x11_owner: Optional[_X11ClipboardOwner] = None
+        self._try_x11_owner = (
+            HAS_XLIB
+            and self._system not in ("Windows", "Darwin")
+            and bool(os.environ.get("DISPLAY"))
+            and not _is_wayland_session()
+        )
+
+        # Linux clipboard commands, detected once, and the one in use
+        self._linux_clip_cmds: Tuple[Tuple[str, ...], ...] = ()
+        if self._system not in ("Windows", "Darwin"):
+            self._linux_clip_cmds = _detect_linux_clipboard_commands()
+        self._linux_clip_cmd: Optional[Tuple[str, ...]] = (
+            self._linux_clip_cmds[0] if self._linux_clip_cmds else None
+        )
+
+        # One background worker, so queued injections run in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inject")
+        self._last_injection = float("-inf")  # Monotonic end time, touched by the worker only
+
         # State
         self._is_typing = False
         self._saved_clipboard: Optional[str] = None
@@ -101,28 +294,16 @@ class TextInjector:
             # Fallback to keyboard simulation if clipboard fails
             return self._inject_via_keyboard(text)
 
-        # Small delay to ensure clipboard is set
-        time.sleep(0.02)
+        # Give the clipboard owner a moment to publish the new content
+        time.sleep(0.005)
 
         # Simulate paste keystroke (Ctrl+V on Windows/Linux, Cmd+V on macOS)
+        modifier = Key.cmd if self._system == "Darwin" else Key.ctrl
         try:
-            if self._system == "Darwin":
-                self._controller.press(Key.cmd)
-                time.sleep(0.01)
-                self._controller.press('v')
-                time.sleep(0.01)
-                self._controller.release('v')
-                self._controller.release(Key.cmd)
-            else:
-                self._controller.press(Key.ctrl)
-                time.sleep(0.01)
-                self._controller.press('v')
-                time.sleep(0.01)
-                self._controller.release('v')
-                self._controller.release(Key.ctrl)
-
-            # Small delay after paste
-            time.sleep(0.05)
+            self._controller.press(modifier)
+            self._controller.press("v")
+            self._controller.release("v")
+            self._controller.release(modifier)
             return True
 
         except Exception as e:
@@ -152,121 +333,113 @@ class TextInjector:
 
     def _set_clipboard_windows(self, text: str) -> bool:
         """Set clipboard on Windows using native API."""
+        for _ in range(_OPEN_CLIPBOARD_ATTEMPTS):
+            if _OpenClipboard(None):
+                break
+            time.sleep(0.01)
+        else:
+            return False
+
         try:
-            import ctypes
-            from ctypes import wintypes
+            _EmptyClipboard()
 
-            # Windows clipboard API
-            user32 = ctypes.windll.user32
-            kernel32 = ctypes.windll.kernel32
+            # Encode text as UTF-16 with a terminating null
+            text_bytes = text.encode("utf-16-le") + b"\x00\x00"
 
-            # Constants
-            CF_UNICODETEXT = 13
-            GMEM_MOVEABLE = 0x0002
+            h_mem = _GlobalAlloc(_GMEM_MOVEABLE, len(text_bytes))
+            if not h_mem:
+                return False
 
-            # Open clipboard
-            if not user32.OpenClipboard(None):
-                return self._set_clipboard_windows_powershell(text)
+            p_mem = _GlobalLock(h_mem)
+            if not p_mem:
+                _GlobalFree(h_mem)
+                return False
 
-            try:
-                # Empty clipboard
-                user32.EmptyClipboard()
+            ctypes.memmove(p_mem, text_bytes, len(text_bytes))
+            _GlobalUnlock(h_mem)
 
-                # Encode text as UTF-16
-                text_bytes = text.encode('utf-16-le') + b'\x00\x00'
+            # On success the system owns the memory
+            if not _SetClipboardData(_CF_UNICODETEXT, h_mem):
+                _GlobalFree(h_mem)
+                return False
 
-                # Allocate global memory
-                h_mem = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(text_bytes))
-                if not h_mem:
-                    return False
+            return True
 
-                # Lock memory and copy text
-                p_mem = kernel32.GlobalLock(h_mem)
-                if not p_mem:
-                    kernel32.GlobalFree(h_mem)
-                    return False
+        finally:
+            _CloseClipboard()
 
-                ctypes.memmove(p_mem, text_bytes, len(text_bytes))
-                kernel32.GlobalUnlock(h_mem)
+    def _set_clipboard_macos(self, text: str) -> bool:
+        """Set clipboard on macOS through NSPasteboard, or pbcopy without pyobjc."""
+        if HAS_APPKIT:
+            pasteboard = NSPasteboard.generalPasteboard()
+            pasteboard.clearContents()
+            if pasteboard.setString_forType_(text, NSPasteboardTypeString):
+                return True
+        return self._pipe_to_command(("pbcopy",), text, env=_PBCOPY_ENV)
 
-                # Set clipboard data
-                if not user32.SetClipboardData(CF_UNICODETEXT, h_mem):
-                    kernel32.GlobalFree(h_mem)
-                    return False
+    def _set_clipboard_linux(self, text: str) -> bool:
+        """
+        Set clipboard on Linux.
 
+        On X11 the selection is owned in-process when python-xlib is
+        available. Otherwise xclip, xsel or wl-copy is used: the tool
+        matching the session type is picked up front, so a paste normally
+        spawns a single process. If it fails the other installed tools are
+        tried, and the one that works is remembered.
+        """
+        if self._try_x11_owner and self._set_clipboard_x11(text):
+            return True
+
+        failed = self._linux_clip_cmd
+        if failed:
+            if self._pipe_to_command(failed, text):
                 return True
+            self._linux_clip_cmd = None
 
-            finally:
-                user32.CloseClipboard()
+        for cmd in self._linux_clip_cmds:
+            if cmd != failed and self._pipe_to_command(cmd, text):
+                self._linux_clip_cmd = cmd
+                return True
 
-        except Exception as e:
-            # Fallback to PowerShell method
-            return self._set_clipboard_windows_powershell(text)
+        return False
 
-    def _set_clipboard_windows_powershell(self, text: str) -> bool:
-        """Fallback: Set clipboard on Windows using PowerShell."""
+    def _set_clipboard_x11(self, text: str) -> bool:
+        """Set clipboard by owning the X11 selection ourselves."""
         try:
-            # Escape special characters for PowerShell
-            escaped_text = text.replace('`', '``').replace('"', '`"').replace('$', '`$')
-
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-
-            process = subprocess.Popen(
-                ['powershell', '-NoProfile', '-Command',
-                 f'Set-Clipboard -Value "{escaped_text}"'],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                startupinfo=startupinfo,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-            process.wait(timeout=2)
-            return process.returncode == 0
+            if self._x11_owner is None:
+                self._x11_owner = _X11ClipboardOwner()
+            return self._x11_owner.set_text(text)
         except Exception as e:
-            print(f"PowerShell clipboard error: {e}")
+            print(f"X11 clipboard unavailable, using clipboard tools: {e}")
+            self._try_x11_owner = False
             return False
 
-    def _set_clipboard_macos(self, text: str) -> bool:
-        """Set clipboard on macOS using pbcopy."""
+    @staticmethod
+    def _pipe_to_command(cmd: Sequence[str], text: str, env: Optional[dict] = None) -> bool:
+        """
+        Run a clipboard command with the text on its stdin.
+
+        Args:
+            cmd: Command and arguments
+            text: Text to write
+            env: Environment for the command, or None to inherit
+
+        Returns:
+            True if the command ran and exited successfully
+        """
         try:
             process = subprocess.Popen(
-                ['pbcopy'],
+                cmd,
                 stdin=subprocess.PIPE,
-                env={'LANG': 'en_US.UTF-8'}
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env,
             )
-            process.communicate(text.encode('utf-8'), timeout=2)
+            process.communicate(text.encode("utf-8"), timeout=2)
             return process.returncode == 0
-        except Exception as e:
-            print(f"macOS clipboard error: {e}")
+        except (OSError, subprocess.SubprocessError):
             return False
 
-    def _set_clipboard_linux(self, text: str) -> bool:
-        """Set clipboard on Linux using xclip or xsel."""
-        # Try xclip first
-        for cmd in [
-            ['xclip', '-selection', 'clipboard'],
-            ['xsel', '--clipboard', '--input'],
-            ['wl-copy'],  # Wayland
-        ]:
-            try:
-                process = subprocess.Popen(
-                    cmd,
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-                process.communicate(text.encode('utf-8'), timeout=2)
-                if process.returncode == 0:
-                    return True
-            except FileNotFoundError:
-                continue
-            except Exception:
-                continue
-
-        return False
-
     def _inject_via_keyboard(self, text: str) -> bool:
         """
         Fallback: Inject text using keyboard simulation.
@@ -299,6 +472,33 @@ class TextInjector:
         """
         self.inject_text(text)
 
+    def inject_text_future(self, text: str) -> "Future[bool]":
+        """
+        Queue text for injection on the background worker.
+
+        Texts are injected one at a time, in the order they were queued. The
+        target app reads the clipboard some time after the paste chord, so
+        each queued injection first waits until the previous one has had
+        ``_PASTE_SETTLE_SECONDS`` to settle; callers are never blocked.
+
+        Args:
+            text: Text to inject
+
+        Returns:
+            Future resolving to the result of inject_text
+        """
+        return self._executor.submit(self._inject_queued, text)
+
+    def _inject_queued(self, text: str) -> bool:
+        """Inject on the worker once the previous paste has had time to be read."""
+        wait = self._last_injection + _PASTE_SETTLE_SECONDS - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            return self.inject_text(text)
+        finally:
+            self._last_injection = time.monotonic()
+
     def inject_text_async(self, text: str) -> None:
         """
         Inject text asynchronously in a background thread.
@@ -306,10 +506,11 @@ class TextInjector:
         Args:
             text: Text to inject
         """
-        def inject_thread():
-            self.inject_text(text)
+        self.inject_text_future(text).add_done_callback(_report_injection_error)
 
-        threading.Thread(target=inject_thread, daemon=True).start()
+    def shutdown(self) -> None:
+        """Stop accepting new text; already queued injections still run."""
+        self._executor.shutdown(wait=False)
 
     @property
     def is_typing(self) -> bool:
@@ -1,26 +1,106 @@
 """
 Transcription Engine for LocalWhisper
 
-Handles speech-to-text transcription using faster-whisper for optimized inference.
+Handles speech-to-text transcription using faster-whisper for optimized inference,
+with openai-whisper available as a fallback backend.
 Supports both GPU (CUDA) and CPU modes with automatic detection.
 """
 
+import os
+import sys
 import threading
 import queue
 import time
-from typing import Optional, Callable, Generator, Tuple, List
+from functools import lru_cache
+from typing import Optional, Callable, Dict, Generator, Iterable, Tuple, List
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 import platform
 
 import numpy as np
 
-from localwhisper.core.config import TranscriptionSettings, get_cache_dir, AVAILABLE_MODELS
+from localwhisper.core.config import (
+    TranscriptionSettings,
+    get_cache_dir,
+    AVAILABLE_MODELS,
+    ModelInfo,
+)
+from localwhisper.core.resampler import resample_poly
+
+# transcribe_streaming commits a settled prefix once this much audio is pending,
+# cut at the quietest frame in the following search span
+_STREAM_COMMIT_SAMPLES = 5 * 16000
+_STREAM_SEARCH_SAMPLES = 16000
+_STREAM_FRAME_SAMPLES = 480  # 30ms
+_STREAM_BUFFER_SAMPLES = 30 * 16000  # Initial capacity for pending streaming audio
+
+# Minimum seconds between partial-text progress callbacks
+_PROGRESS_INTERVAL = 0.1
+
+# Log-probability assumed for segments that don't report one (confidence 0.5)
+_UNKNOWN_LOGPROB = float(np.log(0.5))
+
+# Compute types in order of preference, filtered by what the device supports.
+# int8_float16 runs GEMMs on INT8 tensor cores with FP16 elsewhere; some GPUs
+# reject INT8 entirely, so float types follow. CTranslate2 only reports
+# bfloat16 on Ampere or newer, where it matches FP16 speed with FP32's range.
+_COMPUTE_TYPE_PREFERENCE = {
+    "cuda": ("int8_float16", "bfloat16", "float16", "int8", "float32"),
+    "cpu": ("int8", "float32"),
+}
+
+
+@lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    """
+    Check for a usable CUDA device.
+
+    Probed once per process, since it costs driver calls and possibly a
+    torch import. CTranslate2 is asked first because faster-whisper already
+    loads it; torch is only imported when CTranslate2 isn't installed.
+    """
+    try:
+        import ctranslate2
+
+        return ctranslate2.get_cuda_device_count() > 0
+    except ImportError:
+        pass
+
+    try:
+        import torch
+
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
+
+def _quietest_cut(audio: np.ndarray, start: int, span: int, frame: int) -> int:
+    """
+    Find the quietest frame boundary in a span of audio.
+
+    Args:
+        audio: Audio to search
+        start: First sample of the span
+        span: Length of the span in samples
+        frame: Frame length in samples
+
+    Returns:
+        Sample index of the start of the lowest-energy frame
+    """
+    search = audio[start : start + span]
+    n_frames = len(search) // frame
+    if n_frames == 0:
+        return start
+
+    energy = np.square(search[: n_frames * frame]).reshape(n_frames, frame).sum(axis=1)
+    return start + int(np.argmin(energy)) * frame
 
 
 @dataclass
 class TranscriptionResult:
     """Result of a transcription."""
+
     text: str
     language: str
     confidence: float
@@ -32,6 +112,7 @@ class TranscriptionResult:
 @dataclass
 class TranscriptionSegment:
     """A segment of transcribed text with timing information."""
+
     text: str
     start: float
     end: float
@@ -40,11 +121,13 @@ class TranscriptionSegment:
 
 class TranscriptionEngineError(Exception):
     """Base exception for transcription engine errors."""
+
     pass
 
 
 class ModelNotFoundError(TranscriptionEngineError):
     """Raised when the requested model is not found."""
+
     pass
 
 
@@ -69,15 +152,22 @@ class TranscriptionEngine:
         self.settings = settings or TranscriptionSettings()
 
         self._model = None
+        self._batched_model = None  # faster-whisper BatchedInferencePipeline, if enabled
         self._model_name: Optional[str] = None
         self._is_loaded = False
 
-        # Streaming state
-        self._streaming_buffer: List[np.ndarray] = []
+        # Streaming state: uncommitted audio in a preallocated buffer, plus the
+        # text and duration already committed
+        self._streaming_buffer = np.empty(_STREAM_BUFFER_SAMPLES, dtype=np.float32)
+        self._streaming_samples = 0
+        self._streaming_new_samples = 0  # Appended since the last transcription pass
+        self._committed_texts: List[str] = []
+        self._committed_duration = 0.0
         self._last_transcription = ""
 
         # Callbacks
         self._progress_callback: Optional[Callable[[str, bool], None]] = None
+        self._speech_detector: Optional[Callable[[np.ndarray], float]] = None
 
         # Determine compute device and type
         self._device, self._compute_type = self._detect_compute_config()
@@ -103,13 +193,8 @@ class TranscriptionEngine:
 
     def _detect_device(self) -> str:
         """Detect the best available compute device."""
-        # Check for CUDA
-        try:
-            import torch
-            if torch.cuda.is_available():
-                return "cuda"
-        except ImportError:
-            pass
+        if _cuda_available():
+            return "cuda"
 
         # Check for Apple Silicon (MPS) - faster-whisper doesn't support MPS directly
         # but we can use CPU mode which is still fast on Apple Silicon
@@ -119,21 +204,24 @@ class TranscriptionEngine:
         return "cpu"
 
     def _detect_compute_type(self, device: str) -> str:
-        """Detect the best compute type for the given device."""
-        if device == "cuda":
-            try:
-                import torch
-                # Get GPU memory
-                gpu_mem = torch.cuda.get_device_properties(0).total_memory / (1024**3)
-                if gpu_mem >= 8:
-                    return "float16"
-                else:
-                    return "int8"
-            except Exception:
-                return "int8"
-        else:
-            # CPU mode
-            return "int8"  # int8 is faster on CPU
+        """
+        Detect the best compute type for the given device.
+
+        Asks CTranslate2 which types the device actually supports and picks
+        the fastest one, falling back to its own "auto" choice if the probe
+        isn't available.
+        """
+        try:
+            import ctranslate2
+
+            supported = ctranslate2.get_supported_compute_types(device)
+        except Exception:
+            return "auto"
+
+        for compute_type in _COMPUTE_TYPE_PREFERENCE.get(device, ("float32",)):
+            if compute_type in supported:
+                return compute_type
+        return "auto"
 
     def get_model_path(self, model_name: Optional[str] = None) -> Path:
         """Get the path where a model is/should be stored."""
@@ -149,7 +237,7 @@ class TranscriptionEngine:
     def load_model(
         self,
         model_name: Optional[str] = None,
-        progress_callback: Optional[Callable[[float], None]] = None
+        progress_callback: Optional[Callable[[float], None]] = None,
     ) -> None:
         """
         Load the Whisper model.
@@ -167,53 +255,135 @@ class TranscriptionEngine:
         if self._is_loaded:
             self.unload_model()
 
-        try:
-            from faster_whisper import WhisperModel
+        # Determine model size for English-only optimization
+        if self.settings.language == "en" and name in ["tiny", "base", "small", "medium"]:
+            # Use English-only model for better accuracy
+            actual_model = f"{name}.en"
+        else:
+            actual_model = name
 
-            # Determine model size for English-only optimization
-            if self.settings.language == "en" and name in ["tiny", "base", "small", "medium"]:
-                # Use English-only model for better accuracy
-                actual_model = f"{name}.en"
+        try:
+            if self.settings.backend == "openai":
+                self._model = self._load_openai_model(actual_model)
             else:
-                actual_model = name
-
-            cache_dir = str(get_cache_dir())
-
-            self._model = WhisperModel(
-                actual_model,
-                device=self._device,
-                compute_type=self._compute_type,
-                download_root=cache_dir,
-            )
+                self._model = self._load_faster_whisper_model(actual_model)
+                self._batched_model = self._load_batched_pipeline(self._model)
 
             self._model_name = name
             self._is_loaded = True
 
         except ImportError:
+            package = "openai-whisper" if self.settings.backend == "openai" else "faster-whisper"
             raise TranscriptionEngineError(
-                "faster-whisper is not installed. Install with: pip install faster-whisper"
+                f"{package} is not installed. Install with: pip install {package}"
             )
         except Exception as e:
             raise TranscriptionEngineError(f"Failed to load model: {e}")
 
-    def unload_model(self) -> None:
-        """Unload the current model to free memory."""
+    def _load_faster_whisper_model(self, model_name: str):
+        """Load a CTranslate2 model through faster-whisper (quantized inference)."""
+        from faster_whisper import WhisperModel
+
+        return WhisperModel(
+            model_name,
+            device=self._device,
+            compute_type=self._compute_type,
+            cpu_threads=self._get_cpu_threads(),
+            num_workers=1,  # One dictation stream at a time; all threads go to its GEMMs
+            download_root=str(get_cache_dir()),
+        )
+
+    def _load_batched_pipeline(self, model):
+        """
+        Wrap a faster-whisper model for batched decoding, if configured.
+
+        Returns:
+            BatchedInferencePipeline, or None when batch_size is 1 or the
+            installed faster-whisper predates batching
+        """
+        if self.settings.batch_size <= 1:
+            return None
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            return None
+        return BatchedInferencePipeline(model=model)
+
+    def _load_openai_model(self, model_name: str):
+        """Load a PyTorch model through openai-whisper (fallback backend)."""
+        import torch
+        import whisper
+
+        torch.set_num_threads(self._get_cpu_threads())
+        return whisper.load_model(
+            model_name,
+            device=self._device,
+            download_root=str(get_cache_dir()),
+        )
+
+    def _get_cpu_threads(self) -> int:
+        """
+        Get the number of threads to use for CPU inference.
+
+        Inference gets its own explicitly sized pool, since the process-wide
+        OpenMP default is pinned to one thread for NumPy. One core is left
+        free for audio capture and the UI unless configured otherwise.
+
+        Returns:
+            Thread count (at least 1)
+        """
+        if self.settings.cpu_threads > 0:
+            return self.settings.cpu_threads
+        return max(1, (os.cpu_count() or 2) - 1)
+
+    def warm_up(self) -> None:
+        """
+        Run one inference pass on silence so one-time setup costs are paid up front.
+
+        The first pass through a freshly loaded model allocates buffers and
+        selects kernels; doing it here keeps that latency off the user's first
+        transcription. VAD is bypassed so the encoder and decoder actually run.
+        """
+        if not self._is_loaded:
+            self.load_model()
+
+        audio = np.zeros(16000, dtype=np.float32)
+        try:
+            if self.settings.backend == "openai":
+                self._transcribe_openai(audio)
+            else:
+                segments, _ = self._transcribe_faster_whisper(audio, vad_filter=False)
+                for _ in segments:  # Segments are decoded lazily
+                    pass
+        except Exception as e:
+            raise TranscriptionEngineError(f"Model warm-up failed: {e}")
+
+    def unload_model(self, free_cuda: bool = False) -> None:
+        """
+        Unload the current model to free memory.
+
+        Args:
+            free_cuda: Also hand torch's cached CUDA memory back to the driver,
+                for when another process needs it. By default the cache is
+                kept, so loading the next model reuses it without cudaMalloc.
+        """
         if self._model is not None:
             del self._model
             self._model = None
+            self._batched_model = None
             self._model_name = None
             self._is_loaded = False
 
             # Force garbage collection
             import gc
+
             gc.collect()
 
-            if self._device == "cuda":
-                try:
-                    import torch
-                    torch.cuda.empty_cache()
-                except ImportError:
-                    pass
+            # Only the torch backend leaves memory in torch's CUDA cache; don't
+            # import torch just to empty a cache it never filled
+            torch = sys.modules.get("torch")
+            if free_cuda and self._device == "cuda" and torch is not None:
+                torch.cuda.empty_cache()
 
     def set_progress_callback(self, callback: Callable[[str, bool], None]) -> None:
         """
@@ -224,10 +394,21 @@ class TranscriptionEngine:
         """
         self._progress_callback = callback
 
+    def set_speech_detector(self, detector: Optional[Callable[[np.ndarray], float]]) -> None:
+        """
+        Set the voice activity detector used to skip silence while streaming.
+
+        Args:
+            detector: Function returning the voiced-frame ratio of 16kHz audio
+                (such as AudioEngine.voiced_ratio), or None to transcribe every chunk
+        """
+        self._speech_detector = detector
+
     def transcribe(
         self,
         audio: np.ndarray,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        initial_prompt: Optional[str] = None,
     ) -> TranscriptionResult:
         """
         Transcribe audio to text.
@@ -235,6 +416,7 @@ class TranscriptionEngine:
         Args:
             audio: Audio data as numpy array (float32, mono)
             sample_rate: Sample rate of the audio (default 16000)
+            initial_prompt: Preceding text to condition the decoder on
 
         Returns:
             TranscriptionResult with the transcribed text
@@ -242,52 +424,53 @@ class TranscriptionEngine:
         if not self._is_loaded:
             self.load_model()
 
-        start_time = time.time()
+        if np.ndim(audio) != 1:
+            raise TranscriptionEngineError(
+                f"Expected mono audio as a 1-D array, got shape {np.shape(audio)}"
+            )
 
-        # Ensure audio is the right format
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
+        start_time = time.time()
 
         # Resample if needed (Whisper expects 16kHz)
         if sample_rate != 16000:
             audio = self._resample(audio, sample_rate, 16000)
 
+        # Hand the backend contiguous float32 so it does not copy again internally;
+        # this is a no-op for buffers from AudioEngine, which are already in this layout
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+
         # Calculate audio duration
         audio_duration = len(audio) / 16000
 
         # Transcribe
         try:
-            segments, info = self._model.transcribe(
-                audio,
-                language=self.settings.language if self.settings.language != "auto" else None,
-                beam_size=self.settings.beam_size,
-                vad_filter=self.settings.vad_enabled,
-                vad_parameters={
-                    "threshold": self.settings.vad_threshold,
-                    "min_speech_duration_ms": 250,
-                    "min_silence_duration_ms": 100,
-                },
-            )
+            if self.settings.backend == "openai":
+                segments, language = self._transcribe_openai(audio, initial_prompt)
+            else:
+                segments, language = self._transcribe_faster_whisper(audio, initial_prompt)
 
             # Collect all segments
-            text_parts = []
-            total_confidence = 0
-            segment_count = 0
+            running_text = ""
+            logprobs = []
+            last_progress = 0.0
 
             for segment in segments:
-                text_parts.append(segment.text)
-                # Approximate confidence from avg_logprob
-                confidence = np.exp(segment.avg_logprob) if segment.avg_logprob else 0.5
-                total_confidence += confidence
-                segment_count += 1
+                running_text += segment.text
+                logprobs.append(
+                    segment.avg_logprob if segment.avg_logprob is not None else _UNKNOWN_LOGPROB
+                )
 
-                # Call progress callback for streaming
+                # Call progress callback for streaming, throttled so fast models
+                # don't flood the UI with updates
                 if self._progress_callback:
-                    current_text = "".join(text_parts)
-                    self._progress_callback(current_text.strip(), False)
-
-            full_text = "".join(text_parts).strip()
-            avg_confidence = total_confidence / segment_count if segment_count > 0 else 0.0
+                    now = time.monotonic()
+                    if now - last_progress >= _PROGRESS_INTERVAL:
+                        self._progress_callback(running_text.strip(), False)
+                        last_progress = now
+
+            full_text = running_text.strip()
+            # Approximate confidence from avg_logprob, exponentiated in one pass
+            avg_confidence = float(np.exp(np.asarray(logprobs)).mean()) if logprobs else 0.0
             processing_time = time.time() - start_time
 
             # Final callback
@@ -296,7 +479,7 @@ class TranscriptionEngine:
 
             return TranscriptionResult(
                 text=full_text,
-                language=info.language,
+                language=language,
                 confidence=avg_confidence,
                 duration=audio_duration,
                 processing_time=processing_time,
@@ -306,42 +489,139 @@ class TranscriptionEngine:
         except Exception as e:
             raise TranscriptionEngineError(f"Transcription failed: {e}")
 
-    def transcribe_streaming(
+    def _transcribe_faster_whisper(
+        self,
+        audio: np.ndarray,
+        initial_prompt: Optional[str] = None,
+        vad_filter: Optional[bool] = None,
+    ) -> Tuple[Iterable, str]:
+        """
+        Run faster-whisper on the audio.
+
+        Args:
+            audio: Audio data (float32, 16kHz, mono)
+            initial_prompt: Preceding text to condition the decoder on
+            vad_filter: Override the VAD setting (default from settings)
+
+        Returns:
+            Tuple of (lazy segment iterator, detected language)
+        """
+        if vad_filter is None:
+            vad_filter = self.settings.vad_enabled
+        options = dict(
+            language=self.settings.language if self.settings.language != "auto" else None,
+            beam_size=self.settings.beam_size,
+            initial_prompt=initial_prompt,
+            vad_filter=vad_filter,
+            vad_parameters={
+                "threshold": self.settings.vad_threshold,
+                "min_speech_duration_ms": 250,
+                "min_silence_duration_ms": 100,
+            },
+        )
+
+        # The batched pipeline decodes the VAD-split speech chunks together,
+        # so it needs VAD to find them
+        if self._batched_model is not None and vad_filter:
+            segments, info = self._batched_model.transcribe(
+                audio, batch_size=self.settings.batch_size, **options
+            )
+        else:
+            segments, info = self._model.transcribe(audio, **options)
+        return segments, info.language
+
+    def _transcribe_openai(
         self,
-        audio_chunk: np.ndarray,
-        is_final: bool = False
+        audio: np.ndarray,
+        initial_prompt: Optional[str] = None,
+    ) -> Tuple[Iterable, str]:
+        """
+        Run openai-whisper on the audio.
+
+        Segments are adapted to expose the same ``text``/``avg_logprob``
+        attributes as faster-whisper segments.
+
+        Returns:
+            Tuple of (segments, detected language)
+        """
+        result = self._model.transcribe(
+            audio,
+            language=self.settings.language if self.settings.language != "auto" else None,
+            beam_size=self.settings.beam_size,
+            initial_prompt=initial_prompt,
+            fp16=self._device == "cuda"
+            and self._compute_type in ("auto", "float16", "int8_float16"),
+            verbose=None,
+        )
+        segments = [
+            SimpleNamespace(text=seg["text"], avg_logprob=seg["avg_logprob"])
+            for seg in result["segments"]
+        ]
+        return segments, result["language"]
+
+    def transcribe_streaming(
+        self, audio_chunk: np.ndarray, is_final: bool = False
     ) -> Optional[TranscriptionResult]:
         """
         Process an audio chunk for streaming transcription.
 
-        Accumulates audio and transcribes periodically for low-latency results.
+        Only audio that hasn't been committed is transcribed. Once enough is
+        pending, the prefix up to a pause is transcribed one last time and
+        committed, so the work per chunk stays bounded however long the
+        stream runs.
 
         Args:
-            audio_chunk: Audio chunk to process
+            audio_chunk: Audio chunk to process (float32, 16kHz, mono)
             is_final: Whether this is the final chunk
 
         Returns:
-            TranscriptionResult if transcription was performed, None otherwise
+            TranscriptionResult with the text of the whole stream so far if
+            transcription was performed, None otherwise
         """
-        self._streaming_buffer.append(audio_chunk)
-
-        # Concatenate all chunks
-        full_audio = np.concatenate(self._streaming_buffer)
+        self._append_streaming_audio(audio_chunk)
 
         # Only transcribe if we have enough audio (at least 0.5 seconds)
         # or if this is the final chunk
         min_samples = int(0.5 * 16000)
 
-        if len(full_audio) < min_samples and not is_final:
+        if self._streaming_samples < min_samples and not is_final:
             return None
 
-        # Transcribe
-        result = self.transcribe(full_audio)
+        pending = self._streaming_buffer[: self._streaming_samples]
+
+        # Don't run the encoder again just because silence was appended. The
+        # detector judges whole frames, so audio short of a frame is held until
+        # more arrives, and a partial frame left over is examined next time.
+        new_samples = self._streaming_new_samples
+        if not is_final and self._speech_detector is not None:
+            if new_samples < _STREAM_FRAME_SAMPLES:
+                return None
+            if self._speech_detector(pending[len(pending) - new_samples :]) == 0.0:
+                self._streaming_new_samples = new_samples % _STREAM_FRAME_SAMPLES
+                return None
+        self._streaming_new_samples = 0
+
+        if not is_final and len(pending) >= _STREAM_COMMIT_SAMPLES + _STREAM_SEARCH_SAMPLES:
+            cut = _quietest_cut(
+                pending, _STREAM_COMMIT_SAMPLES, _STREAM_SEARCH_SAMPLES, _STREAM_FRAME_SAMPLES
+            )
+            committed = self.transcribe(pending[:cut], initial_prompt=self._committed_text or None)
+            if committed.text:
+                self._committed_texts.append(committed.text)
+            self._committed_duration += committed.duration
+
+            # Move the short tail to the front of the buffer
+            tail = len(pending) - cut
+            self._streaming_buffer[:tail] = pending[cut:]
+            self._streaming_samples = tail
+            pending = self._streaming_buffer[:tail]
+
+        result = self.transcribe(pending, initial_prompt=self._committed_text or None)
+        result.text = " ".join(filter(None, (self._committed_text, result.text)))
+        result.duration += self._committed_duration
 
         if is_final:
-            # Clear buffer on final
-            self._streaming_buffer.clear()
-            self._last_transcription = ""
+            self.reset_streaming()
         else:
             # Store last transcription for comparison
             self._last_transcription = result.text
@@ -349,25 +629,39 @@ class TranscriptionEngine:
 
         return result
 
+    def _append_streaming_audio(self, audio_chunk: np.ndarray) -> None:
+        """Copy a chunk into the streaming buffer, growing it if a chunk doesn't fit."""
+        end = self._streaming_samples + len(audio_chunk)
+        if end > len(self._streaming_buffer):
+            grown = np.empty(max(end, 2 * len(self._streaming_buffer)), dtype=np.float32)
+            grown[: self._streaming_samples] = self._streaming_buffer[: self._streaming_samples]
+            self._streaming_buffer = grown
+        self._streaming_buffer[self._streaming_samples : end] = audio_chunk
+        self._streaming_samples = end
+        self._streaming_new_samples += len(audio_chunk)
+
+    @property
+    def _committed_text(self) -> str:
+        """Text of the streaming audio committed so far."""
+        return " ".join(self._committed_texts)
+
     def reset_streaming(self) -> None:
         """Reset the streaming buffer."""
-        self._streaming_buffer.clear()
+        self._streaming_samples = 0
+        self._streaming_new_samples = 0
+        self._committed_texts.clear()
+        self._committed_duration = 0.0
         self._last_transcription = ""
 
     def _resample(self, audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
-        """Resample audio to target sample rate."""
+        """Resample audio to target sample rate with a band-limited polyphase filter."""
         if orig_sr == target_sr:
             return audio
+        return resample_poly(audio, orig_sr, target_sr)
 
-        # Simple resampling using linear interpolation
-        duration = len(audio) / orig_sr
-        target_length = int(duration * target_sr)
-        indices = np.linspace(0, len(audio) - 1, target_length)
-        return np.interp(indices, np.arange(len(audio)), audio).astype(np.float32)
-
-    def get_available_models(self) -> dict:
+    def get_available_models(self) -> Dict[str, ModelInfo]:
         """Get information about available models."""
-        return AVAILABLE_MODELS.copy()
+        return dict(AVAILABLE_MODELS)
 
     @property
     def is_loaded(self) -> bool:
@@ -398,3 +692,131 @@ class TranscriptionEngine:
         """Context manager exit."""
         self.unload_model()
         return False
+
+
+class TranscriptionSession:
+    """
+    Incremental transcription of a recording in progress.
+
+    Captured audio is cut into windows that are transcribed while the user is
+    still speaking, so only the unprocessed tail is left when recording stops.
+    Cuts are placed at the quietest frame near the window boundary to avoid
+    splitting words, and each window is conditioned on the text so far.
+
+    ``feed`` is called from the audio thread; ``transcribe_window`` and
+    ``finish`` are meant to run in order on a single worker thread.
+    """
+
+    def __init__(
+        self,
+        engine: TranscriptionEngine,
+        window_seconds: float = 5.0,
+        search_seconds: float = 1.0,
+        sample_rate: int = 16000,
+    ):
+        """
+        Initialize the session.
+
+        Args:
+            engine: Transcription engine used for each window
+            window_seconds: Minimum length of a window before it is cut
+            search_seconds: Span after the minimum length searched for a quiet cut point
+            sample_rate: Sample rate of the fed audio
+        """
+        self._engine = engine
+        self._sample_rate = sample_rate
+        self._window_samples = int(window_seconds * sample_rate)
+        self._search_samples = int(search_seconds * sample_rate)
+        self._frame_samples = int(0.03 * sample_rate)
+
+        self._pending: List[np.ndarray] = []
+        self._pending_samples = 0
+        self._lock = threading.Lock()
+
+        self._texts: List[str] = []
+        self._error: Optional[TranscriptionEngineError] = None
+        self._cancelled = False
+
+    def feed(self, audio_chunk: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Add captured audio to the session.
+
+        Args:
+            audio_chunk: Audio chunk (float32, mono)
+
+        Returns:
+            A window ready to be transcribed, or None if more audio is needed
+        """
+        with self._lock:
+            self._pending.append(audio_chunk)
+            self._pending_samples += len(audio_chunk)
+
+            if self._pending_samples < self._window_samples + self._search_samples:
+                return None
+
+            audio = np.concatenate(self._pending)
+            cut = self._find_cut(audio)
+            self._pending = [audio[cut:]]
+            self._pending_samples = len(audio) - cut
+            return audio[:cut]
+
+    def _find_cut(self, audio: np.ndarray) -> int:
+        """Find the quietest frame boundary in the search span after the window."""
+        return _quietest_cut(audio, self._window_samples, self._search_samples, self._frame_samples)
+
+    def transcribe_window(self, audio: np.ndarray) -> None:
+        """
+        Transcribe a window and append its text to the session.
+
+        Errors are kept and re-raised by ``finish``. Windows still queued
+        when the session is cancelled are skipped.
+        """
+        if self._error is not None or self._cancelled:
+            return
+
+        try:
+            result = self._engine.transcribe(
+                audio,
+                sample_rate=self._sample_rate,
+                initial_prompt=self.text or None,
+            )
+        except TranscriptionEngineError as e:
+            self._error = e
+            return
+
+        if result.text:
+            self._texts.append(result.text)
+
+    def cancel(self) -> None:
+        """Discard the recording so windows that haven't started are skipped."""
+        self._cancelled = True
+
+    def finish(self, min_tail_samples: int = 1600) -> str:
+        """
+        Transcribe the remaining tail and return the full text.
+
+        Args:
+            min_tail_samples: Tails shorter than this are dropped
+
+        Returns:
+            The transcription of the whole recording
+        """
+        with self._lock:
+            tail = (
+                np.concatenate(self._pending) if self._pending else np.array([], dtype=np.float32)
+            )
+            self._pending.clear()
+            self._pending_samples = 0
+
+        if len(tail) >= min_tail_samples:
+            self.transcribe_window(tail)
+
+        if self._error is not None:
+            raise self._error
+
+        return self.text
+
+    @property
+    def text(self) -> str:
+        """Get the text transcribed so far."""
+        return " ".join(self._texts)
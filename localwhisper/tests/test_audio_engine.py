@@ -0,0 +1,99 @@
+"""
+Tests for Audio Engine
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+
+from localwhisper.core import audio_engine
+from localwhisper.core.audio_engine import AudioEngine
+from localwhisper.core.config import AudioSettings
+
+
+@pytest.fixture
+def engine():
+    """Create an AudioEngine without touching real audio hardware."""
+    with (
+        patch.object(audio_engine, "HAS_SOUNDDEVICE", True),
+        patch.object(audio_engine, "HAS_WEBRTCVAD", False),
+    ):
+        yield AudioEngine(AudioSettings())
+
+
+class TestVoicedRatio:
+    """Tests for the speech gate."""
+
+    def test_silence_has_no_voiced_frames(self, engine):
+        """Digital silence should not count as speech."""
+        audio = np.zeros(16000, dtype=np.float32)
+        assert engine.voiced_ratio(audio) == 0.0
+
+    def test_low_noise_is_not_speech(self, engine, sample_audio):
+        """Low-level background noise should stay below the gate."""
+        assert engine.voiced_ratio(sample_audio) < 0.15
+
+    def test_speech_is_voiced(self, engine, sample_speech_audio):
+        """Speech-like signal should be detected as voiced."""
+        assert engine.voiced_ratio(sample_speech_audio) > 0.9
+
+    def test_too_short_audio(self, engine):
+        """Audio shorter than one frame should report no speech."""
+        audio = np.ones(100, dtype=np.float32)
+        assert engine.voiced_ratio(audio) == 0.0
+
+    def test_webrtc_vad_frames(self, engine):
+        """Should pass each 30ms frame to WebRTC VAD as 16-bit PCM."""
+        engine._vad = Mock()
+        engine._vad.is_speech.side_effect = lambda buf, rate: bytes(buf)[:2] != b"\0\0"
+        audio = np.zeros(480 * 4, dtype=np.float32)
+        audio[480:960] = 0.5
+
+        assert engine.voiced_ratio(audio) == 0.25
+        calls = engine._vad.is_speech.call_args_list
+        assert [len(c.args[0]) for c in calls] == [960] * 4
+        assert bytes(calls[1].args[0]) == np.full(480, 16383, dtype=np.int16).tobytes()
+
+
+class TestAudioBuffer:
+    """Tests for the capture ring buffer."""
+
+    def test_ingest_applies_gain(self, engine):
+        """Should store gained samples and report their amplitude."""
+        engine.settings.gain = 2.0
+        amplitude = engine._ingest(np.full(1600, 0.1, dtype=np.float32))
+
+        np.testing.assert_allclose(engine.get_current_audio(), 0.2)
+        assert amplitude == pytest.approx(0.6)
+        assert engine.samples_captured == 1600
+
+    def test_wraparound_keeps_latest_audio(self, engine):
+        """Should keep the newest 30 seconds in order after wrapping."""
+        chunk = 16000
+        for i in range(32):
+            engine._ingest(np.full(chunk, i, dtype=np.float32))
+
+        audio = engine.get_current_audio()
+        assert len(audio) == 30 * 16000
+        assert audio[0] == 2
+        assert audio[-1] == 31
+        assert engine.buffer_duration == pytest.approx(30.0)
+
+    def test_get_recent_audio(self, engine):
+        """Should return exactly the requested tail, across the wrap point."""
+        engine._write = len(engine._ring) - 4000
+        engine._ingest(np.arange(8000, dtype=np.float32))
+
+        recent = engine.get_recent_audio(0.5)
+        np.testing.assert_array_equal(recent, np.arange(8000, dtype=np.float32))
+
+    def test_get_recent_audio_short_buffer(self, engine):
+        """Should return everything when less audio than requested is buffered."""
+        engine._ingest(np.ones(1000, dtype=np.float32))
+        assert len(engine.get_recent_audio(0.5)) == 1000
+
+    def test_ingest_strided_channel_view(self, engine):
+        """Should ingest one channel of interleaved frames without a copy."""
+        frames = np.array([1, -1, 2, -2, 3, -3], dtype=np.float32)
+        engine._ingest(frames[::2])
+        np.testing.assert_array_equal(engine.get_current_audio(), [1, 2, 3])
@@ -0,0 +1,234 @@
+"""
+Tests for Audio Feedback
+"""
+
+import threading
+
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+
+from localwhisper.core import audio_feedback
+from localwhisper.core.audio_feedback import AudioFeedback
+from localwhisper.core.config import FeedbackSettings
+
+
+@pytest.fixture
+def feedback():
+    """Create an AudioFeedback instance."""
+    return AudioFeedback(FeedbackSettings(sound_volume=1.0))
+
+
+@pytest.fixture
+def sounddevice_feedback():
+    """Create an AudioFeedback instance using the sounddevice backend."""
+
+    def setup_player(self):
+        self._backend = "sounddevice"
+
+    with patch.object(AudioFeedback, "_setup_player", setup_player):
+        feedback = AudioFeedback()
+    yield feedback
+    feedback.shutdown()
+
+
+class TestGenerateTone:
+    """Tests for tone synthesis."""
+
+    def test_length(self, feedback):
+        """Should produce 16-bit samples for the requested duration."""
+        samples = feedback._generate_tone(440, 0.1, sample_rate=44100)
+        assert len(samples) == 4410
+        assert samples.dtype == np.int16
+
+    def test_fades_to_silence(self, feedback):
+        """Should start at zero and ramp up through the fade."""
+        samples = feedback._generate_tone(440, 0.1)
+        fade = AudioFeedback.SAMPLE_RATE // 100  # 10ms
+        assert samples[0] == 0
+        assert np.abs(samples[:fade]).max() < np.abs(samples[fade:-fade]).max()
+
+    def test_volume_scaling(self, feedback):
+        """Should peak at 30% of full scale at maximum volume."""
+        samples = feedback._generate_tone(440, 0.1)
+        assert np.abs(samples).max() == pytest.approx(0.3 * 32767, rel=0.01)
+
+    def test_zero_volume_is_silent(self, feedback):
+        """Should produce silence at zero volume."""
+        feedback.settings.sound_volume = 0.0
+        samples = feedback._generate_tone(440, 0.1)
+        assert not samples.any()
+
+    def test_without_fade(self, feedback):
+        """Should start at full level when fading is disabled."""
+        samples = feedback._generate_tone(440, 0.1, fade=False)
+        assert samples[0] == 0  # sin(0)
+        assert abs(samples[10]) > 0.3 * 32767 * 0.5
+
+    def test_tones_are_shared_read_only(self, feedback):
+        """Should reuse identical tones across calls and protect them from writes."""
+        first = feedback._generate_tone(660, 0.1)
+        assert feedback._generate_tone(660, 0.1) is first
+        with pytest.raises(ValueError):
+            first[0] = 1
+
+
+class TestToneCache:
+    """Tests for caching of synthesized sounds."""
+
+    def test_sounds_prepared_on_init(self, sounddevice_feedback):
+        """Should synthesize every sound before the first play."""
+        names = {name for name, _ in sounddevice_feedback._tone_cache}
+        assert names == {"start", "stop", "error", "success"}
+
+    def test_reuses_sound(self, feedback):
+        """Should synthesize each sound only once per volume."""
+        first = feedback._get_sound("start", feedback._generate_start_sound)
+        second = feedback._get_sound("start", lambda: pytest.fail("regenerated"))
+        assert first is second
+
+    def test_volume_change_regenerates(self, feedback):
+        """Should synthesize again after the volume changes."""
+        loud = feedback._get_sound("error", lambda: feedback._generate_tone(220, 0.15))
+        feedback.set_volume(0.25)
+        quiet = feedback._get_sound("error", lambda: feedback._generate_tone(220, 0.15))
+        assert np.abs(quiet).max() < np.abs(loud).max()
+
+
+class TestPlaybackWorker:
+    """Tests for the playback worker thread."""
+
+    def test_no_backend_no_worker(self):
+        """Should not start a worker when no playback backend is installed."""
+        with (
+            patch.object(audio_feedback, "HAS_SOUNDDEVICE", False),
+            patch.object(audio_feedback, "HAS_PYAUDIO", False),
+            patch.object(audio_feedback, "HAS_WINSOUND", False),
+        ):
+            feedback = AudioFeedback()
+
+        assert feedback._backend is None
+        assert feedback._worker is None
+        feedback.play_start()  # Should be a silent no-op
+
+    def test_plays_on_worker_thread(self, sounddevice_feedback):
+        """Should play queued sounds on the worker, not the caller's thread."""
+        played = threading.Event()
+        threads = []
+
+        def play(audio_data):
+            threads.append(threading.current_thread())
+            played.set()
+
+        with patch.object(sounddevice_feedback, "_play_sounddevice", play):
+            sounddevice_feedback.play_start()
+            assert played.wait(timeout=1.0)
+
+        assert threads == [sounddevice_feedback._worker]
+
+    def test_drops_sounds_when_queue_full(self, sounddevice_feedback):
+        """Should drop sounds instead of blocking when the worker is busy."""
+        release = threading.Event()
+
+        with patch.object(sounddevice_feedback, "_play_sounddevice", lambda a: release.wait()):
+            for _ in range(AudioFeedback.MAX_QUEUED_SOUNDS + 3):
+                sounddevice_feedback.play_stop()
+            assert sounddevice_feedback._queue.qsize() <= AudioFeedback.MAX_QUEUED_SOUNDS
+            release.set()
+
+    def test_winsound_skips_synthesis(self):
+        """Should beep without synthesizing samples on the winsound backend."""
+
+        def setup_player(self):
+            self._backend = "winsound"
+
+        with patch.object(AudioFeedback, "_setup_player", setup_player):
+            feedback = AudioFeedback()
+
+        with patch.object(feedback, "_enqueue") as enqueue:
+            feedback.play_error()
+
+        enqueue.assert_called_once_with(feedback._play_winsound, 220, 150)
+        assert not feedback._tone_cache
+        feedback.shutdown()
+
+    def test_shutdown_stops_worker(self, sounddevice_feedback):
+        """Should stop the worker thread on shutdown."""
+        worker = sounddevice_feedback._worker
+        sounddevice_feedback.shutdown()
+        assert not worker.is_alive()
+
+
+class TestTwoTone:
+    """Tests for the two-tone start/stop sounds."""
+
+    def test_start_is_ascending(self, feedback):
+        """Should play 440Hz then 550Hz."""
+        audio = feedback._generate_start_sound()
+        half = len(audio) // 2
+        assert half == AudioFeedback.SAMPLE_RATE // 20
+        np.testing.assert_array_equal(audio[:half], feedback._generate_tone(440, 0.05))
+        np.testing.assert_array_equal(audio[half:], feedback._generate_tone(550, 0.05))
+
+    def test_stop_mirrors_start(self, feedback):
+        """Should play the start tones in reverse order."""
+        start = feedback._generate_start_sound()
+        stop = feedback._generate_stop_sound()
+        half = len(start) // 2
+        np.testing.assert_array_equal(stop[:half], start[half:])
+        np.testing.assert_array_equal(stop[half:], start[:half])
+
+
+class TestEnabled:
+    """Tests for enabling and disabling sounds."""
+
+    def test_disabled_plays_nothing(self, sounddevice_feedback):
+        """Should not queue sounds when disabled."""
+        sounddevice_feedback.set_enabled(False)
+        sounddevice_feedback.play_start()
+        assert sounddevice_feedback._queue.empty()
+
+    def test_settings_replacement_updates_enabled(self, feedback):
+        """Should pick up sound_enabled from replaced settings."""
+        feedback.settings = FeedbackSettings(sound_enabled=False)
+        assert not feedback._enabled
+        feedback.settings = FeedbackSettings(sound_enabled=True)
+        assert feedback._enabled
+
+
+class TestPyAudioBackend:
+    """Tests for the PyAudio playback backend."""
+
+    @pytest.fixture
+    def pyaudio_module(self):
+        """Patch in a mock PyAudio module."""
+        module = Mock()
+        with (
+            patch.object(audio_feedback, "HAS_SOUNDDEVICE", False),
+            patch.object(audio_feedback, "HAS_PYAUDIO", True),
+            patch.object(audio_feedback, "pyaudio", module, create=True),
+        ):
+            yield module
+
+    def test_reuses_output_stream(self, pyaudio_module):
+        """Should open one output stream and write every sound to it."""
+        feedback = AudioFeedback()
+        stream = pyaudio_module.PyAudio.return_value.open.return_value
+
+        feedback._play_pyaudio(feedback._get_sound("start", feedback._generate_start_sound))
+        feedback._play_pyaudio(feedback._get_sound("stop", feedback._generate_stop_sound))
+
+        pyaudio_module.PyAudio.return_value.open.assert_called_once()
+        assert stream.write.call_count == 2
+        # PyAudio's write only accepts read-only bytes, not buffer views
+        assert all(type(c.args[0]) is bytes for c in stream.write.call_args_list)
+        feedback.shutdown()
+        stream.close.assert_called_once()
+
+    def test_stream_open_failure_disables_feedback(self, pyaudio_module):
+        """Should fall back to no sound when the output stream can't be opened."""
+        pyaudio_module.PyAudio.return_value.open.side_effect = OSError("no device")
+        feedback = AudioFeedback()
+
+        assert feedback._backend is None
+        assert feedback._worker is None
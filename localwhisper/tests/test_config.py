@@ -6,6 +6,7 @@ import pytest
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from localwhisper.core.config import (
     Config,
@@ -20,6 +21,7 @@ from localwhisper.core.config import (
     get_data_dir,
     get_cache_dir,
     AVAILABLE_MODELS,
+    ModelInfo,
 )
 
 
@@ -41,6 +43,14 @@ class TestConfigDirectories:
         result = get_cache_dir()
         assert isinstance(result, Path)
 
+    def test_directories_are_memoized(self):
+        """Directory lookups should be resolved once per process."""
+        with patch("platform.system") as system:
+            get_config_dir()
+            get_data_dir()
+            get_cache_dir()
+            system.assert_not_called()
+
 
 class TestAudioSettings:
     """Tests for AudioSettings dataclass."""
@@ -54,6 +64,7 @@ class TestAudioSettings:
         assert settings.input_device is None
         assert settings.gain == 1.0
         assert settings.noise_reduction is True
+        assert settings.min_voiced_ratio == 0.15
 
     def test_custom_values(self):
         """AudioSettings should accept custom values."""
@@ -75,9 +86,11 @@ class TestTranscriptionSettings:
         settings = TranscriptionSettings()
         assert settings.model_name == "turbo"
         assert settings.language == "en"
+        assert settings.backend == "faster-whisper"
         assert settings.compute_type == "auto"
         assert settings.device == "auto"
         assert settings.beam_size == 5
+        assert settings.cpu_threads == 0
         assert settings.vad_enabled is True
         assert settings.vad_threshold == 0.5
 
@@ -86,6 +99,12 @@ class TestTranscriptionSettings:
         settings = TranscriptionSettings(model_name="small.en")
         assert settings.model_name == "small.en"
 
+    def test_openai_backend(self):
+        """TranscriptionSettings should accept the openai-whisper fallback backend."""
+        settings = TranscriptionSettings(backend="openai", compute_type="float32")
+        assert settings.backend == "openai"
+        assert settings.compute_type == "float32"
+
 
 class TestHotkeySettings:
     """Tests for HotkeySettings dataclass."""
@@ -159,6 +178,85 @@ class TestConfig:
             assert loaded.hotkey.activation_key == "ctrl+shift+t"
             assert loaded.ui.accent_color == "#FF0000"
 
+    def test_load_sees_external_changes(self):
+        """Config.load should re-read the file when it changes on disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "test_config.json"
+
+            config = Config()
+            config._config_path = config_path
+            config.save()
+            assert Config.load(config_path).ui.accent_color == "#3B82F6"
+
+            data = json.loads(config_path.read_text())
+            data["ui"]["accent_color"] = "#10B981AA"
+            config_path.write_text(json.dumps(data))
+
+            assert Config.load(config_path).ui.accent_color == "#10B981AA"
+
+    def test_load_returns_independent_configs(self):
+        """Cached loads should not share settings objects."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "test_config.json"
+
+            config = Config()
+            config._config_path = config_path
+            config.save()
+
+            first = Config.load(config_path)
+            first.ui.accent_color = "#FF0000"
+            second = Config.load(config_path)
+            assert second.ui.accent_color == "#3B82F6"
+
+    def test_save_skips_unchanged(self):
+        """Config.save should not rewrite the file when nothing changed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "test_config.json"
+
+            config = Config()
+            config._config_path = config_path
+            config.save()
+
+            loaded = Config.load(config_path)
+            with patch("os.replace") as replace:
+                config.save()
+                loaded.save()
+                replace.assert_not_called()
+
+                loaded.ui.accent_color = "#FF0000"
+                loaded.save()
+                replace.assert_called_once()
+
+    def test_save_is_atomic(self):
+        """Config.save should replace the file without leaving a temp file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "test_config.json"
+
+            config = Config()
+            config._config_path = config_path
+            config.save()
+            config.ui.accent_color = "#FF0000"
+            config.save()
+
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["test_config.json"]
+            assert Config.load(config_path).ui.accent_color == "#FF0000"
+
+    def test_save_without_orjson(self):
+        """Config should round-trip through the stdlib JSON fallback."""
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("localwhisper.core.config.HAS_ORJSON", False),
+        ):
+            config_path = Path(tmpdir) / "test_config.json"
+
+            config = Config()
+            config._config_path = config_path
+            config.ui.accent_color = "#FF0000"
+            config.save()
+
+            assert json.loads(config_path.read_text())["ui"]["accent_color"] == "#FF0000"
+            assert Config.load(config_path).ui.accent_color == "#FF0000"
+
     def test_reset_to_defaults(self):
         """Config should reset to defaults."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -202,9 +300,13 @@ class TestAvailableModels:
     def test_model_properties(self):
         """Each model should have required properties."""
         for model_name, info in AVAILABLE_MODELS.items():
-            assert "size_mb" in info
-            assert "vram_gb" in info
-            assert "relative_speed" in info
-            assert "english_only" in info
-            assert isinstance(info["size_mb"], int)
-            assert isinstance(info["english_only"], bool)
+            assert isinstance(info, ModelInfo)
+            assert isinstance(info.size_mb, int)
+            assert isinstance(info.vram_gb, int)
+            assert isinstance(info.relative_speed, int)
+            assert isinstance(info.english_only, bool)
+
+    def test_models_read_only(self):
+        """AVAILABLE_MODELS should not be mutable."""
+        with pytest.raises(TypeError):
+            AVAILABLE_MODELS["custom"] = ModelInfo(1, 1, 1, False)
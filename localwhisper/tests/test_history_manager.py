@@ -3,10 +3,13 @@ Tests for History Manager
 """
 
 import pytest
+import sqlite3
 import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
+from localwhisper.core import history_manager as history_manager_module
 from localwhisper.core.history_manager import (
     HistoryManager,
     HistoryEntry,
@@ -57,16 +60,29 @@ class TestHistoryEntry:
 
     def test_from_row(self):
         """Should create from database row."""
-        row = (1, "Test text", "2024-01-15T10:30:00", 3.0, 0.9, "en", "turbo")
+        ts = datetime(2024, 1, 15, 10, 30, 0, 250)
+        row = (1, "Test text", round(ts.timestamp() * 1_000_000), 3.0, 0.9, "en", "turbo")
         entry = HistoryEntry.from_row(row)
 
         assert entry.id == 1
+        assert entry.timestamp == ts
         assert entry.text == "Test text"
         assert entry.duration == 3.0
         assert entry.confidence == 0.9
         assert entry.language == "en"
         assert entry.model == "turbo"
 
+    def test_immutable_and_slotted(self):
+        """Should be frozen and carry no per-instance __dict__."""
+        import dataclasses
+
+        row = (1, "Test text", 0, 3.0, 0.9, "en", "turbo")
+        entry = HistoryEntry.from_row(row)
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            entry.text = "changed"
+
 
 class TestHistoryManager:
     """Tests for HistoryManager class."""
@@ -85,6 +101,68 @@ class TestHistoryManager:
         assert entry.text == "Test transcription"
         assert entry.duration == 2.5
 
+    def test_add_entries(self, history_manager):
+        """Should store a batch and assign consecutive IDs."""
+        history_manager.add_entry(
+            text="Existing",
+            duration=1.0,
+            confidence=0.9,
+            language="en",
+            model="turbo",
+        )
+        batch = [
+            HistoryEntry(
+                id=None,
+                text=f"Batch {i}",
+                timestamp=datetime(2024, 1, 15, 10, i),
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+            for i in range(3)
+        ]
+
+        stored = history_manager.add_entries(batch)
+
+        assert [e.id for e in stored] == [2, 3, 4]
+        for entry in stored:
+            assert history_manager.get_entry(entry.id).text == entry.text
+        assert len(history_manager.search("Batch")) == 3
+
+    def test_add_entries_bulk_indexes_fts(self, history_manager):
+        """Should index a large batch for search and keep the insert trigger."""
+        count = history_manager_module.BULK_FTS_THRESHOLD + 1
+        stored = history_manager.add_entries(
+            HistoryEntry(
+                id=None,
+                text=f"Imported {'needle' if i % 2 else 'hay'} {i}",
+                timestamp=datetime(2024, 1, 15, 10, 0),
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+            for i in range(count)
+        )
+
+        assert len(stored) == count
+        assert len(history_manager.search("needle", limit=count)) == count // 2
+        assert len(history_manager.search("imported", limit=count)) == count
+
+        history_manager.add_entry(
+            text="needle later",
+            duration=1.0,
+            confidence=0.9,
+            language="en",
+            model="turbo",
+        )
+        assert len(history_manager.search("later")) == 1
+
+    def test_add_entries_empty(self, history_manager):
+        """Should accept an empty batch."""
+        assert history_manager.add_entries([]) == []
+
     def test_get_entry(self, history_manager):
         """Should retrieve entry by ID."""
         entry = history_manager.add_entry(
@@ -121,6 +199,22 @@ class TestHistoryManager:
         # Should be in reverse chronological order
         assert "Entry 4" in entries[0].text
 
+    def test_get_recent_offset(self, history_manager):
+        """Should page newest first, breaking timestamp ties by ID."""
+        ts = datetime(2024, 1, 15, 10, 30)
+        for i in range(5):
+            history_manager.add_entry(
+                text=f"Entry {i}",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+                timestamp=ts,
+            )
+
+        entries = history_manager.get_recent(limit=2, offset=1)
+        assert [e.text for e in entries] == ["Entry 3", "Entry 2"]
+
     def test_search(self, history_manager):
         """Should search entries by text."""
         history_manager.add_entry(
@@ -142,6 +236,47 @@ class TestHistoryManager:
         assert len(results) == 1
         assert "fox" in results[0].text
 
+    def test_search_ignores_diacritics(self, history_manager):
+        """Should match accented text without the accents and vice versa."""
+        entry = history_manager.add_entry(
+            text="Meet at the café",
+            duration=1.0,
+            confidence=0.9,
+            language="en",
+            model="turbo",
+        )
+
+        assert [e.id for e in history_manager.search("cafe")] == [entry.id]
+        assert [e.id for e in history_manager.search("CAFÉ")] == [entry.id]
+
+    def test_search_phrase(self, history_manager):
+        """Should support quoted phrases and words that split into several tokens."""
+        for text in ("hello world", "world hello", "un café—au lait"):
+            history_manager.add_entry(
+                text=text,
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+
+        assert [e.text for e in history_manager.search('"hello world"')] == ["hello world"]
+        assert [e.text for e in history_manager.search("café—au")] == ["un café—au lait"]
+
+    def test_search_ranking_and_limit(self, history_manager):
+        """Should return the best matches first, up to the limit."""
+        for text in ("fox", "fox fox fox", "dog", "a fox among many other words here"):
+            history_manager.add_entry(
+                text=text,
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+
+        results = history_manager.search("fox", limit=2)
+        assert [r.text for r in results] == ["fox fox fox", "fox"]
+
     def test_delete_entry(self, history_manager):
         """Should delete entry."""
         entry = history_manager.add_entry(
@@ -187,6 +322,67 @@ class TestHistoryManager:
         assert stats["average_confidence"] == pytest.approx(0.85, rel=0.01)
         assert "total_duration_formatted" in stats
 
+    def test_statistics_follow_deletes(self, history_manager):
+        """Should keep running totals in step with inserts and deletes."""
+        first = history_manager.add_entry(
+            text="Bonjour",
+            duration=4.0,
+            confidence=0.5,
+            language="fr",
+            model="turbo",
+        )
+        for _ in range(2):
+            history_manager.add_entry(
+                text="Hello",
+                duration=1.0,
+                confidence=1.0,
+                language="en",
+                model="turbo",
+            )
+        history_manager.add_entry(
+            text="Old",
+            duration=1.0,
+            confidence=1.0,
+            language="en",
+            model="turbo",
+            timestamp=datetime.now() - timedelta(days=2),
+        )
+        history_manager.delete_entry(first.id)
+
+        stats = history_manager.get_statistics()
+        assert stats["total_entries"] == 3
+        assert stats["total_duration_seconds"] == pytest.approx(3.0)
+        assert stats["average_confidence"] == pytest.approx(1.0)
+        assert stats["entries_today"] == 2
+        assert stats["most_used_language"] == "en"
+
+        history_manager.clear_all()
+        stats = history_manager.get_statistics()
+        assert stats["total_entries"] == 0
+        assert stats["total_duration_seconds"] == 0
+        assert stats["most_used_language"] is None
+
+    def test_most_used_language_without_table_scan(self, history_manager):
+        """Should answer the top language from the per-language counters."""
+        for language in ("en", "de", "de"):
+            history_manager.add_entry(
+                text="Hi",
+                duration=1.0,
+                confidence=0.9,
+                language=language,
+                model="turbo",
+            )
+        assert history_manager.get_statistics()["most_used_language"] == "de"
+
+        with history_manager._get_cursor() as cursor:
+            cursor.execute("UPDATE history SET language = 'en' WHERE language = 'de'")
+        assert history_manager.get_statistics()["most_used_language"] == "en"
+
+        plan = history_manager._connection.execute(
+            "EXPLAIN QUERY PLAN " + history_manager_module._TOP_LANGUAGE_SQL
+        ).fetchall()
+        assert all("history_lang_counts" in row[-1] or "B-TREE" in row[-1] for row in plan)
+
     def test_clear_all(self, history_manager):
         """Should clear all entries."""
         for i in range(3):
@@ -204,6 +400,39 @@ class TestHistoryManager:
         entries = history_manager.get_recent()
         assert len(entries) == 0
 
+    def test_prune(self, history_manager):
+        """Should drop expired entries and everything past max_entries."""
+        history_manager.settings = HistorySettings(retention_days=30, max_entries=2)
+        now = datetime.now()
+        for i, age in enumerate((60, 3, 2, 1)):
+            history_manager.add_entry(
+                text=f"Entry {i}",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+                timestamp=now - timedelta(days=age),
+            )
+
+        assert history_manager.prune() == 2
+        assert [e.text for e in history_manager.get_recent()] == ["Entry 3", "Entry 2"]
+
+    def test_enforce_max_entries(self, history_manager):
+        """Should delete only the oldest entries over the limit."""
+        history_manager.settings = HistorySettings(max_entries=3)
+        for i in range(5):
+            history_manager.add_entry(
+                text=f"Entry {i}",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+
+        assert history_manager.enforce_max_entries() == 2
+        assert history_manager.enforce_max_entries() == 0
+        assert len(history_manager.get_recent()) == 3
+
     def test_export_to_json(self, history_manager, temp_db):
         """Should export to JSON."""
         history_manager.add_entry(
@@ -221,11 +450,83 @@ class TestHistoryManager:
         assert export_path.exists()
 
         import json
+
         with open(export_path) as f:
             data = json.load(f)
         assert len(data) == 1
         assert data[0]["text"] == "Export test"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_export_json_layout(self, history_manager, temp_db, use_orjson):
+        """Should write the same document as json.dump with indent=2."""
+        import json
+
+        if use_orjson and not history_manager_module.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+
+        for i in range(2):
+            history_manager.add_entry(
+                text=f"Caf\u00e9 {i}\nline",
+                duration=1.0,
+                confidence=0.9,
+                language="fr",
+                model="turbo",
+                timestamp=datetime(2024, 1, 15, 10, i),
+            )
+
+        export_path = temp_db.parent / "export.json"
+        with patch.object(history_manager_module, "HAS_ORJSON", use_orjson):
+            assert history_manager.export_to_json(export_path) == 2
+
+        expected = [e.to_dict() for e in history_manager.get_recent()]
+        assert export_path.read_text(encoding="utf-8") == json.dumps(
+            expected, indent=2, ensure_ascii=False
+        )
+
+    def test_export_json_empty(self, history_manager, temp_db):
+        """Should write an empty list when there is no history."""
+        export_path = temp_db.parent / "export.json"
+        assert history_manager.export_to_json(export_path) == 0
+        assert export_path.read_text() == "[]"
+
+    def test_export_to_csv(self, history_manager, temp_db):
+        """Should write a header and one row per entry."""
+        import csv
+
+        history_manager.add_entry(
+            text="Hello, world",
+            duration=1.5,
+            confidence=0.9,
+            language="en",
+            model="turbo",
+            timestamp=datetime(2024, 1, 15, 10, 30),
+        )
+
+        export_path = temp_db.parent / "export.csv"
+        assert history_manager.export_to_csv(export_path) == 1
+
+        with open(export_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["id", "text", "timestamp", "duration", "confidence", "language", "model"]
+        assert rows[1] == ["1", "Hello, world", "2024-01-15T10:30:00", "1.5", "0.9", "en", "turbo"]
+
+    def test_export_to_txt(self, history_manager, temp_db):
+        """Should write a timestamp header before each entry."""
+        history_manager.add_entry(
+            text="Plain text",
+            duration=1.0,
+            confidence=0.9,
+            language="en",
+            model="turbo",
+            timestamp=datetime(2024, 1, 15, 10, 30, 0, 500),
+        )
+
+        export_path = temp_db.parent / "export.txt"
+        assert history_manager.export_to_txt(export_path) == 1
+        assert (
+            export_path.read_text(encoding="utf-8") == "[2024-01-15 10:30:00]\nPlain text\n---\n\n"
+        )
+
     def test_context_manager(self, temp_db):
         """Should work as context manager."""
         with HistoryManager(db_path=temp_db) as manager:
@@ -242,6 +543,187 @@ class TestHistoryManager:
             entries = manager.get_recent()
             assert len(entries) == 1
 
+    def test_connection_pragmas(self, history_manager):
+        """Should open the database in WAL mode with relaxed syncing."""
+        conn = history_manager._connection
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+    def test_reads_use_read_only_pool(self, history_manager):
+        """Should serve reads from a reused read-only connection."""
+        history_manager.add_entry(
+            text="Pooled",
+            duration=1.0,
+            confidence=0.9,
+            language="en",
+            model="turbo",
+        )
+        assert history_manager.get_recent()[0].text == "Pooled"
+        assert history_manager.search("pooled")[0].text == "Pooled"
+        assert history_manager._reader_count == 1
+
+        with history_manager._reader() as conn:
+            assert conn is not history_manager._connection
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM history")
+
+    def test_writes_take_lock_up_front(self, history_manager, temp_db):
+        """Should hold the write lock for the whole write block."""
+        other = sqlite3.connect(str(temp_db), timeout=0)
+        try:
+            with history_manager._get_cursor():
+                with pytest.raises(sqlite3.OperationalError, match="locked"):
+                    other.execute("BEGIN IMMEDIATE")
+            other.execute("BEGIN IMMEDIATE")
+            other.rollback()
+        finally:
+            other.close()
+
+    def test_periodic_optimize(self, history_manager):
+        """Should run PRAGMA optimize on a write once the interval has passed."""
+        with patch.object(history_manager, "optimize") as optimize:
+            history_manager.add_entry(
+                text="Fresh",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+            optimize.assert_not_called()
+
+            history_manager._last_optimize_ns -= history_manager_module.OPTIMIZE_INTERVAL_NS + 1
+            history_manager.add_entry(
+                text="Stale",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+            optimize.assert_called_once()
+
+    def test_durable_writes(self, temp_db):
+        """Should fsync every commit when durable writes are requested."""
+        settings = HistorySettings(durable_writes=True)
+        with HistoryManager(settings=settings, db_path=temp_db) as manager:
+            assert manager._connection.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+
+    def test_timestamp_round_trip(self, history_manager):
+        """Should store timestamps as integers and read them back exactly."""
+        ts = datetime(2024, 1, 15, 10, 30, 0, 123456)
+        entry = history_manager.add_entry(
+            text="Timed",
+            duration=1.0,
+            confidence=0.9,
+            language="en",
+            model="turbo",
+            timestamp=ts,
+        )
+
+        assert history_manager.get_entry(entry.id).timestamp == ts
+        stored = history_manager._connection.execute(
+            "SELECT typeof(timestamp) FROM history"
+        ).fetchone()[0]
+        assert stored == "integer"
+
+    def test_get_by_date_range(self, history_manager):
+        """Should filter entries by timestamp."""
+        for day in (1, 10, 20):
+            history_manager.add_entry(
+                text=f"Day {day}",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+                timestamp=datetime(2024, 1, day, 12, 0),
+            )
+
+        entries = history_manager.get_by_date_range(datetime(2024, 1, 5), datetime(2024, 1, 15))
+        assert [e.text for e in entries] == ["Day 10"]
+
+    def test_migrates_text_timestamps(self, temp_db):
+        """Should convert a database with ISO text timestamps."""
+        conn = sqlite3.connect(str(temp_db))
+        conn.executescript("""
+            CREATE TABLE history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                duration REAL NOT NULL,
+                confidence REAL NOT NULL,
+                language TEXT NOT NULL,
+                model TEXT NOT NULL
+            );
+            CREATE VIRTUAL TABLE history_fts USING fts5(
+                text, content='history', content_rowid='id'
+            );
+            INSERT INTO history
+            VALUES (7, 'Old entry', '2024-01-15T10:30:00', 1.0, 0.9, 'en', 'turbo');
+            INSERT INTO history_fts(rowid, text) VALUES (7, 'Old entry');
+        """)
+        conn.close()
+
+        with HistoryManager(settings=HistorySettings(retention_days=0), db_path=temp_db) as manager:
+            entry = manager.get_entry(7)
+            assert entry.timestamp == datetime(2024, 1, 15, 10, 30)
+            assert [e.id for e in manager.search("old")] == [7]
+
+            new = manager.add_entry(
+                text="New entry",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+            assert new.id == 8
+            assert [e.id for e in manager.search("new")] == [8]
+            assert manager.get_statistics()["total_entries"] == 2
+
+    def test_relative_db_path(self, tmp_path, monkeypatch):
+        """Should read back entries from a database given by a relative path."""
+        monkeypatch.chdir(tmp_path)
+        settings = HistorySettings(retention_days=0)
+        with HistoryManager(settings=settings, db_path=Path("history.db")) as manager:
+            manager.add_entry(
+                text="Relative",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+            assert [e.text for e in manager.get_recent()] == ["Relative"]
+
+    def test_rebuilds_fts_index(self, temp_db):
+        """Should recreate and repopulate a version 2 FTS index with the new tokenizer."""
+        settings = HistorySettings(retention_days=0)
+        with HistoryManager(settings=settings, db_path=temp_db) as manager:
+            entry = manager.add_entry(
+                text="Résumé draft",
+                duration=1.0,
+                confidence=0.9,
+                language="en",
+                model="turbo",
+            )
+
+        conn = sqlite3.connect(str(temp_db))
+        conn.executescript("""
+            DROP TABLE history_fts;
+            CREATE VIRTUAL TABLE history_fts USING fts5(
+                text, content='history', content_rowid='id'
+            );
+            INSERT INTO history_fts(history_fts) VALUES('rebuild');
+            PRAGMA user_version=2;
+        """)
+        conn.close()
+
+        with HistoryManager(settings=settings, db_path=temp_db) as manager:
+            assert [e.id for e in manager.search("resume")] == [entry.id]
+
+        conn = sqlite3.connect(str(temp_db))
+        sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'history_fts'").fetchone()[0]
+        conn.close()
+        assert "remove_diacritics 2" in sql
+
 
 class TestHistoryManagerDisabled:
     """Tests for disabled history."""
@@ -260,8 +742,14 @@ class TestHistoryManagerDisabled:
             model="turbo",
         )
 
-        # Entry returned but not stored
-        assert entry.text == "Should not store"
-        assert entry.id is None
+        # Nothing stored, nothing built
+        assert entry is None
+        assert manager.get_recent() == []
+        assert (
+            manager.add_entries(
+                [HistoryEntry(None, "Batch", datetime.now(), 1.0, 0.9, "en", "turbo")]
+            )
+            == []
+        )
 
         manager.shutdown()
@@ -3,8 +3,10 @@ Tests for Hotkey Manager
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+from localwhisper.core import hotkey_manager
 from localwhisper.core.hotkey_manager import (
     HotkeyCombo,
     HotkeyManager,
@@ -45,6 +47,29 @@ class TestHotkeyCombo:
         assert combo.modifiers == {"ctrl"}
         assert combo.key == "c"
 
+    def test_parse_meta_alias(self):
+        """Should map cmd/win/meta to the platform's command key."""
+        expected = hotkey_manager._META_KEY
+        for name in ("cmd", "win", "meta"):
+            assert HotkeyCombo.from_string(f"{name}+k").modifiers == {expected}
+
+    def test_modifiers_are_frozen(self):
+        """Should freeze modifiers so they can't drift from the precomputed mask."""
+        combo = HotkeyCombo(modifiers={"ctrl", "alt"}, key="r")
+        assert isinstance(combo.modifiers, frozenset)
+        with pytest.raises(AttributeError):
+            combo.modifiers.add("shift")
+
+    def test_parse_is_memoized(self):
+        """Should reuse the cached parse while still returning a fresh combo."""
+        hotkey_manager._parse_hotkey.cache_clear()
+        first = HotkeyCombo.from_string("ctrl+shift+f7")
+        second = HotkeyCombo.from_string("ctrl+shift+f7")
+
+        assert hotkey_manager._parse_hotkey.cache_info().hits == 1
+        assert first == second
+        assert first is not second
+
     def test_parse_no_key_raises(self):
         """Should raise for modifier-only hotkey."""
         with pytest.raises(ValueError):
@@ -61,6 +86,31 @@ class TestHotkeyCombo:
         # Should be sorted alphabetically
         assert combo.to_string() == "ctrl+shift+r"
 
+    def test_matches_vk_under_ctrl(self):
+        """Should match by virtual key code when Ctrl turns the char into a control code."""
+        combo = HotkeyCombo.from_string("ctrl+r")
+        assert combo.matches_pynput_key(SimpleNamespace(vk=ord("R"), char="\x12"))
+        assert not combo.matches_pynput_key(SimpleNamespace(vk=ord("T"), char="\x14"))
+
+    def test_matches_digit_vk(self):
+        """Should match digit keys by virtual key code."""
+        combo = HotkeyCombo.from_string("ctrl+alt+5")
+        assert combo.matches_pynput_key(SimpleNamespace(vk=ord("5"), char=None))
+        assert not combo.matches_pynput_key(SimpleNamespace(vk=ord("6"), char=None))
+        assert not combo.matches_pynput_key(SimpleNamespace(vk=None, char=None))
+
+    def test_matches_char(self):
+        """Should match a plain character in either case."""
+        combo = HotkeyCombo.from_string("alt+s")
+        assert combo.matches_pynput_key(SimpleNamespace(vk=None, char="S"))
+        assert not combo.matches_pynput_key(SimpleNamespace(vk=None, char="d"))
+
+    def test_matches_special_key(self):
+        """Should match special keys by name."""
+        combo = HotkeyCombo.from_string("ctrl+f1")
+        assert combo.matches_pynput_key(SimpleNamespace(name="f1"))
+        assert not combo.matches_pynput_key(SimpleNamespace(name="f2"))
+
 
 class TestHotkeyManager:
     """Tests for HotkeyManager class."""
@@ -102,15 +152,179 @@ class TestHotkeyManager:
         assert manager._on_press is on_press
         assert manager._on_release is on_release
 
+    def test_modifier_mask(self):
+        """Should combine modifiers into one bitmask."""
+        assert HotkeyCombo.from_string("ctrl+alt+r").modifier_mask == 0b011
+        assert HotkeyCombo.from_string("shift+f1").modifier_mask == 0b100
+        assert HotkeyCombo(modifiers={"hyper"}, key="r").modifier_mask == -1
+
+    def test_press_requires_exact_modifiers(self):
+        """Should toggle only when exactly the combo's modifiers are held."""
+        on_toggle = Mock()
+        manager = HotkeyManager(hotkey="ctrl+alt+r", on_toggle=on_toggle)
+        r_key = Mock(spec=["vk", "char"], vk=ord("R"), char="\x12")
+        with patch.dict(
+            hotkey_manager._MODIFIER_KEY_BITS, {"CTRL": 2, "ALT": 1, "SHIFT": 4}, clear=True
+        ):
+            manager._handle_press("CTRL")
+            manager._handle_press(r_key)
+            on_toggle.assert_not_called()
+
+            manager._handle_press("ALT")
+            manager._handle_press("SHIFT")
+            manager._handle_press(r_key)
+            on_toggle.assert_not_called()
+
+            manager._handle_release("SHIFT")
+            manager._handle_press(r_key)
+            on_toggle.assert_called_once()
+
+    def test_ignores_auto_repeat(self):
+        """Should toggle once per hotkey press, however long it is held."""
+        on_toggle = Mock()
+        manager = HotkeyManager(hotkey="ctrl+r", on_toggle=on_toggle)
+        r_key = Mock(spec=["vk", "char"], vk=ord("R"), char="\x12")
+        with (
+            patch.dict(hotkey_manager._MODIFIER_KEY_BITS, {"CTRL": 2}, clear=True),
+            patch.object(manager, "_trigger_toggle", side_effect=on_toggle),
+        ):
+            manager._handle_press("CTRL")
+            for _ in range(5):
+                manager._handle_press(r_key)
+            on_toggle.assert_called_once()
+
+            manager._handle_release(r_key)
+            manager._handle_press(r_key)
+            assert on_toggle.call_count == 2
+
+            manager._handle_release("CTRL")
+            manager._handle_press("CTRL")
+            manager._handle_press(r_key)
+            assert on_toggle.call_count == 3
+
+    def test_toggle_debounce(self):
+        """Should ignore a second trigger within the debounce window."""
+        on_toggle = Mock()
+        manager = HotkeyManager(hotkey="ctrl+alt+r", on_toggle=on_toggle)
+        clock = [10_000_000_000]
+        with patch.object(hotkey_manager.time, "monotonic_ns", side_effect=lambda: clock[0]):
+            manager._trigger_toggle()
+            clock[0] += 100_000_000
+            manager._trigger_toggle()
+            clock[0] += 300_000_000
+            manager._trigger_toggle()
+
+        assert on_toggle.call_count == 2
+
     def test_context_manager(self):
         """Should work as context manager."""
-        with patch.object(HotkeyManager, 'start') as mock_start:
-            with patch.object(HotkeyManager, 'stop') as mock_stop:
+        with patch.object(HotkeyManager, "start") as mock_start:
+            with patch.object(HotkeyManager, "stop") as mock_stop:
                 with HotkeyManager() as manager:
                     mock_start.assert_called_once()
                 mock_stop.assert_called_once()
 
 
+class TestNativeHotkey:
+    """Tests for the RegisterHotKey path."""
+
+    def test_win32_args(self):
+        """Should map modifiers and key to RegisterHotKey flags and vk."""
+        combo = HotkeyCombo(modifiers={"ctrl", "alt"}, key="r")
+        assert hotkey_manager._win32_hotkey_args(combo) == (0x4000 | 0x1 | 0x2, ord("R"))
+
+    def test_win32_args_named_key(self):
+        """Should map named keys like function keys."""
+        combo = HotkeyCombo(modifiers={"shift"}, key="f5")
+        assert hotkey_manager._win32_hotkey_args(combo) == (0x4000 | 0x4, 0x74)
+
+    def test_win32_args_unmappable(self):
+        """Should reject keys and modifiers RegisterHotKey can't express."""
+        assert hotkey_manager._win32_hotkey_args(HotkeyCombo({"cmd"}, "r")) is None
+        assert hotkey_manager._win32_hotkey_args(HotkeyCombo({"alt"}, "menu")) is None
+
+    def test_falls_back_to_keyboard_hook(self):
+        """Should use the pynput listener when no native hotkey is available."""
+        manager = HotkeyManager(hotkey="ctrl+alt+r")
+        with (
+            patch.object(hotkey_manager, "IS_WINDOWS", False),
+            patch.object(hotkey_manager, "IS_LINUX", False),
+            patch.object(hotkey_manager.keyboard, "Listener") as listener,
+        ):
+            manager.start()
+            listener.return_value.start.assert_called_once()
+            manager.stop()
+            listener.return_value.stop.assert_called_once()
+
+    def test_native_hotkey_skips_keyboard_hook(self):
+        """Should not install the pynput listener when registration succeeds."""
+        manager = HotkeyManager(hotkey="ctrl+alt+r")
+        with (
+            patch.object(hotkey_manager, "IS_WINDOWS", True),
+            patch.object(hotkey_manager, "_Win32HotkeyListener") as native,
+            patch.object(hotkey_manager.keyboard, "Listener") as listener,
+        ):
+            native.return_value.start.return_value = True
+            manager.start()
+
+            native.assert_called_once_with(0x4003, ord("R"), callback=manager._trigger_toggle)
+            listener.assert_not_called()
+            assert manager.is_running
+            manager.stop()
+            native.return_value.stop.assert_called_once()
+
+
+@pytest.mark.skipif(not hotkey_manager.HAS_EVDEV, reason="evdev not installed")
+class TestEvdevHotkey:
+    """Tests for the Linux evdev backend."""
+
+    def test_key_codes(self):
+        """Should map hotkey key names to Linux keycodes."""
+        ecodes = hotkey_manager.ecodes.ecodes
+        assert hotkey_manager._evdev_key_code("r") == ecodes["KEY_R"]
+        assert hotkey_manager._evdev_key_code("f1") == ecodes["KEY_F1"]
+        assert hotkey_manager._evdev_key_code("page_up") == ecodes["KEY_PAGEUP"]
+        assert hotkey_manager._evdev_key_code("menu_of_doom") is None
+
+    def test_handle_key(self):
+        """Should fire on key-down only with exactly the required modifiers held."""
+        ecodes = hotkey_manager.ecodes.ecodes
+        callback = Mock()
+        listener = hotkey_manager._EvdevHotkeyListener(ecodes["KEY_R"], 0b011, callback)
+
+        listener._handle_key(ecodes["KEY_LEFTCTRL"], 1)
+        listener._handle_key(ecodes["KEY_R"], 1)
+        callback.assert_not_called()
+
+        listener._handle_key(ecodes["KEY_RIGHTALT"], 1)
+        listener._handle_key(ecodes["KEY_R"], 2)  # Auto-repeat
+        callback.assert_not_called()
+        listener._handle_key(ecodes["KEY_R"], 1)
+        callback.assert_called_once()
+
+        listener._handle_key(ecodes["KEY_RIGHTALT"], 0)
+        listener._handle_key(ecodes["KEY_R"], 1)
+        callback.assert_called_once()
+
+    def test_manager_prefers_evdev_on_linux(self):
+        """Should use the evdev listener when a keyboard can be opened."""
+        manager = HotkeyManager(hotkey="ctrl+alt+r")
+        with (
+            patch.object(hotkey_manager, "IS_WINDOWS", False),
+            patch.object(hotkey_manager, "IS_LINUX", True),
+            patch.object(hotkey_manager, "_EvdevHotkeyListener") as native,
+            patch.object(hotkey_manager.keyboard, "Listener") as listener,
+        ):
+            native.return_value.start.return_value = True
+            manager.start()
+
+            native.assert_called_once_with(
+                hotkey_manager.ecodes.ecodes["KEY_R"], 0b011, callback=manager._trigger_toggle
+            )
+            listener.assert_not_called()
+            manager.stop()
+
+
 class TestCheckHotkeyConflict:
     """Tests for check_hotkey_conflict function."""
 
@@ -141,3 +355,19 @@ class TestCheckHotkeyConflict:
         """Should check conflicts case-insensitively."""
         result = check_hotkey_conflict("CTRL+C")
         assert result is not None
+
+    def test_modifier_order_and_aliases(self):
+        """Should match conflicts regardless of modifier spelling or order."""
+        assert "Copy" in check_hotkey_conflict("Control + C")
+        assert check_hotkey_conflict("shift+ctrl+c") is None
+
+    def test_invalid_hotkey_has_no_conflict(self):
+        """Should leave invalid hotkeys to validate_hotkey."""
+        assert check_hotkey_conflict("ctrl+alt") is None
+
+    def test_is_memoized(self):
+        """Should answer repeated checks from the cache."""
+        check_hotkey_conflict.cache_clear()
+        check_hotkey_conflict("ctrl+alt+r")
+        check_hotkey_conflict("ctrl+alt+r")
+        assert check_hotkey_conflict.cache_info().hits == 1
@@ -0,0 +1,99 @@
+"""
+Tests for Resampler
+"""
+
+import tracemalloc
+
+import pytest
+import numpy as np
+
+from localwhisper.core.resampler import PolyphaseResampler, resample_poly
+
+
+def make_tone(frequency: float, sample_rate: int, duration: float = 1.0) -> np.ndarray:
+    """Generate a sine tone."""
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    return (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+
+
+class TestResamplePoly:
+    """Tests for resample_poly function."""
+
+    @pytest.mark.parametrize("orig_sr", [8000, 44100, 48000])
+    def test_output_length(self, orig_sr):
+        """Should produce one second of 16kHz audio from one second of input."""
+        result = resample_poly(make_tone(1000, orig_sr), orig_sr, 16000)
+        assert len(result) == 16000
+        assert result.dtype == np.float32
+
+    def test_converts_input_dtype(self):
+        """Should accept non-float32 input and return the same float32 result."""
+        tone = make_tone(1000, 48000)
+        expected = resample_poly(tone, 48000, 16000)
+        result = resample_poly(tone.astype(np.float64), 48000, 16000)
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, atol=1e-6)
+
+    @pytest.mark.parametrize("orig_sr", [44100, 48000])
+    def test_preserves_tone(self, orig_sr):
+        """Should keep the frequency and level of an in-band tone."""
+        result = resample_poly(make_tone(1000, orig_sr), orig_sr, 16000)[1000:15000]
+        spectrum = np.abs(np.fft.rfft(result))
+        peak_hz = np.argmax(spectrum) * 16000 / len(result)
+
+        assert peak_hz == pytest.approx(1000, abs=2)
+        assert np.abs(result).max() == pytest.approx(0.5, abs=0.01)
+
+    def test_rejects_aliasing(self):
+        """Should suppress content above the target Nyquist frequency."""
+        result = resample_poly(make_tone(12000, 48000), 48000, 16000)
+        assert np.abs(result[200:-200]).max() < 0.01
+
+    @pytest.mark.parametrize("orig_sr", [8000, 44100, 48000])
+    def test_compensates_filter_delay(self, orig_sr):
+        """Should line the output up with the input instead of lagging by the filter delay."""
+        result = resample_poly(make_tone(440, orig_sr), orig_sr, 16000)
+        expected = make_tone(440, 16000)
+        np.testing.assert_allclose(result[500:15500], expected[500:15500], atol=2e-3)
+
+    def test_bounded_memory(self):
+        """Should not allocate per-output tap windows for the whole signal."""
+        audio = make_tone(440, 48000, duration=30.0)
+        tracemalloc.start()
+        try:
+            resample_poly(audio, 48000, 16000)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 3 * audio.nbytes
+
+    def test_same_rate_passthrough(self, sample_audio):
+        """Should return the input unchanged when rates match."""
+        result = resample_poly(sample_audio, 16000, 16000)
+        assert np.array_equal(result, sample_audio)
+
+
+class TestPolyphaseResampler:
+    """Tests for PolyphaseResampler class."""
+
+    def test_chunked_matches_whole(self):
+        """Streaming chunk by chunk should match resampling the whole signal."""
+        audio = make_tone(440, 48000)
+        resampler = PolyphaseResampler(48000, 16000)
+        chunked = np.concatenate(
+            [resampler.process(audio[i : i + 1600]) for i in range(0, len(audio), 1600)]
+            + [resampler.flush()]
+        )
+
+        np.testing.assert_allclose(chunked, resample_poly(audio, 48000, 16000), atol=1e-5)
+
+    def test_reset(self):
+        """Should start a fresh stream after reset."""
+        audio = make_tone(440, 48000, duration=0.1)
+        resampler = PolyphaseResampler(48000, 16000)
+        first = resampler.process(audio)
+        resampler.reset()
+        second = resampler.process(audio)
+
+        np.testing.assert_array_equal(first, second)
@@ -0,0 +1,211 @@
+"""
+Tests for Text Injector
+"""
+
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+
+from localwhisper.core import text_injector
+from localwhisper.core.text_injector import TextInjector
+
+
+@pytest.fixture
+def injector():
+    """Create a TextInjector with a mocked keyboard controller."""
+    injector = TextInjector()
+    injector._controller = Mock()
+    return injector
+
+
+class TestClipboardInjection:
+    """Tests for clipboard paste injection."""
+
+    def test_paste_keystroke(self, injector):
+        """Should set the clipboard and send one Ctrl+V chord."""
+        injector._system = "Linux"
+        with (
+            patch.object(injector, "_set_clipboard", return_value=True) as set_clipboard,
+            patch.object(text_injector.time, "sleep"),
+        ):
+            assert injector.inject_text("  hello world ") is True
+
+        set_clipboard.assert_called_once_with("hello world")
+        controller = injector._controller
+        assert controller.method_calls == [
+            ("press", (text_injector.Key.ctrl,), {}),
+            ("press", ("v",), {}),
+            ("release", ("v",), {}),
+            ("release", (text_injector.Key.ctrl,), {}),
+        ]
+
+    def test_clipboard_failure_types_text(self, injector):
+        """Should fall back to keyboard typing when the clipboard can't be set."""
+        with patch.object(injector, "_set_clipboard", return_value=False):
+            assert injector.inject_text("hello") is True
+
+        injector._controller.type.assert_called_once_with("hello")
+
+
+class TestAsyncInjection:
+    """Tests for background injection."""
+
+    def test_injects_in_order_on_one_thread(self, injector):
+        """Should inject queued texts in order from a single worker thread."""
+        done = threading.Event()
+        seen = []
+
+        def record(text):
+            seen.append((text, threading.current_thread()))
+            if len(seen) == 3:
+                done.set()
+
+        with patch.object(injector, "inject_text", side_effect=record):
+            for text in ("one", "two", "three"):
+                injector.inject_text_async(text)
+            assert done.wait(timeout=2)
+
+        assert [text for text, _ in seen] == ["one", "two", "three"]
+        assert len({thread for _, thread in seen}) == 1
+        assert seen[0][1] is not threading.current_thread()
+
+    def test_waits_for_previous_paste_to_settle(self, injector):
+        """Should not replace the clipboard until the previous paste had time to be read."""
+        starts = []
+
+        def record(text):
+            starts.append(text_injector.time.monotonic())
+            return True
+
+        with patch.object(injector, "inject_text", side_effect=record):
+            injector.inject_text_future("one")
+            injector.inject_text_future("two").result(timeout=2)
+
+        assert starts[1] - starts[0] >= text_injector._PASTE_SETTLE_SECONDS
+
+    def test_future_result(self, injector):
+        """Should resolve the future with the injection result."""
+        with (
+            patch.object(injector, "_set_clipboard", return_value=True),
+            patch.object(text_injector.time, "sleep"),
+        ):
+            assert injector.inject_text_future("hello").result(timeout=2) is True
+
+    def test_shutdown_rejects_new_text(self, injector):
+        """Should refuse new injections after shutdown."""
+        injector.shutdown()
+        with pytest.raises(RuntimeError):
+            injector.inject_text_future("late")
+
+
+class TestLinuxClipboard:
+    """Tests for the Linux clipboard commands."""
+
+    def test_detects_x11_tools(self, monkeypatch):
+        """Should prefer xclip/xsel and drop tools that aren't installed on X11."""
+        monkeypatch.setenv("XDG_SESSION_TYPE", "x11")
+        monkeypatch.delenv("WAYLAND_DISPLAY", raising=False)
+        installed = {"xsel", "wl-copy"}
+        with patch.object(
+            text_injector.shutil, "which", side_effect=lambda name: name in installed
+        ):
+            commands = text_injector._detect_linux_clipboard_commands()
+
+        assert commands == (("xsel", "--clipboard", "--input"), ("wl-copy",))
+
+    def test_detects_wayland(self, monkeypatch):
+        """Should put wl-copy first on a Wayland session."""
+        monkeypatch.setenv("XDG_SESSION_TYPE", "tty")
+        monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+        with patch.object(text_injector.shutil, "which", return_value="/usr/bin/tool"):
+            commands = text_injector._detect_linux_clipboard_commands()
+
+        assert commands[0] == ("wl-copy",)
+        assert len(commands) == 3
+
+    def test_remembers_working_command(self, injector):
+        """Should fall through to the next tool, then reuse the one that worked."""
+        injector._linux_clip_cmds = text_injector._LINUX_CLIPBOARD_COMMANDS
+        injector._linux_clip_cmd = injector._linux_clip_cmds[0]
+        process = Mock(returncode=0)
+        with patch.object(text_injector.subprocess, "Popen") as popen:
+            popen.side_effect = [FileNotFoundError(), process, process]
+            assert injector._set_clipboard_linux("one") is True
+            assert injector._set_clipboard_linux("two") is True
+
+        commands = [c.args[0] for c in popen.call_args_list]
+        assert commands == [
+            ("xclip", "-selection", "clipboard"),
+            ("xsel", "--clipboard", "--input"),
+            ("xsel", "--clipboard", "--input"),
+        ]
+
+    def test_reprobes_after_failure(self, injector):
+        """Should forget a command that stops working."""
+        injector._linux_clip_cmds = (("wl-copy",),)
+        injector._linux_clip_cmd = ("wl-copy",)
+        with patch.object(text_injector.subprocess, "Popen", side_effect=FileNotFoundError()):
+            assert injector._set_clipboard_linux("text") is False
+
+        assert injector._linux_clip_cmd is None
+
+    def test_x11_owner_failure_uses_tools(self, injector):
+        """Should fall back to the clipboard tools when the X server can't be used."""
+        injector._try_x11_owner = True
+        injector._linux_clip_cmds = (("xclip", "-selection", "clipboard"),)
+        injector._linux_clip_cmd = injector._linux_clip_cmds[0]
+        with (
+            patch.object(text_injector, "_X11ClipboardOwner", side_effect=Exception("no display")),
+            patch.object(injector, "_pipe_to_command", return_value=True) as pipe,
+        ):
+            assert injector._set_clipboard_linux("text") is True
+            assert injector._set_clipboard_linux("text") is True
+
+        assert injector._try_x11_owner is False
+        assert pipe.call_count == 2
+
+
+@pytest.mark.skipif(not text_injector.HAS_XLIB, reason="python-xlib not installed")
+class TestX11ClipboardOwner:
+    """Tests for answering X11 selection requests."""
+
+    @pytest.fixture
+    def owner(self):
+        """Create an owner without an X server connection."""
+        owner = object.__new__(text_injector._X11ClipboardOwner)
+        owner._display = Mock()
+        owner._targets, owner._utf8 = 300, 301
+        owner._text = "héllo"
+        with patch.object(text_injector.xevent, "SelectionNotify", side_effect=dict):
+            yield owner
+
+    def _request(self, target, prop=400):
+        return Mock(time=0, requestor=Mock(), selection=1, target=target, property=prop)
+
+    def test_answers_utf8(self, owner):
+        """Should write the text as UTF-8 and notify the requestor."""
+        ev = self._request(owner._utf8)
+        owner._answer(ev)
+
+        ev.requestor.change_property.assert_called_once_with(400, 301, 8, "héllo".encode("utf-8"))
+        ev.requestor.send_event.assert_called_once()
+        assert ev.requestor.send_event.call_args.args[0]["property"] == 400
+
+    def test_answers_targets(self, owner):
+        """Should list the supported formats."""
+        ev = self._request(owner._targets, prop=0)
+        owner._answer(ev)
+
+        prop, prop_type, fmt, targets = ev.requestor.change_property.call_args.args
+        assert prop == owner._targets
+        assert fmt == 32
+        assert owner._utf8 in targets
+
+    def test_refuses_other_formats(self, owner):
+        """Should reply with no property for formats it can't provide."""
+        ev = self._request(999)
+        owner._answer(ev)
+
+        ev.requestor.change_property.assert_not_called()
+        assert ev.requestor.send_event.call_args.args[0]["property"] == text_injector.X.NONE
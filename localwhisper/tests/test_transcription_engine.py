@@ -0,0 +1,387 @@
+"""
+Tests for Transcription Engine
+"""
+
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from localwhisper.core import transcription_engine
+from localwhisper.core.transcription_engine import (
+    TranscriptionEngine,
+    TranscriptionEngineError,
+    TranscriptionResult,
+    TranscriptionSession,
+)
+
+
+def make_result(text: str) -> TranscriptionResult:
+    """Create a transcription result with the given text."""
+    return TranscriptionResult(
+        text=text,
+        language="en",
+        confidence=0.9,
+        duration=1.0,
+        processing_time=0.1,
+    )
+
+
+@pytest.fixture
+def engine():
+    """Create a mock transcription engine."""
+    engine = Mock()
+    engine.transcribe.side_effect = lambda audio, **kwargs: make_result(f"{len(audio)}")
+    return engine
+
+
+class TestTranscriptionSession:
+    """Tests for TranscriptionSession class."""
+
+    def test_feed_waits_for_full_window(self, engine):
+        """Should not emit a window before window + search audio is buffered."""
+        session = TranscriptionSession(engine, window_seconds=1.0, search_seconds=0.5)
+        assert session.feed(np.zeros(16000, dtype=np.float32)) is None
+
+    def test_feed_cuts_at_quietest_frame(self, engine):
+        """Should cut the window at the quietest point of the search span."""
+        session = TranscriptionSession(engine, window_seconds=1.0, search_seconds=0.5)
+        audio = np.ones(24000, dtype=np.float32)
+        audio[18880:19360] = 0.0  # Quiet 30ms frame at 1.18s
+
+        window = session.feed(audio)
+        assert window is not None
+        assert len(window) == 18880
+
+    def test_finish_transcribes_windows_and_tail(self, engine):
+        """Should join window and tail transcriptions in order."""
+        session = TranscriptionSession(engine, window_seconds=1.0, search_seconds=0.5)
+        audio = np.ones(30000, dtype=np.float32)
+        audio[16000:16480] = 0.0
+
+        window = session.feed(audio)
+        session.transcribe_window(window)
+        text = session.finish()
+
+        assert text == "16000 14000"
+        # The tail is conditioned on the text of the previous window
+        assert engine.transcribe.call_args.kwargs["initial_prompt"] == "16000"
+
+    def test_finish_drops_short_tail(self, engine):
+        """Should not transcribe a tail shorter than the minimum."""
+        session = TranscriptionSession(engine)
+        session.feed(np.zeros(800, dtype=np.float32))
+        assert session.finish() == ""
+        engine.transcribe.assert_not_called()
+
+    def test_cancel_skips_queued_windows(self, engine):
+        """Should not transcribe windows once the session is cancelled."""
+        session = TranscriptionSession(engine)
+        session.cancel()
+        session.transcribe_window(np.zeros(16000, dtype=np.float32))
+
+        engine.transcribe.assert_not_called()
+
+    def test_finish_raises_window_error(self, engine):
+        """Should re-raise errors from earlier windows."""
+        engine.transcribe.side_effect = TranscriptionEngineError("boom")
+        session = TranscriptionSession(engine)
+        session.transcribe_window(np.zeros(16000, dtype=np.float32))
+
+        with pytest.raises(TranscriptionEngineError):
+            session.finish()
+
+
+class TestTranscriptionEngine:
+    """Tests for TranscriptionEngine class."""
+
+    def test_transcribe_passes_contiguous_float32(self):
+        """Should hand the backend contiguous float32 audio."""
+        engine = TranscriptionEngine()
+        engine._is_loaded = True
+        audio = np.ones((16000, 2), dtype=np.float64)[:, 0]  # Strided float64 view
+
+        with patch.object(engine, "_transcribe_faster_whisper", return_value=([], "en")) as backend:
+            engine.transcribe(audio)
+
+        passed = backend.call_args.args[0]
+        assert passed.dtype == np.float32
+        assert passed.flags["C_CONTIGUOUS"]
+
+    def test_confidence_from_logprobs(self):
+        """Should average per-segment probabilities, assuming 0.5 when unknown."""
+        engine = TranscriptionEngine()
+        engine._is_loaded = True
+        segments = [
+            SimpleNamespace(text=" Hello", avg_logprob=0.0),
+            SimpleNamespace(text=" world", avg_logprob=None),
+        ]
+
+        with patch.object(engine, "_transcribe_faster_whisper", return_value=(segments, "en")):
+            result = engine.transcribe(np.zeros(16000, dtype=np.float32))
+
+        assert result.text == "Hello world"
+        assert result.confidence == pytest.approx(0.75)
+
+    def test_progress_callback_is_throttled(self):
+        """Should report partial text at most every 100ms, then the final text."""
+        engine = TranscriptionEngine()
+        engine._is_loaded = True
+        callback = Mock()
+        engine.set_progress_callback(callback)
+        segments = [SimpleNamespace(text=f" {i}", avg_logprob=-0.1) for i in range(4)]
+        clock = iter([10.0, 10.05, 10.2, 10.25])
+
+        with (
+            patch.object(engine, "_transcribe_faster_whisper", return_value=(segments, "en")),
+            patch("time.monotonic", side_effect=lambda: next(clock)),
+        ):
+            engine.transcribe(np.zeros(16000, dtype=np.float32))
+
+        assert callback.call_args_list == [
+            (("0", False),),
+            (("0 1 2", False),),
+            (("0 1 2 3", True),),
+        ]
+
+    def test_compute_type_prefers_int8_float16_on_gpu(self):
+        """Should pick the fastest compute type the GPU supports."""
+        engine = TranscriptionEngine()
+        ctranslate2 = Mock()
+        ctranslate2.get_supported_compute_types.return_value = {
+            "float32",
+            "float16",
+            "int8_float16",
+        }
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}):
+            assert engine._detect_compute_type("cuda") == "int8_float16"
+
+    def test_compute_type_skips_unsupported_int8(self):
+        """Should prefer BF16 on GPUs without INT8 support that offer it."""
+        engine = TranscriptionEngine()
+        ctranslate2 = Mock()
+        ctranslate2.get_supported_compute_types.return_value = {"float32", "float16", "bfloat16"}
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}):
+            assert engine._detect_compute_type("cuda") == "bfloat16"
+
+    def test_compute_type_float16_before_ampere(self):
+        """Should use FP16 on GPUs that don't support BF16."""
+        engine = TranscriptionEngine()
+        ctranslate2 = Mock()
+        ctranslate2.get_supported_compute_types.return_value = {"float32", "float16"}
+        with patch.dict("sys.modules", {"ctranslate2": ctranslate2}):
+            assert engine._detect_compute_type("cuda") == "float16"
+
+    def test_compute_type_auto_without_probe(self):
+        """Should defer to CTranslate2's own choice when it can't be probed."""
+        engine = TranscriptionEngine()
+        with patch.dict("sys.modules", {"ctranslate2": None}):
+            assert engine._detect_compute_type("cpu") == "auto"
+
+    def test_cuda_probe_is_cached(self):
+        """Should ask CTranslate2 for CUDA devices once and not import torch."""
+        ctranslate2 = Mock()
+        ctranslate2.get_cuda_device_count.return_value = 1
+        ctranslate2.get_supported_compute_types.return_value = {"float16"}
+        transcription_engine._cuda_available.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"ctranslate2": ctranslate2, "torch": None}):
+                assert TranscriptionEngine()._detect_device() == "cuda"
+                assert TranscriptionEngine()._detect_device() == "cuda"
+            ctranslate2.get_cuda_device_count.assert_called_once()
+        finally:
+            transcription_engine._cuda_available.cache_clear()
+
+    def test_transcribe_rejects_multichannel(self):
+        """Should refuse non-mono audio instead of decoding interleaved channels."""
+        engine = TranscriptionEngine()
+        engine._is_loaded = True
+        with pytest.raises(TranscriptionEngineError):
+            engine.transcribe(np.zeros((16000, 2), dtype=np.float32))
+
+    def test_unload_keeps_cuda_cache(self):
+        """Should empty torch's CUDA cache only when asked to."""
+        torch = Mock()
+        engine = TranscriptionEngine()
+        engine._device = "cuda"
+        with patch.dict("sys.modules", {"torch": torch}):
+            engine._model, engine._is_loaded = Mock(), True
+            engine.unload_model()
+            torch.cuda.empty_cache.assert_not_called()
+
+            engine._model, engine._is_loaded = Mock(), True
+            engine.unload_model(free_cuda=True)
+            torch.cuda.empty_cache.assert_called_once()
+        assert not engine.is_loaded
+
+    def test_cpu_threads_leaves_a_core_free(self):
+        """Should default to all cores but one for CPU inference."""
+        engine = TranscriptionEngine()
+        with patch("os.cpu_count", return_value=8):
+            assert engine._get_cpu_threads() == 7
+
+    def test_cpu_threads_from_settings(self):
+        """Should use an explicitly configured thread count."""
+        engine = TranscriptionEngine()
+        engine.settings.cpu_threads = 2
+        assert engine._get_cpu_threads() == 2
+
+    def test_faster_whisper_threading(self):
+        """Should give one model worker all the configured CPU threads."""
+        engine = TranscriptionEngine()
+        engine.settings.cpu_threads = 6
+        faster_whisper = Mock()
+        with patch.dict("sys.modules", {"faster_whisper": faster_whisper}):
+            engine._load_faster_whisper_model("small")
+
+        kwargs = faster_whisper.WhisperModel.call_args.kwargs
+        assert kwargs["cpu_threads"] == 6
+        assert kwargs["num_workers"] == 1
+
+    def test_batched_decoding(self):
+        """Should decode through the batched pipeline only when VAD splits the audio."""
+        engine = TranscriptionEngine()
+        engine.settings.batch_size = 4
+        engine._model = Mock()
+        engine._model.transcribe.return_value = ([], SimpleNamespace(language="en"))
+        engine._batched_model = Mock()
+        engine._batched_model.transcribe.return_value = ([], SimpleNamespace(language="en"))
+        audio = np.zeros(16000, dtype=np.float32)
+
+        engine._transcribe_faster_whisper(audio, vad_filter=True)
+        assert engine._batched_model.transcribe.call_args.kwargs["batch_size"] == 4
+
+        engine._transcribe_faster_whisper(audio, vad_filter=False)
+        engine._model.transcribe.assert_called_once()
+
+    def test_batched_pipeline_disabled_by_default(self):
+        """Should not wrap the model unless batch_size is above 1."""
+        engine = TranscriptionEngine()
+        assert engine._load_batched_pipeline(Mock()) is None
+
+    def test_warm_up_bypasses_vad(self):
+        """Should decode one second of silence with VAD disabled."""
+        engine = TranscriptionEngine()
+        engine._is_loaded = True
+        segments = Mock()
+        segments.__iter__ = Mock(return_value=iter([]))
+
+        with patch.object(
+            engine, "_transcribe_faster_whisper", return_value=(segments, "en")
+        ) as backend:
+            engine.warm_up()
+
+        assert len(backend.call_args.args[0]) == 16000
+        assert backend.call_args.kwargs["vad_filter"] is False
+        segments.__iter__.assert_called_once()
+
+    def test_resample_is_band_limited(self):
+        """Should convert 48kHz to 16kHz without aliasing content above 8kHz."""
+        engine = TranscriptionEngine()
+        t = np.arange(48000) / 48000
+        tone = np.sin(2 * np.pi * 440 * t)
+        alias = 0.5 * np.sin(2 * np.pi * 12000 * t)  # Folds to 4kHz if not filtered
+
+        out = engine._resample((tone + alias).astype(np.float32), 48000, 16000)
+
+        assert out.dtype == np.float32
+        assert len(out) == 16000
+        spectrum = np.abs(np.fft.rfft(out[1000:-1000]))
+        freqs = np.fft.rfftfreq(len(out) - 2000, 1 / 16000)
+        assert spectrum[np.abs(freqs - 4000) < 20].max() < 0.01 * spectrum.max()
+
+
+class TestStreamingTranscription:
+    """Tests for TranscriptionEngine.transcribe_streaming."""
+
+    @pytest.fixture
+    def streaming_engine(self):
+        """Create an engine whose transcription reports the audio length."""
+        engine = TranscriptionEngine()
+        lengths = []
+
+        def transcribe(audio, initial_prompt=None):
+            lengths.append(len(audio))
+            result = make_result(f"[{len(audio)}]")
+            result.duration = len(audio) / 16000
+            return result
+
+        engine.transcribe = transcribe
+        engine.lengths = lengths
+        return engine
+
+    def test_waits_for_minimum_audio(self, streaming_engine):
+        """Should not transcribe less than half a second unless final."""
+        assert streaming_engine.transcribe_streaming(np.ones(1600, dtype=np.float32)) is None
+        result = streaming_engine.transcribe_streaming(
+            np.ones(1600, dtype=np.float32), is_final=True
+        )
+        assert result.text == "[3200]"
+        assert not result.is_partial
+
+    def test_commits_prefix_at_pause(self, streaming_engine):
+        """Should commit audio up to the quiet point and keep only the tail pending."""
+        audio = np.ones(100_000, dtype=np.float32)
+        audio[86_240:86_720] = 0.0  # Pause 5.39s in, on a 30ms frame boundary
+
+        results = [streaming_engine.transcribe_streaming(chunk) for chunk in np.split(audio, 50)]
+
+        final = results[-1]
+        assert final.is_partial
+        assert final.text == "[86240] [13760]"
+        assert final.duration == pytest.approx(100_000 / 16000)
+        # No transcription ever covers more than the commit window plus search span
+        assert max(streaming_engine.lengths) <= 6 * 16000
+
+    def test_final_chunk_resets_stream(self, streaming_engine):
+        """Should start a fresh stream after the final chunk."""
+        streaming_engine.transcribe_streaming(np.ones(100_000, dtype=np.float32), is_final=True)
+        result = streaming_engine.transcribe_streaming(np.ones(8000, dtype=np.float32))
+        assert result.text == "[8000]"
+
+    def test_reuses_preallocated_buffer(self, streaming_engine):
+        """Should append into the same buffer and grow it only for oversized chunks."""
+        buffer = streaming_engine._streaming_buffer
+        streaming_engine.transcribe_streaming(np.ones(8000, dtype=np.float32))
+        streaming_engine.transcribe_streaming(np.ones(8000, dtype=np.float32))
+        assert streaming_engine._streaming_buffer is buffer
+
+        result = streaming_engine.transcribe_streaming(
+            np.arange(len(buffer), dtype=np.float32), is_final=True
+        )
+        assert result.text == f"[{len(buffer) + 16000}]"
+        assert streaming_engine._streaming_samples == 0
+
+    def test_skips_silent_chunks(self, streaming_engine):
+        """Should not transcribe again when only silence was added since the last pass."""
+        streaming_engine.set_speech_detector(lambda audio: float(audio.max() > 0))
+
+        assert streaming_engine.transcribe_streaming(np.ones(8000, dtype=np.float32)) is not None
+        assert streaming_engine.transcribe_streaming(np.zeros(8000, dtype=np.float32)) is None
+        assert streaming_engine.lengths == [8000]
+
+        # Silent audio is kept and included once speech resumes or the stream ends
+        result = streaming_engine.transcribe_streaming(
+            np.zeros(1600, dtype=np.float32), is_final=True
+        )
+        assert result.text == "[17600]"
+
+    def test_small_chunks_of_speech(self, streaming_engine):
+        """Should wait for a whole detector frame rather than treat short chunks as silence."""
+
+        def detector(audio):
+            n_frames = len(audio) // 480
+            if n_frames == 0:
+                return 0.0
+            frames = audio[: n_frames * 480].reshape(n_frames, 480)
+            return float(np.mean(frames.max(axis=1) > 0))
+
+        streaming_engine.set_speech_detector(detector)
+        streaming_engine.transcribe_streaming(np.ones(8000, dtype=np.float32))
+
+        results = [
+            streaming_engine.transcribe_streaming(np.ones(160, dtype=np.float32)) for _ in range(6)
+        ]
+
+        assert [r is not None for r in results] == [False, False, True] * 2
+        assert streaming_engine.lengths == [8000, 8480, 8960]
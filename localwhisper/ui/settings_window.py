@@ -42,7 +42,7 @@ class SettingsWindow(QDialog):
     """
 
     # Signals
-    settings_changed = pyqtSignal()
+    settings_changed = pyqtSignal(Config)  # Emits the live, already-saved config
     hotkey_changed = pyqtSignal(str)
 
     def __init__(self, config: Config, parent: Optional[QWidget] = None):
@@ -145,9 +145,7 @@ class SettingsWindow(QDialog):
         self._volume_slider.setTickInterval(10)
         volume_layout.addWidget(self._volume_slider)
         self._volume_label = QLabel("50%")
-        self._volume_slider.valueChanged.connect(
-            lambda v: self._volume_label.setText(f"{v}%")
-        )
+        self._volume_slider.valueChanged.connect(lambda v: self._volume_label.setText(f"{v}%"))
         volume_layout.addWidget(self._volume_label)
         feedback_layout.addLayout(volume_layout)
 
@@ -204,12 +202,9 @@ class SettingsWindow(QDialog):
 
         self._model_combo = QComboBox()
         for model_name, info in AVAILABLE_MODELS.items():
-            size_mb = info["size_mb"]
-            speed = info["relative_speed"]
-            suffix = " (English)" if info["english_only"] else ""
+            suffix = " (English)" if info.english_only else ""
             self._model_combo.addItem(
-                f"{model_name}{suffix} - {size_mb}MB, {speed}x speed",
-                model_name
+                f"{model_name}{suffix} - {info.size_mb}MB, {info.relative_speed}x speed", model_name
             )
         model_layout.addRow("Model:", self._model_combo)
 
@@ -224,6 +219,11 @@ class SettingsWindow(QDialog):
         perf_group = QGroupBox("Performance")
         perf_layout = QFormLayout(perf_group)
 
+        self._backend_combo = QComboBox()
+        self._backend_combo.addItem("faster-whisper (recommended)", "faster-whisper")
+        self._backend_combo.addItem("OpenAI Whisper (PyTorch)", "openai")
+        perf_layout.addRow("Engine:", self._backend_combo)
+
         self._device_type_combo = QComboBox()
         self._device_type_combo.addItem("Auto-detect", "auto")
         self._device_type_combo.addItem("GPU (CUDA)", "cuda")
@@ -233,7 +233,9 @@ class SettingsWindow(QDialog):
         self._compute_type_combo = QComboBox()
         self._compute_type_combo.addItem("Auto", "auto")
         self._compute_type_combo.addItem("Float16 (faster GPU)", "float16")
+        self._compute_type_combo.addItem("BFloat16 (Ampere+ GPU)", "bfloat16")
         self._compute_type_combo.addItem("Int8 (smaller, faster CPU)", "int8")
+        self._compute_type_combo.addItem("Int8 + Float16 (smaller GPU)", "int8_float16")
         self._compute_type_combo.addItem("Float32 (highest quality)", "float32")
         perf_layout.addRow("Precision:", self._compute_type_combo)
 
@@ -332,11 +334,11 @@ class SettingsWindow(QDialog):
         self._bg_alpha_slider.setRange(0, 100)
         self._bg_alpha_slider.setValue(int(self._config.ui.waveform_background_alpha / 255 * 100))
         bg_alpha_layout.addWidget(self._bg_alpha_slider)
-        self._bg_alpha_label = QLabel(f"{int(self._config.ui.waveform_background_alpha / 255 * 100)}%")
-        self._bg_alpha_label.setMinimumWidth(40)
-        self._bg_alpha_slider.valueChanged.connect(
-            lambda v: self._bg_alpha_label.setText(f"{v}%")
+        self._bg_alpha_label = QLabel(
+            f"{int(self._config.ui.waveform_background_alpha / 255 * 100)}%"
         )
+        self._bg_alpha_label.setMinimumWidth(40)
+        self._bg_alpha_slider.valueChanged.connect(lambda v: self._bg_alpha_label.setText(f"{v}%"))
         self._bg_alpha_slider.valueChanged.connect(self._update_bg_color_preview)
         bg_alpha_layout.addWidget(self._bg_alpha_label)
         waveform_layout.addRow("Background Transparency:", bg_alpha_layout)
@@ -442,6 +444,7 @@ class SettingsWindow(QDialog):
         # Model
         self._set_combo_by_data(self._model_combo, c.transcription.model_name)
         self._set_combo_by_data(self._language_combo, c.transcription.language)
+        self._set_combo_by_data(self._backend_combo, c.transcription.backend)
         self._set_combo_by_data(self._device_type_combo, c.transcription.device)
         self._set_combo_by_data(self._compute_type_combo, c.transcription.compute_type)
         self._beam_size_spin.setValue(c.transcription.beam_size)
@@ -490,6 +493,7 @@ class SettingsWindow(QDialog):
         # Model
         c.transcription.model_name = self._model_combo.currentData()
         c.transcription.language = self._language_combo.currentData()
+        c.transcription.backend = self._backend_combo.currentData()
         c.transcription.device = self._device_type_combo.currentData()
         c.transcription.compute_type = self._compute_type_combo.currentData()
         c.transcription.beam_size = self._beam_size_spin.value()
@@ -625,7 +629,7 @@ class SettingsWindow(QDialog):
         if self._config.hotkey.activation_key != old_hotkey:
             self.hotkey_changed.emit(self._config.hotkey.activation_key)
 
-        self.settings_changed.emit()
+        self.settings_changed.emit(self._config)
 
     def _ok_clicked(self) -> None:
         """Apply settings and close."""
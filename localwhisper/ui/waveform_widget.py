@@ -54,14 +54,16 @@ class WaveformCanvas(QWidget):
         self._accent_color = QColor(accent_color)
         self._background_color = QColor(background_color)
         self._sample_count = sample_count
-        
+        self._line_thickness = 2
+        self._sensitivity = 2.5
+
         # Store waveform samples (0.0-1.0, 0.5 is center/silence)
         self._samples: List[float] = [0.5] * sample_count
-        
+
         # Current amplitude for wave generation
         self._current_amplitude: float = 0.0
         self._target_amplitude: float = 0.0
-        
+
         # Phase for continuous sine wave generation
         self._phase: float = 0.0
 
@@ -82,14 +84,29 @@ class WaveformCanvas(QWidget):
         self._background_color = QColor(color)
         self.update()
 
+    def apply_settings(self, settings: UISettings, accent_color: Optional[str] = None) -> None:
+        """
+        Apply all appearance settings with a single repaint.
+
+        Args:
+            settings: UI settings to apply
+            accent_color: Line color override (defaults to the settings accent color)
+        """
+        self._accent_color = QColor(accent_color or settings.accent_color)
+        self._background_color = QColor(settings.waveform_background_color)
+        self._background_color.setAlpha(max(0, min(255, settings.waveform_background_alpha)))
+        self._line_thickness = max(1, settings.waveform_line_thickness)
+        self._sensitivity = settings.waveform_sensitivity
+        self.update()
+
     def add_amplitude(self, amplitude: float) -> None:
         """
         Update the target amplitude for the waveform.
-        
+
         The waveform continuously oscillates with amplitude controlling the wave height.
         """
         # Normalize and clamp amplitude, with some scaling for visibility
-        self._target_amplitude = max(0.0, min(1.0, amplitude * 2.5))
+        self._target_amplitude = max(0.0, min(1.0, amplitude * self._sensitivity))
 
     def clear(self) -> None:
         """Clear the waveform to flat center line."""
@@ -104,35 +121,36 @@ class WaveformCanvas(QWidget):
         # Smoothly interpolate towards target amplitude
         smoothing = 0.15
         self._current_amplitude += (self._target_amplitude - self._current_amplitude) * smoothing
-        
+
         # Decay target amplitude over time (audio callbacks will refresh it)
         self._target_amplitude *= 0.95
-        
+
         # Generate new samples for the wave
         # Shift all samples left and add new ones on the right
         samples_per_frame = 4  # How many new samples to add per animation frame
-        
+
+        # Loop invariants, hoisted out of the per-sample loop:
+        # vary frequency slightly based on amplitude for more organic look,
+        # and scale by amplitude (max displacement of 0.45 from center)
+        # with the 1/1.45 harmonic normalization folded in
+        freq_multiplier = 0.25 + self._current_amplitude * 0.15
+        scale = self._current_amplitude * (0.45 / 1.45)
+        phase = self._phase
+        samples = self._samples
+        sin = math.sin
+
         for _ in range(samples_per_frame):
             # Advance phase for sine wave
-            # Vary frequency slightly based on amplitude for more organic look
-            freq_multiplier = 0.25 + self._current_amplitude * 0.15
-            self._phase += freq_multiplier
-            
-            # Calculate displacement using sine wave modulated by amplitude
-            # Add some harmonics for richer wave shape
-            wave = math.sin(self._phase)
-            wave += 0.3 * math.sin(self._phase * 2.1)  # Add harmonic
-            wave += 0.15 * math.sin(self._phase * 3.2)  # Add another harmonic
-            wave = wave / 1.45  # Normalize
-            
-            # Scale by amplitude (max displacement of 0.45 from center)
-            displacement = self._current_amplitude * 0.45 * wave
-            sample = 0.5 + displacement
-            
+            phase += freq_multiplier
+
+            # Sine wave with two harmonics for a richer wave shape
+            wave = sin(phase) + 0.3 * sin(phase * 2.1) + 0.15 * sin(phase * 3.2)
+
             # Shift samples left and add new one
-            self._samples.pop(0)
-            self._samples.append(sample)
-        
+            samples.pop(0)
+            samples.append(0.5 + scale * wave)
+
+        self._phase = phase
         self.update()
 
     def paintEvent(self, event) -> None:
@@ -148,7 +166,7 @@ class WaveformCanvas(QWidget):
 
         # Set up pen for the waveform line
         pen = QPen(self._accent_color)
-        pen.setWidth(2)
+        pen.setWidth(self._line_thickness)
         painter.setPen(pen)
 
         # Calculate slice width (how much x-space each sample takes)
@@ -156,12 +174,12 @@ class WaveformCanvas(QWidget):
 
         # Build the path through all samples
         path = QPainterPath()
-        
+
         for i, sample in enumerate(self._samples):
             x = i * slice_width
             # Sample is 0.0-1.0, convert to y coordinate (inverted: 0=top, 1=bottom)
             y = sample * height
-            
+
             if i == 0:
                 path.moveTo(x, y)
             else:
@@ -210,7 +228,7 @@ class WaveformWidget(QWidget):
     def _setup_ui(self) -> None:
         """Set up the widget UI."""
         layout = QVBoxLayout(self)
-        
+
         # Adjust margins based on whether status text is shown
         if self.settings.show_status_text:
             layout.setContentsMargins(16, 12, 16, 12)
@@ -226,21 +244,28 @@ class WaveformWidget(QWidget):
             background_color=self.settings.waveform_background_color,
             sample_count=256,
         )
+        self._canvas.apply_settings(self.settings)
         layout.addWidget(self._canvas)
 
         # Status label (only show if enabled in settings)
         self._status_label = QLabel()
         self._status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._status_label.setFont(QFont("Segoe UI", 10))
-        
+
         if self.settings.show_status_text:
             layout.addWidget(self._status_label)
             self._update_status_display()
+        else:
+            self._status_label.hide()
+        self._update_size()
+
+    def _update_size(self) -> None:
+        """Size the widget from the waveform dimensions in settings."""
+        if self.settings.show_status_text:
             # Fixed size with status text
             self.setFixedSize(self.settings.waveform_width, self.settings.waveform_height + 30)
         else:
             # Compact size without status text
-            self._status_label.hide()
             self.setFixedSize(self.settings.waveform_width, self.settings.waveform_height)
 
     def _apply_style(self) -> None:
@@ -302,13 +327,13 @@ class WaveformWidget(QWidget):
         """Update the status label."""
         icon = ""
         if self._state == self.STATE_LISTENING:
-            icon = "\U0001F3A4"  # Microphone emoji
+            icon = "\U0001f3a4"  # Microphone emoji
         elif self._state == self.STATE_PROCESSING:
-            icon = "\u23F3"  # Hourglass
+            icon = "\u23f3"  # Hourglass
         elif self._state == self.STATE_SUCCESS:
             icon = "\u2713"  # Check mark
         elif self._state == self.STATE_ERROR:
-            icon = "\u26A0"  # Warning
+            icon = "\u26a0"  # Warning
 
         self._status_label.setText(f"{icon} {self._status_text}")
 
@@ -330,6 +355,22 @@ class WaveformWidget(QWidget):
         self.settings.waveform_background_color = color
         self._canvas.set_background_color(color)
 
+    def apply_ui_settings(self, ui: UISettings) -> None:
+        """
+        Apply new UI settings to the widget and its canvas in one pass.
+
+        Args:
+            ui: UI settings to apply
+        """
+        self.settings = ui
+        accent_color = None
+        if self._state == self.STATE_ERROR:
+            accent_color = "#EF4444"
+        elif self._state == self.STATE_SUCCESS:
+            accent_color = "#10B981"
+        self._canvas.apply_settings(ui, accent_color)
+        self._update_size()
+
     def mousePressEvent(self, event) -> None:
         """Handle mouse press."""
         self.clicked.emit()
@@ -371,15 +412,12 @@ class WaveformOverlay(QWidget):
     def _update_window_flags(self) -> None:
         """Update window flags based on always-on-top setting."""
         base_flags = (
-            Qt.WindowType.FramelessWindowHint |
-            Qt.WindowType.Tool |
-            Qt.WindowType.WindowDoesNotAcceptFocus
+            Qt.WindowType.FramelessWindowHint
+            | Qt.WindowType.Tool
+            | Qt.WindowType.WindowDoesNotAcceptFocus
         )
         if self._always_on_top:
-            self.setWindowFlags(
-                base_flags |
-                Qt.WindowType.WindowStaysOnTopHint
-            )
+            self.setWindowFlags(base_flags | Qt.WindowType.WindowStaysOnTopHint)
         else:
             self.setWindowFlags(base_flags)
 
@@ -408,12 +446,16 @@ class WaveformOverlay(QWidget):
         shadow.setOffset(0, 4)
         self._waveform.setGraphicsEffect(shadow)
 
+        self._update_size()
+
+    def _update_size(self) -> None:
+        """Size the overlay around the waveform widget."""
         # Size based on waveform widget and status text setting
         if self.settings.show_status_text:
             height_extra = 50  # Extra height for status text and shadow
         else:
             height_extra = 20  # Compact height without status text
-            
+
         self.setFixedSize(
             self.settings.waveform_width + 40,  # Extra for shadow
             self.settings.waveform_height + height_extra,
@@ -439,7 +481,9 @@ class WaveformOverlay(QWidget):
             screen_geometry = screen.availableGeometry()
             x = screen_geometry.x() + (screen_geometry.width() - self.width()) // 2
             # Position right at the bottom of available screen area (just above taskbar)
-            y = screen_geometry.y() + screen_geometry.height() - self.height() - 5  # 5px margin from taskbar
+            y = (
+                screen_geometry.y() + screen_geometry.height() - self.height() - 5
+            )  # 5px margin from taskbar
             self.move(x, y)
 
     def _ensure_on_top(self) -> None:
@@ -451,7 +495,7 @@ class WaveformOverlay(QWidget):
         """Show the overlay with animation."""
         # Stop any ongoing hide animation
         self._fade_out_animation.stop()
-        
+
         self._position_at_bottom_center()
         self._waveform.set_state(WaveformWidget.STATE_LISTENING)
         self._waveform.clear_waveform()
@@ -485,7 +529,7 @@ class WaveformOverlay(QWidget):
         """Perform the hide animation."""
         # Stop the stay-on-top timer
         self._stay_on_top_timer.stop()
-        
+
         # Stop any ongoing show animation
         self._fade_in_animation.stop()
 
@@ -519,6 +563,21 @@ class WaveformOverlay(QWidget):
         """Set the waveform background color."""
         self._waveform.set_background_color(color)
 
+    def apply_ui_settings(self, ui: UISettings) -> None:
+        """
+        Apply new UI settings with a single repaint.
+
+        Updates every appearance field before invalidating, instead of
+        repainting once per individual setter.
+
+        Args:
+            ui: UI settings to apply
+        """
+        self.settings = ui
+        self._waveform.apply_ui_settings(ui)
+        self._update_size()
+        self.set_always_on_top(ui.waveform_always_on_top)
+
     @property
     def waveform(self) -> WaveformWidget:
         """Get the waveform widget."""